@@ -4,18 +4,30 @@ MFCC-based Similarity Algorithm
 MFCC (Mel-Frequency Cepstral Coefficients) 특징을 사용한 유사도 검출 알고리즘입니다.
 """
 
-from typing import List, Optional
+from pathlib import Path
+from typing import List, Optional, Union
 import numpy as np
 import librosa
+import soundfile as sf
 from scipy.spatial.distance import euclidean, cosine
 from scipy.signal import correlate
 from tqdm import tqdm
 
 from algorithms.base import BaseSimilarityAlgorithm, SimilarityMatch
+from algorithms.traditional.mfcc_numba import (
+    analysis_window,
+    batch_frame_distances,
+    batch_mfcc,
+    mel_filterbank,
+    quantize_features,
+)
 from utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# 배치 MFCC 한 번에 프레이밍할 최대 샘플 수 (윈도우 수 x 프레임 수 x n_fft)
+_BATCH_FRAME_SAMPLES = 1 << 22
+
 
 class MFCCSimilarity(BaseSimilarityAlgorithm):
     """
@@ -29,11 +41,15 @@ class MFCCSimilarity(BaseSimilarityAlgorithm):
         n_mfcc: int = 13,
         n_fft: int = 2048,
         hop_length: int = 512,
+        win_length: Optional[int] = None,
         window: str = 'hann',
         distance_metric: str = 'euclidean',
         use_dtw: bool = False,
         use_delta: bool = False,
         use_delta_delta: bool = False,
+        chunk_seconds: Optional[float] = 30.0,
+        feature_cache=None,
+        quantize_cache: bool = True,
         **kwargs
     ):
         """
@@ -43,11 +59,16 @@ class MFCCSimilarity(BaseSimilarityAlgorithm):
             n_mfcc: MFCC 계수 개수
             n_fft: FFT 윈도우 크기
             hop_length: 홉 길이
+            win_length: 윈도우 길이 (n_fft보다 짧으면 0으로 채워 n_fft 크기 FFT 수행,
+                None이면 n_fft, 예: win_length=400, n_fft=512)
             window: 윈도우 함수
             distance_metric: 거리 메트릭 ('euclidean', 'cosine', 'correlation')
             use_dtw: DTW (Dynamic Time Warping) 사용 여부
             use_delta: Delta MFCC 사용 여부
             use_delta_delta: Delta-Delta MFCC 사용 여부
+            chunk_seconds: 이보다 긴 오디오는 청크 단위로 STFT 계산 (None이면 사용 안 함)
+            feature_cache: 소스 윈도우 MFCC 디스크 캐시 (core.synthesis.cache.FeatureCache)
+            quantize_cache: 캐시 특징을 계수별 스케일의 int8로 저장 (False면 float16)
             **kwargs: 기본 클래스 파라미터
         """
         super().__init__(**kwargs)
@@ -55,11 +76,15 @@ class MFCCSimilarity(BaseSimilarityAlgorithm):
         self.n_mfcc = n_mfcc
         self.n_fft = n_fft
         self.hop_length = hop_length
+        self.win_length = win_length or n_fft
         self.window = window
         self.distance_metric = distance_metric
         self.use_dtw = use_dtw
         self.use_delta = use_delta
         self.use_delta_delta = use_delta_delta
+        self.chunk_seconds = chunk_seconds
+        self.feature_cache = feature_cache
+        self.quantize_cache = quantize_cache
 
         logger.info(
             f"MFCCSimilarity 초기화: n_mfcc={n_mfcc}, "
@@ -82,14 +107,12 @@ class MFCCSimilarity(BaseSimilarityAlgorithm):
             np.ndarray: MFCC 특징 (shape: (n_features, n_frames))
         """
         # MFCC 추출
-        mfcc = librosa.feature.mfcc(
-            y=audio,
-            sr=sr,
-            n_mfcc=self.n_mfcc,
-            n_fft=self.n_fft,
-            hop_length=self.hop_length,
-            window=self.window,
-        )
+        chunk_frames = self._chunk_frames(sr)
+        if audio.ndim == 1 and chunk_frames and len(audio) > chunk_frames * self.hop_length:
+            mfcc = self._extract_mfcc_chunked(audio, sr, chunk_frames)
+        else:
+            mel = self._melspectrogram(audio, sr)
+            mfcc = librosa.feature.mfcc(S=librosa.power_to_db(mel), n_mfcc=self.n_mfcc)
 
         features = [mfcc]
 
@@ -108,6 +131,80 @@ class MFCCSimilarity(BaseSimilarityAlgorithm):
 
         return combined_features
 
+    def _melspectrogram(self, audio: np.ndarray, sr: int, center: bool = True) -> np.ndarray:
+        """
+        멜 파워 스펙트로그램을 계산합니다 (librosa.feature.melspectrogram과 동일).
+
+        분석 윈도우와 멜 필터뱅크는 모듈 수준 캐시에서 가져오므로 호출마다
+        다시 만들지 않습니다.
+
+        Args:
+            audio: 오디오 데이터
+            sr: 샘플링 레이트
+            center: 프레임을 가운데 정렬(0 패딩)할지 여부
+
+        Returns:
+            np.ndarray: 멜 스펙트로그램 (shape: (..., n_mels, n_frames))
+        """
+        spectrum = librosa.stft(
+            audio,
+            n_fft=self.n_fft,
+            hop_length=self.hop_length,
+            window=analysis_window(self.window, self.win_length, self.n_fft),
+            center=center,
+            pad_mode="constant",
+        )
+        power = np.abs(spectrum) ** 2
+        return np.einsum("...ft,fm->...mt", power, mel_filterbank(sr, self.n_fft), optimize=True)
+
+    def _chunk_frames(self, sr: int) -> int:
+        """청크당 프레임 수 (0이면 청크 처리 안 함)"""
+        if not self.chunk_seconds:
+            return 0
+        return max(1, int(self.chunk_seconds * sr) // self.hop_length)
+
+    def _extract_mfcc_chunked(
+        self,
+        audio: np.ndarray,
+        sr: int,
+        chunk_frames: int,
+    ) -> np.ndarray:
+        """
+        긴 오디오의 MFCC를 청크 단위로 추출합니다.
+
+        각 청크는 앞뒤로 n_fft/2 샘플씩 겹치게 잘라 center=False로 계산하므로
+        프레임 경계가 전체 계산(center=True)과 같습니다. 전체 STFT 대신 청크별
+        멜 스펙트로그램만 이어 붙이고, dB 변환(top_db 기준)과 DCT는 전체에 대해
+        한 번 수행하므로 결과는 librosa.feature.mfcc와 동일합니다.
+
+        Args:
+            audio: 1차원 오디오 데이터
+            sr: 샘플링 레이트
+            chunk_frames: 청크당 프레임 수
+
+        Returns:
+            np.ndarray: MFCC (shape: (n_mfcc, n_frames))
+        """
+        n_samples = len(audio)
+        pad = self.n_fft // 2
+        n_frames = 1 + n_samples // self.hop_length
+
+        mel_chunks = []
+        for f0 in range(0, n_frames, chunk_frames):
+            f1 = min(f0 + chunk_frames, n_frames)
+            start = f0 * self.hop_length - pad
+            end = (f1 - 1) * self.hop_length - pad + self.n_fft
+
+            segment = audio[max(start, 0):min(end, n_samples)]
+            if start < 0 or end > n_samples:
+                # 가장자리는 center=True의 상수(0) 패딩과 동일하게 채움
+                segment = np.pad(segment, (max(0, -start), max(0, end - n_samples)))
+
+            mel_chunks.append(self._melspectrogram(segment, sr, center=False))
+
+        mel = np.concatenate(mel_chunks, axis=1)
+        return librosa.feature.mfcc(S=librosa.power_to_db(mel), n_mfcc=self.n_mfcc)
+
     def _compute_distance(
         self,
         feat1: np.ndarray,
@@ -191,6 +288,260 @@ class MFCCSimilarity(BaseSimilarityAlgorithm):
 
         return dtw_matrix[n, m] / (n + m)  # Normalize by path length
 
+    def _window_distances(
+        self,
+        target_mfcc: np.ndarray,
+        source_audio: np.ndarray,
+        source_sr: int,
+        window_samples: int,
+        step_samples: int,
+    ) -> List[float]:
+        """
+        슬라이딩 윈도우마다 타겟 MFCC와의 거리를 계산합니다.
+
+        Args:
+            target_mfcc: 타겟 MFCC 특징
+            source_audio: 소스 오디오 데이터
+            source_sr: 소스 샘플링 레이트
+            window_samples: 윈도우 길이 (샘플)
+            step_samples: 윈도우 간격 (샘플)
+
+        Returns:
+            List[float]: 윈도우 순서대로의 거리 값
+        """
+        if self._supports_batch() and source_audio.ndim == 1:
+            distances = []
+            for window_mfcc in self._window_mfcc_batches(
+                source_audio, source_sr, window_samples, step_samples
+            ):
+                distances.extend(
+                    batch_frame_distances(target_mfcc, window_mfcc, self.distance_metric).tolist()
+                )
+            return distances
+
+        num_windows = (len(source_audio) - window_samples) // step_samples + 1
+
+        distances = []
+        for i in tqdm(range(num_windows), desc="Searching segments", disable=num_windows < 10):
+            start_sample = i * step_samples
+            end_sample = start_sample + window_samples
+
+            if end_sample > len(source_audio):
+                break
+
+            # 현재 윈도우 MFCC 추출
+            window_mfcc = self._extract_mfcc(source_audio[start_sample:end_sample], source_sr)
+
+            distances.append(self._compute_distance(target_mfcc, window_mfcc))
+
+        return distances
+
+    def _supports_batch(self) -> bool:
+        """배치 MFCC 경로 사용 가능 여부 (Delta/DTW/correlation은 윈도우별 계산)"""
+        return (
+            not (self.use_dtw or self.use_delta or self.use_delta_delta)
+            and self.distance_metric in ("euclidean", "cosine")
+        )
+
+    def _window_batch_size(self, window_samples: int) -> int:
+        """배치 MFCC 한 묶음의 윈도우 개수 (프레이밍 메모리가 _BATCH_FRAME_SAMPLES 이내)"""
+        n_frames = 1 + window_samples // self.hop_length
+        return max(1, _BATCH_FRAME_SAMPLES // (n_frames * self.n_fft))
+
+    def _window_mfcc_batches(
+        self,
+        source_audio: np.ndarray,
+        source_sr: int,
+        window_samples: int,
+        step_samples: int,
+    ):
+        """
+        슬라이딩 윈도우 MFCC를 메모리 한도 안의 묶음으로 생성합니다.
+
+        Args:
+            source_audio: 1차원 소스 오디오 데이터
+            source_sr: 소스 샘플링 레이트
+            window_samples: 윈도우 길이 (샘플)
+            step_samples: 윈도우 간격 (샘플)
+
+        Yields:
+            np.ndarray: (batch, n_mfcc, n_frames) MFCC
+        """
+        if len(source_audio) < window_samples:
+            return
+
+        # 복사 없는 윈도우 뷰 (묶음 단위로만 프레이밍)
+        windows = np.lib.stride_tricks.sliding_window_view(source_audio, window_samples)
+        windows = windows[::step_samples]
+
+        batch_size = self._window_batch_size(window_samples)
+
+        for start in range(0, len(windows), batch_size):
+            yield batch_mfcc(
+                windows[start:start + batch_size],
+                source_sr,
+                n_mfcc=self.n_mfcc,
+                n_fft=self.n_fft,
+                hop_length=self.hop_length,
+                win_length=self.win_length,
+                window=self.window,
+            )
+
+    def _file_blocks(
+        self,
+        sound_file: sf.SoundFile,
+        window_samples: int,
+        step_samples: int,
+    ):
+        """
+        슬라이딩 윈도우 묶음 단위로 소스 파일을 읽습니다.
+
+        블록은 윈도우 batch_size개를 담고 다음 블록과 (윈도우 - 간격)만큼 겹치므로,
+        블록별 윈도우를 이어 붙이면 파일 전체의 슬라이딩 윈도우와 같습니다.
+
+        Args:
+            sound_file: 모노 소스 파일
+            window_samples: 윈도우 길이 (샘플)
+            step_samples: 윈도우 간격 (샘플)
+
+        Yields:
+            np.ndarray: 1차원 float32 블록 (윈도우 하나 이상)
+        """
+        batch_size = self._window_batch_size(window_samples)
+        blocksize = (batch_size - 1) * step_samples + window_samples
+
+        for block in sound_file.blocks(
+            blocksize=blocksize,
+            overlap=window_samples - step_samples,
+            dtype="float32",
+        ):
+            if len(block) >= window_samples:
+                yield block
+
+    def _cache_params(self, source_sr: int, window_samples: int, step_samples: int) -> str:
+        """윈도우 MFCC 캐시 키에 들어가는 파라미터 문자열"""
+        return (
+            f"{self.n_mfcc}|{self.n_fft}|{self.win_length}|{self.hop_length}|{self.window}|"
+            f"{self.use_delta}|{self.use_delta_delta}|"
+            f"{source_sr}|{window_samples}|{step_samples}"
+        )
+
+    def _cached_window_distances(
+        self,
+        target_mfcc: np.ndarray,
+        source_file: Union[str, Path],
+        source_audio: np.ndarray,
+        source_sr: int,
+        window_samples: int,
+        step_samples: int,
+    ) -> List[float]:
+        """
+        캐시된 윈도우 MFCC로 거리를 계산합니다.
+
+        윈도우 MFCC는 타겟과 무관하게 (파일, 윈도우 크기, 간격)으로 정해지므로
+        같은 소스를 다시 검색할 때는 추출을 건너뜁니다.
+
+        Args:
+            target_mfcc: 타겟 MFCC 특징
+            source_file: 소스 파일 경로 (캐시 키)
+            source_audio: 소스 오디오 데이터 (캐시 미스 시 사용)
+            source_sr: 소스 샘플링 레이트
+            window_samples: 윈도우 길이 (샘플)
+            step_samples: 윈도우 간격 (샘플)
+
+        Returns:
+            List[float]: 윈도우 순서대로의 거리 값
+        """
+        params = self._cache_params(source_sr, window_samples, step_samples)
+
+        use_batch = self._supports_batch() and source_audio.ndim == 1
+
+        def extract():
+            if use_batch:
+                batches = list(self._window_mfcc_batches(
+                    source_audio, source_sr, window_samples, step_samples
+                ))
+                return np.concatenate(batches) if batches else []
+
+            num_windows = max(0, (len(source_audio) - window_samples) // step_samples + 1)
+            return [
+                self._extract_mfcc(source_audio[start:start + window_samples], source_sr)
+                for start in range(0, num_windows * step_samples, step_samples)
+            ]
+
+        window_features, scale = self._load_window_features(source_file, params, extract)
+
+        return self._stack_distances(target_mfcc, window_features, scale, use_batch)
+
+    def _load_window_features(self, source_file: Union[str, Path], params: str, extract) -> tuple:
+        """
+        캐시된 윈도우 MFCC 스택을 반환합니다 (없으면 extract()로 추출해 저장).
+
+        quantize_cache면 특징 계수별 스케일의 int8로 저장하므로 float16보다
+        디스크/메모리 사용량과 거리 계산 시 읽는 양이 절반입니다.
+
+        Args:
+            source_file: 소스 파일 경로 (캐시 키)
+            params: 캐시 파라미터 문자열
+            extract: (n_windows, n_features, n_frames) 특징을 반환하는 함수
+
+        Returns:
+            (윈도우 특징, 계수별 스케일) 튜플 (float16 캐시면 스케일은 None)
+        """
+        if not self.quantize_cache:
+            window_features = self.feature_cache.get(source_file, params)
+            if window_features is None:
+                window_features = self.feature_cache.put(source_file, params, extract())
+            return window_features, None
+
+        params = f"{params}|int8"
+        window_features = self.feature_cache.get(source_file, params)
+        scale = self.feature_cache.get(source_file, f"{params}|scale")
+        if window_features is None or scale is None:
+            q, scale = quantize_features(extract())
+            window_features = self.feature_cache.put(source_file, params, q, dtype=np.int8)
+            scale = self.feature_cache.put(
+                source_file, f"{params}|scale", scale, dtype=np.float32
+            )
+
+        return window_features, np.asarray(scale)
+
+    def _stack_distances(
+        self,
+        target_mfcc: np.ndarray,
+        window_features: np.ndarray,
+        scale: Optional[np.ndarray],
+        use_batch: bool,
+    ) -> List[float]:
+        """
+        캐시된 윈도우 MFCC 스택과 타겟 MFCC의 거리를 계산합니다.
+
+        Args:
+            target_mfcc: 타겟 MFCC 특징
+            window_features: (n_windows, n_features, n_frames) 캐시 특징
+            scale: int8 특징의 계수별 스케일 (float16 캐시면 None)
+            use_batch: 배치 거리 커널 사용 여부
+
+        Returns:
+            List[float]: 윈도우 순서대로의 거리 값
+        """
+        if not len(window_features):
+            return []
+
+        if use_batch:
+            return batch_frame_distances(
+                target_mfcc, window_features, self.distance_metric, scale=scale
+            ).tolist()
+
+        # 캐시는 float16/int8이므로 윈도우 단위로만 float32로 복원
+        distances = []
+        for window_mfcc in window_features:
+            window_mfcc = np.asarray(window_mfcc, dtype=np.float32)
+            if scale is not None:
+                window_mfcc *= scale[:, None]
+            distances.append(self._compute_distance(target_mfcc, window_mfcc))
+        return distances
+
     def compute_similarity(
         self,
         target_audio: np.ndarray,
@@ -237,6 +588,7 @@ class MFCCSimilarity(BaseSimilarityAlgorithm):
         target_sr: int,
         source_sr: int,
         top_k: int = 10,
+        source_file: Optional[Union[str, Path]] = None,
     ) -> List[SimilarityMatch]:
         """
         타겟 오디오와 유사한 소스 오디오의 세그먼트를 찾습니다.
@@ -249,6 +601,7 @@ class MFCCSimilarity(BaseSimilarityAlgorithm):
             target_sr: 타겟 샘플링 레이트
             source_sr: 소스 샘플링 레이트
             top_k: 반환할 최대 매치 수
+            source_file: 소스 파일 경로 (feature_cache 사용 시 캐시 키)
 
         Returns:
             List[SimilarityMatch]: 유사 세그먼트 리스트
@@ -258,6 +611,126 @@ class MFCCSimilarity(BaseSimilarityAlgorithm):
 
         logger.info("유사 세그먼트 검색 시작...")
 
+        target_mfcc, target_duration, window_samples, step_samples = self._prepare_search(
+            target_audio, target_sr, source_sr
+        )
+
+        # 슬라이딩 윈도우별 거리 계산
+        if self.feature_cache is not None and source_file is not None:
+            distances = self._cached_window_distances(
+                target_mfcc, source_file, source_audio, source_sr, window_samples, step_samples
+            )
+        else:
+            distances = self._window_distances(
+                target_mfcc, source_audio, source_sr, window_samples, step_samples
+            )
+
+        return self._collect_matches(
+            distances, target_duration, source_sr, window_samples, step_samples, top_k
+        )
+
+    def find_similar_segments_in_file(
+        self,
+        target_audio: np.ndarray,
+        target_sr: int,
+        source_file: Union[str, Path],
+        top_k: int = 10,
+    ) -> List[SimilarityMatch]:
+        """
+        소스 파일을 블록 단위로 읽으면서 유사 세그먼트를 찾습니다.
+
+        모노 파일이고 배치 경로를 사용할 수 있으면 파일 전체를 메모리에 올리지 않고
+        윈도우 묶음 크기의 블록만 읽습니다. 그 외에는 파일 전체를 읽어
+        find_similar_segments로 검색합니다. 결과는 find_similar_segments와 같습니다.
+
+        Args:
+            target_audio: 타겟 오디오 데이터
+            target_sr: 타겟 샘플링 레이트
+            source_file: 소스 오디오 파일 경로
+            top_k: 반환할 최대 매치 수
+
+        Returns:
+            List[SimilarityMatch]: 유사 세그먼트 리스트
+        """
+        cache_file = source_file if self.feature_cache is not None else None
+
+        try:
+            sound_file = sf.SoundFile(str(source_file))
+        except RuntimeError:
+            # soundfile로 열 수 없는 형식은 librosa로 전체 로드 (AudioFile.load와 동일)
+            source_audio, source_sr = librosa.load(
+                str(source_file), sr=None, mono=False, dtype=np.float32
+            )
+            return self.find_similar_segments(
+                target_audio, source_audio, target_sr, source_sr, top_k, source_file=cache_file
+            )
+
+        with sound_file:
+            source_sr = sound_file.samplerate
+
+            if sound_file.channels != 1 or not self._supports_batch():
+                # (채널, 샘플) 배열로 전체를 읽어 일반 검색 사용
+                source_audio = sound_file.read(dtype="float32", always_2d=False)
+                return self.find_similar_segments(
+                    target_audio, np.ascontiguousarray(source_audio.T), target_sr, source_sr,
+                    top_k, source_file=cache_file,
+                )
+
+            self._validate_audio(target_audio, target_sr, "target_audio")
+
+            duration = sound_file.frames / source_sr
+            if duration < self.segment_min_length:
+                raise ValueError(
+                    f"source_audio의 길이({duration:.2f}초)가 "
+                    f"최소 세그먼트 길이({self.segment_min_length}초)보다 짧습니다."
+                )
+
+            logger.info("유사 세그먼트 검색 시작 (블록 단위 읽기)...")
+
+            target_mfcc, target_duration, window_samples, step_samples = self._prepare_search(
+                target_audio, target_sr, source_sr
+            )
+            blocks = self._file_blocks(sound_file, window_samples, step_samples)
+
+            if self.feature_cache is None:
+                distances = []
+                for block in blocks:
+                    distances.extend(self._window_distances(
+                        target_mfcc, block, source_sr, window_samples, step_samples
+                    ))
+            else:
+                def extract():
+                    batches = [
+                        window_mfcc
+                        for block in blocks
+                        for window_mfcc in self._window_mfcc_batches(
+                            block, source_sr, window_samples, step_samples
+                        )
+                    ]
+                    return np.concatenate(batches) if batches else []
+
+                window_features, scale = self._load_window_features(
+                    source_file, self._cache_params(source_sr, window_samples, step_samples),
+                    extract,
+                )
+                distances = self._stack_distances(target_mfcc, window_features, scale, True)
+
+        return self._collect_matches(
+            distances, target_duration, source_sr, window_samples, step_samples, top_k
+        )
+
+    def _prepare_search(
+        self,
+        target_audio: np.ndarray,
+        target_sr: int,
+        source_sr: int,
+    ) -> tuple:
+        """
+        타겟 MFCC와 슬라이딩 윈도우 크기를 계산합니다.
+
+        Returns:
+            (target_mfcc, target_duration, window_samples, step_samples) 튜플
+        """
         # 타겟 오디오 전체의 MFCC 추출
         target_mfcc = self._extract_mfcc(target_audio, target_sr)
         target_duration = len(target_audio) / target_sr
@@ -270,26 +743,30 @@ class MFCCSimilarity(BaseSimilarityAlgorithm):
         # 슬라이딩 윈도우 스텝 (50% 오버랩)
         step_samples = window_samples // 2
 
-        matches = []
+        return target_mfcc, target_duration, window_samples, step_samples
 
-        # 슬라이딩 윈도우로 소스 오디오 탐색
-        num_windows = (len(source_audio) - window_samples) // step_samples + 1
+    def _collect_matches(
+        self,
+        distances: List[float],
+        target_duration: float,
+        source_sr: int,
+        window_samples: int,
+        step_samples: int,
+        top_k: int,
+    ) -> List[SimilarityMatch]:
+        """
+        윈도우별 거리를 임계값 이상의 매치로 변환해 상위 top_k개를 반환합니다.
 
-        for i in tqdm(range(num_windows), desc="Searching segments", disable=num_windows < 10):
+        Returns:
+            List[SimilarityMatch]: 유사 세그먼트 리스트
+        """
+        matches = []
+
+        for i, distance in enumerate(distances):
             start_sample = i * step_samples
             end_sample = start_sample + window_samples
 
-            if end_sample > len(source_audio):
-                break
-
-            # 현재 윈도우 추출
-            window_audio = source_audio[start_sample:end_sample]
-
-            # MFCC 추출
-            window_mfcc = self._extract_mfcc(window_audio, source_sr)
-
             # 유사도 계산
-            distance = self._compute_distance(target_mfcc, window_mfcc)
             similarity = 1.0 / (1.0 + distance)
 
             # 매치 생성
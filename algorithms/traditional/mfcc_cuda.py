@@ -0,0 +1,215 @@
+"""
+Batched MFCC Similarity (GPU)
+
+PyTorch를 사용해 슬라이딩 윈도우 MFCC를 배치로 계산하는 유사도 알고리즘입니다.
+"""
+
+from typing import List, Optional
+
+import numpy as np
+import scipy.fft
+
+# torch는 선택적 의존성 (GPU 배치 MFCC 사용 시에만 필요)
+try:
+    import torch
+    TORCH_AVAILABLE = True
+except ImportError:
+    torch = None
+    TORCH_AVAILABLE = False
+
+from algorithms.traditional.mfcc import MFCCSimilarity
+from algorithms.traditional.mfcc_numba import analysis_window, mel_filterbank
+from utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def is_cuda_available() -> bool:
+    """
+    CUDA 사용 가능 여부를 반환합니다.
+
+    Returns:
+        bool: torch가 설치되어 있고 CUDA 장치가 있으면 True
+    """
+    return TORCH_AVAILABLE and torch.cuda.is_available()
+
+
+class CudaBatchedMFCCSimilarity(MFCCSimilarity):
+    """
+    배치 MFCC 유사도 알고리즘 (GPU).
+
+    소스 오디오의 슬라이딩 윈도우를 batch_size개씩 묶어 한 번에 MFCC와 거리를
+    계산합니다. 프레이밍, rfft, 멜 필터 행렬곱, DCT 행렬곱을 모두 텐서 연산으로
+    처리하므로 GPU에서는 cuFFT/cuBLAS가 사용되며, 결과는 librosa.feature.mfcc와
+    같습니다.
+
+    Delta 특징, DTW, correlation 거리는 배치 경로에서 지원하지 않으므로
+    이 옵션을 사용하면 MFCCSimilarity의 CPU 구현으로 처리합니다.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 256,
+        device: Optional[str] = None,
+        **kwargs
+    ):
+        """
+        CudaBatchedMFCCSimilarity를 초기화합니다.
+
+        Args:
+            batch_size: 한 번에 처리할 윈도우 개수
+            device: 연산 장치 ('cuda', 'cpu', None이면 자동 선택)
+            **kwargs: MFCCSimilarity 파라미터
+
+        Raises:
+            ImportError: torch가 설치되지 않은 경우
+        """
+        if not TORCH_AVAILABLE:
+            raise ImportError("CudaBatchedMFCCSimilarity를 사용하려면 torch가 필요합니다")
+
+        super().__init__(**kwargs)
+
+        self.batch_size = batch_size
+        self.device = torch.device(device or ("cuda" if torch.cuda.is_available() else "cpu"))
+
+        window = analysis_window(self.window, self.win_length, self.n_fft)
+        self._window_tensor = torch.as_tensor(window.copy(), device=self.device)
+        self._mel_bases = {}  # 샘플링 레이트별 멜 필터뱅크
+        self._dct_matrix = None
+
+        logger.info(
+            f"CudaBatchedMFCCSimilarity 초기화: device={self.device}, batch_size={batch_size}"
+        )
+
+    def _mel_basis(self, sr: int) -> "torch.Tensor":
+        """멜 필터뱅크 (librosa.feature.mfcc 기본값과 동일)"""
+        basis = self._mel_bases.get(sr)
+        if basis is None:
+            mel = mel_filterbank(sr, self.n_fft).T
+            basis = torch.as_tensor(np.ascontiguousarray(mel), device=self.device)
+            self._mel_bases[sr] = basis
+        return basis
+
+    def _dct(self, n_mels: int) -> "torch.Tensor":
+        """직교 정규화 DCT-II 행렬 (n_mfcc, n_mels)"""
+        if self._dct_matrix is None:
+            dct = scipy.fft.dct(np.eye(n_mels), type=2, norm="ortho", axis=0)[: self.n_mfcc]
+            self._dct_matrix = torch.as_tensor(dct, dtype=torch.float32, device=self.device)
+        return self._dct_matrix
+
+    def _batch_mfcc(self, signals: "torch.Tensor", sr: int) -> "torch.Tensor":
+        """
+        같은 길이의 신호 묶음에서 MFCC를 추출합니다.
+
+        Args:
+            signals: (batch, samples) 텐서
+            sr: 샘플링 레이트
+
+        Returns:
+            torch.Tensor: (batch, n_mfcc, n_frames) MFCC
+        """
+        # center=True, pad_mode="constant"와 동일한 패딩
+        pad = self.n_fft // 2
+        padded = torch.nn.functional.pad(signals, (pad, pad))
+        frames = padded.unfold(-1, self.n_fft, self.hop_length)
+
+        power = torch.fft.rfft(frames * self._window_tensor, dim=-1).abs().pow(2)
+
+        mel_basis = self._mel_basis(sr)
+        mel = power @ mel_basis.T
+
+        # power_to_db(ref=1.0, amin=1e-10, top_db=80.0), 최대값은 신호별
+        log_mel = 10.0 * torch.log10(torch.clamp(mel, min=1e-10))
+        peak = log_mel.amax(dim=(1, 2), keepdim=True)
+        log_mel = torch.maximum(log_mel, peak - 80.0)
+
+        mfcc = log_mel @ self._dct(mel_basis.shape[0]).T
+        return mfcc.transpose(1, 2)
+
+    def _extract_mfcc(
+        self,
+        audio: np.ndarray,
+        sr: int,
+    ) -> np.ndarray:
+        """
+        오디오로부터 MFCC 특징을 추출합니다.
+
+        배치 경로를 사용할 수 있으면 윈도우와 같은 텐서 연산으로 계산합니다.
+
+        Args:
+            audio: 오디오 데이터
+            sr: 샘플링 레이트
+
+        Returns:
+            np.ndarray: MFCC 특징 (shape: (n_features, n_frames))
+        """
+        if not self._supports_batch() or audio.ndim != 1:
+            return super()._extract_mfcc(audio, sr)
+
+        with torch.no_grad():
+            signal = torch.as_tensor(audio, dtype=torch.float32, device=self.device)
+            return self._batch_mfcc(signal.unsqueeze(0), sr)[0].cpu().numpy()
+
+    def _window_distances(
+        self,
+        target_mfcc: np.ndarray,
+        source_audio: np.ndarray,
+        source_sr: int,
+        window_samples: int,
+        step_samples: int,
+    ) -> List[float]:
+        """
+        슬라이딩 윈도우마다 타겟 MFCC와의 거리를 배치로 계산합니다.
+
+        Args:
+            target_mfcc: 타겟 MFCC 특징
+            source_audio: 소스 오디오 데이터
+            source_sr: 소스 샘플링 레이트
+            window_samples: 윈도우 길이 (샘플)
+            step_samples: 윈도우 간격 (샘플)
+
+        Returns:
+            List[float]: 윈도우 순서대로의 거리 값
+        """
+        if (
+            not self._supports_batch()
+            or source_audio.ndim != 1
+            or len(source_audio) < window_samples
+        ):
+            return super()._window_distances(
+                target_mfcc, source_audio, source_sr, window_samples, step_samples
+            )
+
+        # 복사 없는 윈도우 뷰 (배치 단위로만 장치에 올림)
+        windows = np.lib.stride_tricks.sliding_window_view(source_audio, window_samples)
+        windows = windows[::step_samples]
+
+        distances = []
+        with torch.no_grad():
+            target = torch.as_tensor(target_mfcc, dtype=torch.float32, device=self.device)
+
+            for start in range(0, len(windows), self.batch_size):
+                batch = torch.as_tensor(
+                    np.ascontiguousarray(windows[start:start + self.batch_size]),
+                    dtype=torch.float32,
+                    device=self.device,
+                )
+                window_mfcc = self._batch_mfcc(batch, source_sr)
+
+                # 프레임 수를 맞춘 뒤 프레임별 거리의 평균
+                n_frames = min(target.shape[1], window_mfcc.shape[2])
+                a = target[:, :n_frames].unsqueeze(0)
+                b = window_mfcc[:, :, :n_frames]
+
+                if self.distance_metric == "euclidean":
+                    per_frame = torch.linalg.vector_norm(a - b, dim=1)
+                else:
+                    norms = torch.linalg.vector_norm(a, dim=1) * torch.linalg.vector_norm(b, dim=1)
+                    per_frame = 1.0 - (a * b).sum(dim=1) / norms
+
+                distances.extend(per_frame.mean(dim=1).cpu().tolist())
+
+        return distances
+
+
+__all__ = ["CudaBatchedMFCCSimilarity", "TORCH_AVAILABLE", "is_cuda_available"]
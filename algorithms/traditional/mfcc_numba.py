@@ -0,0 +1,212 @@
+"""
+Batched MFCC Kernels (Numba)
+
+같은 길이의 신호 여러 개에서 MFCC를 한 번에 추출하고 거리를 계산하는 커널입니다.
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+import librosa
+import scipy.fft
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _frame_signals(
+    signals: np.ndarray, window: np.ndarray, hop_length: int, n_frames: int
+) -> np.ndarray:
+    """center=True(0 패딩) 프레이밍과 윈도우 곱을 한 번에 수행"""
+    n_signals, n_samples = signals.shape
+    n_fft = window.shape[0]
+    pad = n_fft // 2
+
+    frames = np.empty((n_signals, n_frames, n_fft), dtype=np.float32)
+    for idx in prange(n_signals * n_frames):
+        b = idx // n_frames
+        t = idx % n_frames
+        start = t * hop_length - pad
+        for k in range(n_fft):
+            j = start + k
+            if 0 <= j < n_samples:
+                frames[b, t, k] = signals[b, j] * window[k]
+            else:
+                frames[b, t, k] = 0.0
+    return frames
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _frame_distances(
+    target: np.ndarray, features: np.ndarray, scale: np.ndarray, use_cosine: bool
+) -> np.ndarray:
+    """프레임별 유클리드/코사인 거리의 평균 (신호별, 특징은 계수별 scale을 곱해 사용)"""
+    n_batch, n_coef, n_frames = features.shape
+
+    out = np.empty(n_batch)
+    for b in prange(n_batch):
+        total = 0.0
+        for t in range(n_frames):
+            if use_cosine:
+                dot = 0.0
+                norm_a = 0.0
+                norm_b = 0.0
+                for c in range(n_coef):
+                    a = target[c, t]
+                    v = features[b, c, t] * scale[c]
+                    dot += a * v
+                    norm_a += a * a
+                    norm_b += v * v
+                total += 1.0 - dot / np.sqrt(norm_a * norm_b)
+            else:
+                sq = 0.0
+                for c in range(n_coef):
+                    d = target[c, t] - features[b, c, t] * scale[c]
+                    sq += d * d
+                total += np.sqrt(sq)
+        out[b] = total / n_frames
+    return out
+
+
+@lru_cache(maxsize=8)
+def analysis_window(window: str, win_length: int, n_fft: int) -> np.ndarray:
+    """
+    분석 윈도우 (librosa.stft와 같이 n_fft 길이로 가운데 정렬해 0 패딩)
+
+    조합별로 한 번만 만들어 공유하므로 읽기 전용입니다.
+    """
+    win = librosa.filters.get_window(window, win_length, fftbins=True)
+    win = librosa.util.pad_center(win, size=n_fft).astype(np.float32)
+    win.flags.writeable = False
+    return win
+
+
+@lru_cache(maxsize=8)
+def mel_filterbank(sr: int, n_fft: int) -> np.ndarray:
+    """
+    Mel 필터뱅크 (n_fft/2 + 1, n_mels), librosa.feature.mfcc 기본값과 동일
+
+    조합별로 한 번만 만들어 공유하므로 읽기 전용입니다.
+    """
+    basis = np.ascontiguousarray(librosa.filters.mel(sr=sr, n_fft=n_fft).T, dtype=np.float32)
+    basis.flags.writeable = False
+    return basis
+
+
+def batch_mfcc(
+    signals: np.ndarray,
+    sr: int,
+    n_mfcc: int = 13,
+    n_fft: int = 2048,
+    hop_length: int = 512,
+    win_length: Optional[int] = None,
+    window: str = "hann",
+) -> np.ndarray:
+    """
+    같은 길이의 신호 묶음에서 MFCC를 추출합니다.
+
+    결과는 신호마다 librosa.feature.mfcc를 호출한 것과 같습니다.
+
+    Args:
+        signals: (batch, samples) 신호
+        sr: 샘플링 레이트
+        n_mfcc: MFCC 계수 개수
+        n_fft: FFT 윈도우 크기
+        hop_length: 홉 길이
+        win_length: 윈도우 길이 (None이면 n_fft)
+        window: 윈도우 함수
+
+    Returns:
+        np.ndarray: (batch, n_mfcc, n_frames) MFCC
+    """
+    signals = np.ascontiguousarray(signals, dtype=np.float32)
+    n_frames = 1 + signals.shape[1] // hop_length
+
+    frames = _frame_signals(
+        signals, analysis_window(window, win_length or n_fft, n_fft), hop_length, n_frames
+    )
+
+    # 실수 입력이므로 rfft (n_fft/2 + 1개 빈), 파워는 제자리 제곱으로 임시 배열 최소화
+    spectrum = scipy.fft.rfft(frames, axis=-1, workers=-1)
+    del frames
+    power = np.abs(spectrum)
+    del spectrum
+    np.square(power, out=power)
+
+    mel_basis = mel_filterbank(sr, n_fft)
+    mel = power @ mel_basis
+
+    # power_to_db(ref=1.0, amin=1e-10, top_db=80.0), 최대값은 신호별
+    log_mel = 10.0 * np.log10(np.maximum(mel, 1e-10))
+    peak = log_mel.max(axis=(1, 2), keepdims=True)
+    np.maximum(log_mel, peak - 80.0, out=log_mel)
+
+    # 직교 정규화 DCT-II (행렬곱 대신 FFT 기반, 프레임 단위 멀티스레드)
+    mfcc = scipy.fft.dct(log_mel, type=2, norm="ortho", axis=-1, workers=-1)[..., :n_mfcc]
+    return mfcc.transpose(0, 2, 1)
+
+
+def quantize_features(features: np.ndarray) -> tuple:
+    """
+    특징 묶음을 특징 계수별 스케일의 int8로 양자화합니다.
+
+    Args:
+        features: (batch, n_features, n_frames) 특징 묶음
+
+    Returns:
+        (int8 특징, (n_features,) float32 스케일) 튜플 (복원은 q * scale[:, None])
+    """
+    features = np.asarray(features, dtype=np.float32)
+    if features.size == 0:
+        return features.astype(np.int8), np.empty(0, dtype=np.float32)
+
+    scale = np.abs(features).max(axis=(0, 2)) / 127.0 + 1e-9
+    q = np.rint(features / scale[:, None]).astype(np.int8)
+    return q, scale.astype(np.float32)
+
+
+def batch_frame_distances(
+    target: np.ndarray,
+    features: np.ndarray,
+    metric: str = "euclidean",
+    scale: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    타겟 특징과 특징 묶음 사이의 프레임 평균 거리를 계산합니다.
+
+    프레임 수는 짧은 쪽에 맞춥니다 (MFCCSimilarity._compute_distance와 동일).
+    scale이 주어지면 int8 특징을 그대로 넘기고 커널 안에서 계수별로 복원합니다.
+
+    Args:
+        target: (n_features, n_frames) 타겟 특징
+        features: (batch, n_features, n_frames) 특징 묶음
+        metric: 'euclidean' 또는 'cosine'
+        scale: quantize_features의 계수별 스케일 (None이면 features를 실수로 사용)
+
+    Returns:
+        np.ndarray: (batch,) 거리
+    """
+    n_frames = min(target.shape[1], features.shape[2])
+
+    if scale is None:
+        features = np.ascontiguousarray(features[:, :, :n_frames], dtype=np.float64)
+        scale = np.ones(features.shape[1])
+    else:
+        # int8 그대로 (복사량이 float64 변환의 1/8)
+        features = np.ascontiguousarray(features[:, :, :n_frames])
+
+    return _frame_distances(
+        np.ascontiguousarray(target[:, :n_frames], dtype=np.float64),
+        features,
+        np.asarray(scale, dtype=np.float64),
+        metric == "cosine",
+    )
+
+
+__all__ = [
+    "analysis_window",
+    "mel_filterbank",
+    "batch_mfcc",
+    "batch_frame_distances",
+    "quantize_features",
+]
@@ -9,6 +9,7 @@ import json
 from pathlib import Path
 
 import click
+import soundfile as sf
 
 from core.tts.backends import GTTSBackend, Pyttsx3Backend, EdgeTTSBackend
 from core.tts.preprocessing import TextPreprocessor
@@ -107,10 +108,11 @@ def speak(ctx, text, output, backend, language):
         click.echo(f"텍스트: {text}\n")
 
         # TTS 실행
-        audio_data, sample_rate = tts_backend.synthesize(text, output_path=Path(output))
+        # 파일만 필요하므로 디코딩 생략, 길이는 헤더에서 확인
+        tts_backend.synthesize(text, output_path=Path(output), return_array=False)
 
         click.echo(f"TTS 완료: {output}")
-        click.echo(f"길이: {len(audio_data) / sample_rate:.2f}초")
+        click.echo(f"길이: {sf.info(output).duration:.2f}초")
 
     except Exception as e:
         logger.error(f"오류 발생: {str(e)}", exc_info=ctx.obj['debug'])
@@ -0,0 +1,167 @@
+"""
+Buffer Pool
+
+오디오 배열 버퍼 재사용 모듈
+"""
+
+import logging
+import threading
+import weakref
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+import numpy as np
+import soundfile as sf
+
+logger = logging.getLogger(__name__)
+
+
+class BufferPool:
+    """
+    numpy 버퍼 풀
+
+    (dtype, 2의 거듭제곱 크기) 버킷별로 반환된 버퍼를 보관했다가 재사용합니다.
+    get()은 np.empty()처럼 초기화되지 않은 1차원 배열을 반환하며,
+    이 풀에서 나간 버퍼만 put()으로 되돌릴 수 있습니다.
+    """
+
+    def __init__(self, max_per_bucket: int = 4):
+        """
+        Args:
+            max_per_bucket: 버킷별 최대 보관 버퍼 수
+        """
+        self.max_per_bucket = max_per_bucket
+        self._free = defaultdict(deque)
+        # 대여 중인 버퍼 (id -> 원본 배열, 호출자가 버리면 자동 제거)
+        self._borrowed = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _bucket(n: int, dtype: np.dtype) -> tuple:
+        """버킷 키 계산"""
+        size = 1 << max(0, (n - 1).bit_length())
+        return dtype.str, size
+
+    def get(self, n: int, dtype=np.float32) -> np.ndarray:
+        """
+        길이 n의 버퍼 대여
+
+        Args:
+            n: 샘플 수
+            dtype: 데이터 타입
+
+        Returns:
+            초기화되지 않은 길이 n의 배열
+        """
+        dtype = np.dtype(dtype)
+        key = self._bucket(n, dtype)
+
+        with self._lock:
+            free = self._free.get(key)
+            if free:
+                base = free.pop()
+                self.hits += 1
+            else:
+                base = np.empty(key[1], dtype=dtype)
+                self.misses += 1
+            self._borrowed[id(base)] = base
+
+        return base[:n]
+
+    def put(self, array: np.ndarray) -> bool:
+        """
+        버퍼 반납
+
+        Args:
+            array: get()으로 받은 배열 (또는 그 뷰)
+
+        Returns:
+            반납 여부 (이 풀의 버퍼가 아니면 False)
+        """
+        base = array if array.base is None else array.base
+
+        with self._lock:
+            if self._borrowed.get(id(base)) is not base:
+                return False
+            del self._borrowed[id(base)]
+
+            free = self._free[self._bucket(base.size, base.dtype)]
+            if len(free) < self.max_per_bucket:
+                free.append(base)
+
+        return True
+
+    @contextmanager
+    def borrow(self, n: int, dtype=np.float32) -> Iterator[np.ndarray]:
+        """
+        블록 안에서만 사용하는 버퍼 대여
+
+        Args:
+            n: 샘플 수
+            dtype: 데이터 타입
+
+        Yields:
+            길이 n의 배열
+        """
+        array = self.get(n, dtype)
+        try:
+            yield array
+        finally:
+            self.put(array)
+
+    def clear(self):
+        """보관 중인 버퍼 모두 해제"""
+        with self._lock:
+            self._free.clear()
+
+    def __repr__(self) -> str:
+        return (
+            f"BufferPool(max_per_bucket={self.max_per_bucket}, "
+            f"hits={self.hits}, misses={self.misses})"
+        )
+
+
+_default_pool = BufferPool()
+
+
+def get_buffer_pool() -> BufferPool:
+    """
+    전역 버퍼 풀 반환
+
+    Returns:
+        BufferPool 인스턴스
+    """
+    return _default_pool
+
+
+def read_mono(file, pool: Optional[BufferPool] = None) -> tuple:
+    """
+    오디오를 풀 버퍼에 float32 모노로 읽기
+
+    다 쓴 배열은 pool.put()으로 반납하면 다음 읽기에서 재사용됩니다.
+
+    Args:
+        file: 파일 경로 또는 파일 객체
+        pool: 버퍼 풀 (None이면 전역 풀)
+
+    Returns:
+        (audio_data, sample_rate) 튜플
+    """
+    pool = pool or _default_pool
+
+    with sf.SoundFile(file) as f:
+        frames, channels, sample_rate = f.frames, f.channels, f.samplerate
+
+        if channels == 1:
+            audio_data = f.read(dtype="float32", out=pool.get(frames))
+        else:
+            # 다채널은 임시 버퍼에 읽은 뒤 모노로 평균
+            with pool.borrow(frames * channels) as scratch:
+                interleaved = f.read(dtype="float32", out=scratch.reshape(frames, channels))
+                audio_data = pool.get(len(interleaved))
+                np.mean(interleaved, axis=1, out=audio_data)
+
+    return audio_data, sample_rate
@@ -141,6 +141,7 @@ class AudioFile:
                     mono=mono,
                     offset=offset,
                     duration=duration,
+                    dtype=np.float32,
                 )
 
             logger.info(
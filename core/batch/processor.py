@@ -86,15 +86,52 @@ class BatchProcessor:
         logger.debug(f"작업 추가: {job_id}, priority={priority}")
         return job
 
-    def process_all(self) -> Dict[str, Any]:
+    def add_jobs(
+        self,
+        jobs: List[tuple],
+        priority: int = 0,
+    ) -> List[Job]:
+        """
+        작업 일괄 추가
+
+        Args:
+            jobs: (job_id, func, kwargs) 튜플 리스트
+            priority: 모든 작업에 적용할 우선순위
+
+        Returns:
+            생성된 Job 객체 리스트
+        """
+        created = [
+            Job(
+                job_id=job_id,
+                func=func,
+                kwargs=kwargs or {},
+                priority=priority,
+            )
+            for job_id, func, kwargs in jobs
+        ]
+        self.job_queue.add_many(created)
+        logger.debug(f"작업 일괄 추가: {len(created)}개, priority={priority}")
+        return created
+
+    def process_all(
+        self,
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+    ) -> Dict[str, Any]:
         """
         모든 작업 처리
 
+        Args:
+            progress_callback: 작업 종료(성공/실패)마다 호출되는 콜백
+                (job_id, 완료 수, 전체 수)
+
         Returns:
             처리 결과 딕셔너리
         """
         start_time = time.time()
-        logger.info(f"배치 처리 시작: {len(self.job_queue.jobs)}개 작업")
+        total = len(self.job_queue.jobs)
+        finished_count = 0
+        logger.info(f"배치 처리 시작: {total}개 작업")
 
         # 진행률 추적 초기화
         if self.show_progress:
@@ -136,6 +173,10 @@ class BatchProcessor:
 
                         logger.info(f"작업 완료: {job.job_id}")
 
+                        finished_count += 1
+                        if progress_callback:
+                            progress_callback(job.job_id, finished_count, total)
+
                     except Exception as e:
                         job.status = "failed"
                         job.error = str(e)
@@ -148,6 +189,10 @@ class BatchProcessor:
 
                         logger.error(f"작업 실패: {job.job_id}, 오류: {str(e)}")
 
+                        finished_count += 1
+                        if progress_callback:
+                            progress_callback(job.job_id, finished_count, total)
+
                         if not self.continue_on_error:
                             # 나머지 작업 취소
                             for f in futures:
@@ -66,6 +66,24 @@ class JobQueue:
         self.jobs.append(job)
         logger.debug(f"작업 추가: {job.job_id}")
 
+    def add_many(self, jobs: List[Job]):
+        """
+        여러 작업 일괄 추가
+
+        중복 ID가 하나라도 있으면 아무 작업도 추가하지 않습니다.
+
+        Args:
+            jobs: Job 객체 리스트
+        """
+        seen = {job.job_id for job in self.jobs}
+        for job in jobs:
+            if job.job_id in seen:
+                raise ValueError(f"중복된 작업 ID: {job.job_id}")
+            seen.add(job.job_id)
+
+        self.jobs.extend(jobs)
+        logger.debug(f"작업 일괄 추가: {len(jobs)}개")
+
     def get(self, job_id: str) -> Optional[Job]:
         """
         작업 ID로 작업 조회
@@ -12,7 +12,7 @@ from .prosody import ProsodyMatcher
 from .enhancement import QualityEnhancer
 from .engine import CollageEngine
 from .metrics import QualityMetrics
-from .cache import SegmentCache
+from .cache import SegmentCache, FeatureCache
 
 __all__ = [
     "SegmentExtractor",
@@ -24,4 +24,5 @@ __all__ = [
     "CollageEngine",
     "QualityMetrics",
     "SegmentCache",
+    "FeatureCache",
 ]
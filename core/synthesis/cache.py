@@ -5,7 +5,10 @@ Segment Cache
 """
 
 import logging
-from typing import Optional, Tuple, Any
+import os
+import threading
+from pathlib import Path
+from typing import Optional, Tuple, Any, Union
 from collections import OrderedDict
 import hashlib
 
@@ -160,3 +163,126 @@ class SegmentCache:
             f"SegmentCache(size={stats['size']}/{stats['max_size']}, "
             f"hit_rate={stats['hit_rate']:.2%})"
         )
+
+
+class FeatureCache:
+    """
+    소스 파일 특징 디스크 캐시 클래스
+
+    (경로, 수정 시각, 크기, 추출 파라미터)로 키를 만들어 특징 배열을 .npy 파일로
+    저장합니다 (기본 float16). 파일이 바뀌면 키가 달라지므로 별도 무효화가 필요 없고,
+    히트 시에는 메모리 맵으로 읽어 필요한 부분만 로드합니다.
+    """
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리 (None이면 ~/.cache/personal-voice-tts-ai/mfcc)
+        """
+        if cache_dir is None:
+            cache_dir = Path.home() / ".cache" / "personal-voice-tts-ai" / "mfcc"
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+
+        logger.info(f"FeatureCache 초기화: cache_dir={self.cache_dir}")
+
+    def _generate_key(self, source_file: Union[str, Path], params: str) -> Optional[str]:
+        """
+        캐시 키 생성
+
+        Args:
+            source_file: 소스 파일 경로
+            params: 특징 추출 파라미터 문자열
+
+        Returns:
+            캐시 키 (파일 정보를 읽을 수 없으면 None)
+        """
+        try:
+            st = os.stat(source_file)
+        except OSError:
+            return None
+
+        key_str = f"{source_file}|{st.st_mtime_ns}|{st.st_size}|{params}"
+        return hashlib.sha1(key_str.encode()).hexdigest()
+
+    def get(self, source_file: Union[str, Path], params: str) -> Optional[np.ndarray]:
+        """
+        캐시에서 특징 가져오기
+
+        Args:
+            source_file: 소스 파일 경로
+            params: 특징 추출 파라미터 문자열
+
+        Returns:
+            읽기 전용 메모리 맵 배열 또는 None
+        """
+        key = self._generate_key(source_file, params)
+        if key is None:
+            return None
+
+        try:
+            features = np.load(self.cache_dir / f"{key}.npy", mmap_mode="r")
+        except (OSError, ValueError):
+            self.misses += 1
+            logger.debug(f"특징 캐시 미스: {source_file}")
+            return None
+
+        self.hits += 1
+        logger.debug(f"특징 캐시 히트: {source_file}")
+
+        return features
+
+    def put(
+        self,
+        source_file: Union[str, Path],
+        params: str,
+        features: np.ndarray,
+        dtype=np.float16,
+    ) -> np.ndarray:
+        """
+        캐시에 특징 저장
+
+        Args:
+            source_file: 소스 파일 경로
+            params: 특징 추출 파라미터 문자열
+            features: 특징 배열
+            dtype: 저장 dtype (양자화된 특징은 np.int8)
+
+        Returns:
+            저장된 값과 같은 배열 (히트 때와 같은 결과를 내도록)
+        """
+        features = np.asarray(features, dtype=dtype)
+
+        key = self._generate_key(source_file, params)
+        if key is None:
+            return features
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+            # 여러 프로세스/스레드가 동시에 저장해도 완성된 파일만 보이도록 교체
+            cache_path = self.cache_dir / f"{key}.npy"
+            tmp_path = cache_path.with_name(f"{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "wb") as f:
+                np.save(f, features)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"특징 캐시 저장 실패: {str(e)}")
+
+        return features
+
+    def clear(self):
+        """캐시 파일 모두 삭제"""
+        for cache_path in self.cache_dir.glob("*.npy"):
+            cache_path.unlink(missing_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+        logger.info("특징 캐시 초기화 완료")
+
+    def __repr__(self) -> str:
+        return (
+            f"FeatureCache(cache_dir={self.cache_dir}, "
+            f"hits={self.hits}, misses={self.misses})"
+        )
@@ -5,7 +5,9 @@ Collage Engine
 """
 
 import logging
-from typing import List, Optional
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional
 from pathlib import Path
 import time
 
@@ -23,6 +25,23 @@ from core.synthesis.cache import SegmentCache
 
 logger = logging.getLogger(__name__)
 
+# 소스 검색 프로세스는 spawn으로 시작 (Numba parallel 커널이 띄운 스레드 풀을 fork하면
+# 부모 프로세스가 종료 시 멈춤)
+_POOL_CONTEXT = multiprocessing.get_context("spawn")
+
+
+def create_search_executor(max_workers: int) -> ProcessPoolExecutor:
+    """
+    소스 검색용 프로세스 풀 생성
+
+    Args:
+        max_workers: 프로세스 수
+
+    Returns:
+        spawn으로 시작하는 ProcessPoolExecutor
+    """
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=_POOL_CONTEXT)
+
 
 class CollageEngine:
     """콜라주 엔진 클래스"""
@@ -81,6 +100,9 @@ class CollageEngine:
         match_prosody: bool = True,
         enhance_quality: bool = True,
         progress_callback: Optional[callable] = None,
+        max_workers: int = 1,
+        source_audio: Optional[Dict[Path, AudioFile]] = None,
+        executor: Optional[Executor] = None,
     ) -> tuple:
         """
         타겟 오디오를 소스 파일들로부터 합성
@@ -95,6 +117,12 @@ class CollageEngine:
             match_prosody: 프로소디 매칭 여부
             enhance_quality: 품질 향상 여부
             progress_callback: 진행률 콜백 함수
+            max_workers: 소스 검색 프로세스 수 (1이면 현재 프로세스에서 순차 처리,
+                유사도 알고리즘이 pickle 가능해야 함)
+            source_audio: 이미 로드된 소스 오디오 (source_files 항목 -> AudioFile,
+                없는 파일만 디스크에서 로드, 프로세스 검색에는 전달하지 않음)
+            executor: 소스 검색에 재사용할 프로세스 풀 (주어지면 max_workers 대신 사용,
+                종료는 호출자가 관리)
 
         Returns:
             (합성된 오디오, 샘플링 레이트, 메타데이터) 튜플
@@ -110,31 +138,56 @@ class CollageEngine:
         if progress_callback:
             progress_callback(0, "유사 세그먼트 검색 중...")
 
-        all_matches = []
-        for i, source_file in enumerate(source_files):
-            logger.info(f"소스 파일 처리 중 ({i + 1}/{len(source_files)}): {source_file}")
-
-            # 소스 오디오 로드
-            source_audio_file = AudioFile.load(source_file)
-            source_audio = source_audio_file.data
-            source_sr = source_audio_file.sample_rate
-
-            # 유사 세그먼트 찾기
-            matches = self.similarity_algorithm.find_similar_segments(
-                target_audio, source_audio, target_sr, source_sr, top_k=top_k
-            )
+        source_audio = source_audio or {}
 
-            # 소스 파일 정보 추가
-            for match in matches:
-                if match.metadata is None:
-                    match.metadata = {}
-                match.metadata["source_file"] = str(source_file)
+        all_matches = []
+        if len(source_files) > 1 and (executor is not None or max_workers > 1):
+            # 소스별 검색은 서로 독립적이므로 프로세스로 분산 (미리 로드된 오디오는 보내지 않고
+            # 워커가 파일을 블록 단위로 읽거나 특징 캐시를 사용)
+            own_executor = executor is None
+            if own_executor:
+                executor = create_search_executor(min(max_workers, len(source_files)))
+
+            source_matches = [None] * len(source_files)
+            try:
+                futures = {
+                    executor.submit(
+                        _match_source, self.similarity_algorithm,
+                        target_audio, target_sr, source_file, top_k,
+                    ): i
+                    for i, source_file in enumerate(source_files)
+                }
+                try:
+                    for done, future in enumerate(as_completed(futures), 1):
+                        source_matches[futures[future]] = future.result()
+
+                        if progress_callback:
+                            progress = done / len(source_files) * 0.3  # 30%까지
+                            progress_callback(progress, f"소스 {done}/{len(source_files)} 처리 완료")
+                except BaseException:
+                    # 실패하거나 진행률 콜백이 중단시키면 아직 시작하지 않은 검색은 건너뜀
+                    for future in futures:
+                        future.cancel()
+                    raise
+            finally:
+                if own_executor:
+                    executor.shutdown()
+
+            # 순차 처리와 같은 순서로 결합
+            for matches in source_matches:
+                all_matches.extend(matches)
+        else:
+            for i, source_file in enumerate(source_files):
+                logger.info(f"소스 파일 처리 중 ({i + 1}/{len(source_files)}): {source_file}")
 
-            all_matches.extend(matches)
+                all_matches.extend(_match_source(
+                    self.similarity_algorithm, target_audio, target_sr, source_file, top_k,
+                    source_audio.get(source_file),
+                ))
 
-            if progress_callback:
-                progress = (i + 1) / len(source_files) * 0.3  # 30%까지
-                progress_callback(progress, f"소스 {i + 1}/{len(source_files)} 처리 완료")
+                if progress_callback:
+                    progress = (i + 1) / len(source_files) * 0.3  # 30%까지
+                    progress_callback(progress, f"소스 {i + 1}/{len(source_files)} 처리 완료")
 
         if not all_matches:
             raise ValueError("유사한 세그먼트를 찾을 수 없습니다")
@@ -151,7 +204,9 @@ class CollageEngine:
 
         # 최고 매치에서 세그먼트 추출
         source_file = Path(best_match.metadata["source_file"])
-        source_audio_file = AudioFile.load(source_file)
+        source_audio_file = source_audio.get(source_file)
+        if source_audio_file is None:
+            source_audio_file = AudioFile.load(source_file)
 
         segment, segment_sr = self.extractor.extract_from_match(
             source_audio_file.data, source_audio_file.sample_rate, best_match
@@ -223,18 +278,20 @@ class CollageEngine:
 
         return adjusted, segment_sr, metadata
 
-    def synthesize_from_file(
+    def synthesize_from_array(
         self,
-        target_file: Path,
+        target_audio: np.ndarray,
+        target_sr: int,
         source_files: List[Path],
         output_file: Path,
         **kwargs,
     ) -> dict:
         """
-        파일로부터 합성
+        메모리상의 타겟 오디오로부터 합성 후 저장
 
         Args:
-            target_file: 타겟 파일 경로
+            target_audio: 타겟 오디오
+            target_sr: 타겟 샘플링 레이트
             source_files: 소스 파일 경로 리스트
             output_file: 출력 파일 경로
             **kwargs: synthesize()에 전달할 추가 인자
@@ -242,12 +299,9 @@ class CollageEngine:
         Returns:
             메타데이터 딕셔너리
         """
-        # 타겟 로드
-        target = AudioFile.load(target_file)
-
         # 합성
         synthesized, sr, metadata = self.synthesize(
-            target.data, target.sample_rate, source_files, **kwargs
+            target_audio, target_sr, source_files, **kwargs
         )
 
         # 저장
@@ -259,10 +313,81 @@ class CollageEngine:
 
         logger.info(f"합성 결과 저장: {output_file}")
 
-        metadata["target_file"] = str(target_file)
         metadata["output_file"] = str(output_file)
 
         return metadata
 
+    def synthesize_from_file(
+        self,
+        target_file: Path,
+        source_files: List[Path],
+        output_file: Path,
+        **kwargs,
+    ) -> dict:
+        """
+        파일로부터 합성
+
+        Args:
+            target_file: 타겟 파일 경로
+            source_files: 소스 파일 경로 리스트
+            output_file: 출력 파일 경로
+            **kwargs: synthesize()에 전달할 추가 인자
+
+        Returns:
+            메타데이터 딕셔너리
+        """
+        # 타겟 로드
+        target = AudioFile.load(target_file)
+
+        metadata = self.synthesize_from_array(
+            target.data, target.sample_rate, source_files, output_file, **kwargs
+        )
+
+        metadata["target_file"] = str(target_file)
+
+        return metadata
+
     def __repr__(self) -> str:
         return f"CollageEngine(algorithm={self.similarity_algorithm.__class__.__name__})"
+
+
+def _match_source(
+    similarity_algorithm: BaseSimilarityAlgorithm,
+    target_audio: np.ndarray,
+    target_sr: int,
+    source_file: Path,
+    top_k: int,
+    source_audio_file: Optional[AudioFile] = None,
+) -> List[SimilarityMatch]:
+    """소스 파일 하나에서 유사 세그먼트 검색 (프로세스 풀에서도 실행 가능하도록 모듈 수준 함수)"""
+    if source_audio_file is None and hasattr(similarity_algorithm, "find_similar_segments_in_file"):
+        # 미리 로드된 오디오가 없으면 파일을 블록 단위로 읽으며 검색 (전체 디코딩 없음)
+        matches = similarity_algorithm.find_similar_segments_in_file(
+            target_audio, target_sr, source_file, top_k=top_k
+        )
+    else:
+        # 소스 오디오 로드 (미리 로드된 것이 없을 때만)
+        if source_audio_file is None:
+            source_audio_file = AudioFile.load(source_file)
+
+        # 유사 세그먼트 찾기 (특징 캐시를 쓰는 알고리즘에는 캐시 키로 경로 전달)
+        kwargs = {}
+        if getattr(similarity_algorithm, "feature_cache", None) is not None:
+            kwargs["source_file"] = source_file
+
+        matches = similarity_algorithm.find_similar_segments(
+            target_audio,
+            source_audio_file.data,
+            target_sr,
+            source_audio_file.sample_rate,
+            top_k=top_k,
+            **kwargs,
+        )
+
+    # 소스 파일 정보 추가
+    for match in matches:
+        if match.metadata is None:
+            match.metadata = {}
+        match.metadata["source_file"] = str(source_file)
+
+    return matches
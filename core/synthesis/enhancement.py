@@ -112,7 +112,7 @@ class QualityEnhancer:
             gate = magnitude > (noise_profile * threshold)
 
             # 부드러운 게이팅 (0~1)
-            gate = gate.astype(float)
+            gate = gate.astype(magnitude.dtype)
 
             # 게이트 적용
             magnitude_gated = magnitude * gate
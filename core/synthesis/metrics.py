@@ -5,14 +5,56 @@ Quality Metrics
 """
 
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 import numpy as np
 import librosa
+from numba import njit
 
 logger = logging.getLogger(__name__)
 
 
+@njit(fastmath=True, cache=True)
+def _snr_kernel(clean: np.ndarray, noisy: np.ndarray, n: int) -> tuple:
+    """신호 파워와 노이즈 파워 합계 (임시 버퍼 없이 단일 패스)"""
+    s_pow = 0.0
+    n_pow = 0.0
+    for i in range(n):
+        c = clean[i]
+        d = noisy[i] - c
+        s_pow += c * c
+        n_pow += d * d
+    return s_pow, n_pow
+
+
+@njit(fastmath=True, cache=True)
+def _mse_kernel(reference: np.ndarray, degraded: np.ndarray, n: int) -> float:
+    """제곱 오차 합계 (임시 버퍼 없이 단일 패스)"""
+    err = 0.0
+    for i in range(n):
+        d = reference[i] - degraded[i]
+        err += d * d
+    return err
+
+
+@lru_cache(maxsize=8)
+def _mel_basis(sample_rate: int, n_fft: int, n_mels: int) -> np.ndarray:
+    """Mel 필터뱅크 (sr, n_fft, n_mels 조합별로 한 번만 생성)"""
+    return librosa.filters.mel(sr=sample_rate, n_fft=n_fft, n_mels=n_mels)
+
+
+@lru_cache(maxsize=8)
+def _hann_window(n_fft: int) -> np.ndarray:
+    """Hann 윈도우 (n_fft별로 한 번만 생성)"""
+    return librosa.filters.get_window("hann", n_fft, fftbins=True)
+
+
+def _as_flat(audio: np.ndarray, n: int) -> np.ndarray:
+    """앞쪽 n개 샘플(행)을 1차원 배열로 변환"""
+    return np.ravel(audio[:n])
+
+
 class QualityMetrics:
     """품질 메트릭 클래스"""
 
@@ -33,17 +75,18 @@ class QualityMetrics:
         Returns:
             SNR (dB)
         """
+        clean = np.asarray(clean, dtype=np.float32)
+        noisy = np.asarray(noisy, dtype=np.float32)
+
         # 길이 맞추기
         min_len = min(len(clean), len(noisy))
-        clean = clean[:min_len]
-        noisy = noisy[:min_len]
-
-        # 노이즈 = 노이즈 신호 - 깨끗한 신호
-        noise = noisy - clean
+        clean = _as_flat(clean, min_len)
+        noisy = _as_flat(noisy, min_len)
 
-        # 파워 계산
-        signal_power = np.mean(clean**2)
-        noise_power = np.mean(noise**2)
+        # 파워 계산 (노이즈 = 노이즈 신호 - 깨끗한 신호)
+        s_pow, n_pow = _snr_kernel(clean, noisy, len(clean))
+        signal_power = np.float64(s_pow) / len(clean)
+        noise_power = np.float64(n_pow) / len(clean)
 
         # SNR (dB)
         if noise_power > 0:
@@ -66,11 +109,14 @@ class QualityMetrics:
         Returns:
             MSE
         """
+        reference = np.asarray(reference, dtype=np.float32)
+        degraded = np.asarray(degraded, dtype=np.float32)
+
         min_len = min(len(reference), len(degraded))
-        reference = reference[:min_len]
-        degraded = degraded[:min_len]
+        reference = _as_flat(reference, min_len)
+        degraded = _as_flat(degraded, min_len)
 
-        mse = np.mean((reference - degraded) ** 2)
+        mse = np.float64(_mse_kernel(reference, degraded, len(reference))) / len(reference)
 
         return float(mse)
 
@@ -91,24 +137,50 @@ class QualityMetrics:
         Returns:
             스펙트럼 거리
         """
+        audio1 = np.asarray(audio1, dtype=np.float32)
+        audio2 = np.asarray(audio2, dtype=np.float32)
+
         # 길이 맞추기
         min_len = min(len(audio1), len(audio2))
         audio1 = audio1[:min_len]
         audio2 = audio2[:min_len]
 
-        # Mel 스펙트로그램
-        mel1 = librosa.feature.melspectrogram(y=audio1, sr=sample_rate)
-        mel2 = librosa.feature.melspectrogram(y=audio2, sr=sample_rate)
+        # Mel 스펙트로그램 (필터뱅크와 윈도우는 캐시에서 공유)
+        mel1 = self._melspectrogram(audio1, sample_rate)
+        mel2 = self._melspectrogram(audio2, sample_rate)
 
         # dB 스케일
         mel1_db = librosa.power_to_db(mel1)
         mel2_db = librosa.power_to_db(mel2)
 
-        # 유클리드 거리
-        distance = np.sqrt(np.mean((mel1_db - mel2_db) ** 2))
+        # 유클리드 거리 (RMS): mel1_db는 지역 배열이므로 차이를 제자리에 계산
+        diff = np.subtract(mel1_db, mel2_db, out=mel1_db)
+        distance = np.linalg.norm(diff.ravel()) / np.sqrt(diff.size)
 
         return float(distance)
 
+    def _melspectrogram(
+        self,
+        audio: np.ndarray,
+        sample_rate: int,
+        n_fft: int = 2048,
+        hop_length: int = 512,
+        n_mels: int = 128,
+    ) -> np.ndarray:
+        """
+        파워 Mel 스펙트로그램 계산
+
+        librosa.feature.melspectrogram과 동일한 결과이지만,
+        호출마다 필터뱅크와 윈도우를 다시 만들지 않습니다.
+        """
+        S = np.abs(
+            librosa.stft(
+                audio, n_fft=n_fft, hop_length=hop_length, window=_hann_window(n_fft)
+            )
+        ) ** 2
+
+        return _mel_basis(sample_rate, n_fft, n_mels) @ S
+
     def compute_zero_crossing_rate(
         self, audio: np.ndarray
     ) -> float:
@@ -121,6 +193,8 @@ class QualityMetrics:
         Returns:
             ZCR (비율)
         """
+        audio = np.asarray(audio, dtype=np.float32)
+
         zcr = librosa.feature.zero_crossing_rate(audio)[0]
         return float(np.mean(zcr))
 
@@ -136,6 +210,8 @@ class QualityMetrics:
         Returns:
             RMS 에너지
         """
+        audio = np.asarray(audio, dtype=np.float32)
+
         rms = librosa.feature.rms(y=audio)[0]
         return float(np.mean(rms))
 
@@ -152,6 +228,8 @@ class QualityMetrics:
         Returns:
             스펙트럼 중심 (Hz)
         """
+        audio = np.asarray(audio, dtype=np.float32)
+
         centroid = librosa.feature.spectral_centroid(y=audio, sr=sample_rate)[0]
         return float(np.mean(centroid))
 
@@ -168,6 +246,8 @@ class QualityMetrics:
         Returns:
             클리핑 정보 딕셔너리
         """
+        audio = np.asarray(audio, dtype=np.float32)
+
         clipped_samples = np.sum(np.abs(audio) >= threshold)
         clipping_ratio = clipped_samples / len(audio)
 
@@ -192,6 +272,8 @@ class QualityMetrics:
         Returns:
             무음 정보 딕셔너리
         """
+        audio = np.asarray(audio, dtype=np.float32)
+
         # 무음 구간 인덱스
         intervals = librosa.effects.split(
             audio, top_db=-threshold_db
@@ -231,6 +313,10 @@ class QualityMetrics:
         Returns:
             품질 분석 결과 딕셔너리
         """
+        audio = np.asarray(audio, dtype=np.float32)
+        if reference is not None:
+            reference = np.asarray(reference, dtype=np.float32)
+
         results = {}
 
         # 기본 메트릭
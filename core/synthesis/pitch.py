@@ -9,9 +9,47 @@ from typing import Literal, Optional
 
 import numpy as np
 import librosa
+from librosa import pyin as _pyin, resample as _resample
+from librosa.effects import pitch_shift as _pitch_shift, time_stretch as _time_stretch
+from numba import njit
 
 logger = logging.getLogger(__name__)
 
+# 피치 추출 범위 (호출마다 음이름 변환을 반복하지 않도록 모듈 로드 시 계산)
+PYIN_FMIN = librosa.note_to_hz("C2")  # 약 65Hz
+PYIN_FMAX = librosa.note_to_hz("C7")  # 약 2093Hz
+
+
+@njit(cache=True)
+def _pitch_stats(f0: np.ndarray) -> tuple:
+    """
+    유효 피치(> 0, NaN 제외) 통계를 단일 패스로 계산
+
+    Returns:
+        (count, mean, std, min, max) 튜플 (std는 모표준편차)
+    """
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    f_min = np.inf
+    f_max = -np.inf
+
+    for i in range(f0.shape[0]):
+        v = f0[i]
+        if not v > 0:  # NaN(무성음)도 함께 제외
+            continue
+        count += 1
+        delta = v - mean
+        mean += delta / count
+        m2 += delta * (v - mean)
+        if v < f_min:
+            f_min = v
+        if v > f_max:
+            f_max = v
+
+    std = np.sqrt(m2 / count) if count > 0 else 0.0
+    return count, mean, std, f_min, f_max
+
 
 class PitchAdjuster:
     """피치 조정 클래스"""
@@ -51,6 +89,8 @@ class PitchAdjuster:
         Returns:
             피치가 조정된 오디오
         """
+        audio = np.asarray(audio, dtype=np.float32)
+
         if abs(n_steps) < 0.01:
             # 변화가 거의 없으면 원본 반환
             return audio
@@ -69,7 +109,7 @@ class PitchAdjuster:
     ) -> np.ndarray:
         """Phase vocoder를 사용한 피치 조정"""
         # librosa.effects.pitch_shift 사용
-        shifted = librosa.effects.pitch_shift(
+        shifted = _pitch_shift(
             audio, sr=sample_rate, n_steps=n_steps
         )
 
@@ -82,12 +122,12 @@ class PitchAdjuster:
         # 피치 변화 = 시간 변화 + 리샘플링
         # 1. 시간 축소/확장
         rate = 2 ** (n_steps / 12.0)  # 반음당 2^(1/12)
-        stretched = librosa.effects.time_stretch(audio, rate=rate)
+        stretched = _time_stretch(audio, rate=rate)
 
         # 2. 리샘플링으로 길이 보정
         target_length = len(audio)
         if len(stretched) != target_length:
-            stretched = librosa.resample(
+            stretched = _resample(
                 stretched,
                 orig_sr=sample_rate,
                 target_sr=int(sample_rate / rate),
@@ -119,6 +159,9 @@ class PitchAdjuster:
         Returns:
             피치가 조정된 소스 오디오
         """
+        source_audio = np.asarray(source_audio, dtype=np.float32)
+        target_audio = np.asarray(target_audio, dtype=np.float32)
+
         # 피치 추출
         source_f0, _, _ = self._extract_pitch(source_audio, sample_rate)
         target_f0, _, _ = self._extract_pitch(target_audio, sample_rate)
@@ -155,10 +198,10 @@ class PitchAdjuster:
             (f0, voiced_flag, voiced_probs) 튜플
         """
         # librosa.pyin 사용 (더 정확한 피치 추출)
-        f0, voiced_flag, voiced_probs = librosa.pyin(
+        f0, voiced_flag, voiced_probs = _pyin(
             audio,
-            fmin=librosa.note_to_hz("C2"),  # 약 65Hz
-            fmax=librosa.note_to_hz("C7"),  # 약 2093Hz
+            fmin=PYIN_FMIN,
+            fmax=PYIN_FMAX,
             sr=sample_rate,
         )
 
@@ -173,18 +216,16 @@ class PitchAdjuster:
         Returns:
             (min_pitch, max_pitch, mean_pitch) 튜플 (Hz 단위)
         """
+        audio = np.asarray(audio, dtype=np.float32)
+
         f0, _, _ = self._extract_pitch(audio, sample_rate)
 
-        # 유효한 피치만 선택
-        valid_f0 = f0[f0 > 0]
+        # 유효한 피치만 대상으로 단일 패스 통계
+        count, mean_pitch, _, min_pitch, max_pitch = _pitch_stats(f0)
 
-        if len(valid_f0) == 0:
+        if count == 0:
             return (0, 0, 0)
 
-        min_pitch = np.min(valid_f0)
-        max_pitch = np.max(valid_f0)
-        mean_pitch = np.mean(valid_f0)
-
         return (min_pitch, max_pitch, mean_pitch)
 
     def __repr__(self) -> str:
@@ -8,14 +8,19 @@ import logging
 from typing import Optional
 
 import numpy as np
-import librosa
+from librosa import pyin as _pyin, stft as _stft
+from librosa.feature import rms as _rms
 from scipy import interpolate
 
-from core.synthesis.pitch import PitchAdjuster
+from core.synthesis.pitch import PitchAdjuster, PYIN_FMIN, PYIN_FMAX, _pitch_stats
 from core.synthesis.tempo import TempoAdjuster
 
 logger = logging.getLogger(__name__)
 
+# 프로소디 특징 추출용 프레임 설정 (에너지 RMS와 템포 STFT가 공유)
+PROSODY_N_FFT = 2048
+PROSODY_HOP_LENGTH = 512
+
 
 class ProsodyMatcher:
     """프로소디 매칭 클래스"""
@@ -59,9 +64,13 @@ class ProsodyMatcher:
             sample_rate: 샘플링 레이트
 
         Returns:
-            프로소디가 조정된 소스 오디오
+            프로소디가 조정된 소스 오디오 (조정이 없으면 입력 배열 그대로)
         """
-        adjusted = source_audio.copy()
+        source_audio = np.asarray(source_audio, dtype=np.float32)
+        target_audio = np.asarray(target_audio, dtype=np.float32)
+
+        # 하위 단계가 모두 새 배열을 반환하므로 방어적 복사는 하지 않음
+        adjusted = source_audio
 
         # 1. 길이 매칭
         if self.match_duration:
@@ -104,10 +113,10 @@ class ProsodyMatcher:
         frame_length = 2048
         hop_length = 512
 
-        source_rms = librosa.feature.rms(
+        source_rms = _rms(
             y=source_audio, frame_length=frame_length, hop_length=hop_length
         )[0]
-        target_rms = librosa.feature.rms(
+        target_rms = _rms(
             y=target_audio, frame_length=frame_length, hop_length=hop_length
         )[0]
 
@@ -137,18 +146,22 @@ class ProsodyMatcher:
                 mode="edge",
             )
 
-        # 에너지 조정 적용
-        adjusted = source_audio * energy_ratio_full
+        # 에너지 조정 적용 (출력 버퍼 하나만 할당, 입력은 변경하지 않음)
+        adjusted = np.empty(source_audio.shape, dtype=np.float32)
+        np.multiply(source_audio, energy_ratio_full, out=adjusted, casting="same_kind")
 
         # 클리핑 방지
         max_val = np.abs(adjusted).max()
         if max_val > 1.0:
-            adjusted = adjusted / max_val * 0.99
+            adjusted *= 0.99 / max_val
 
         return adjusted
 
     def extract_prosody_features(
-        self, audio: np.ndarray, sample_rate: int
+        self,
+        audio: np.ndarray,
+        sample_rate: int,
+        compute_tempo: bool = False,
     ) -> dict:
         """
         프로소디 특징 추출
@@ -156,38 +169,48 @@ class ProsodyMatcher:
         Args:
             audio: 오디오 데이터
             sample_rate: 샘플링 레이트
+            compute_tempo: 템포(BPM) 추정 여부 (onset 계산 비용이 큼)
 
         Returns:
-            프로소디 특징 딕셔너리
+            프로소디 특징 딕셔너리 (compute_tempo=True일 때만 "tempo" 포함)
         """
+        audio = np.asarray(audio, dtype=np.float32)
+
         # 피치
-        f0, voiced_flag, voiced_probs = librosa.pyin(
+        f0, voiced_flag, voiced_probs = _pyin(
             audio,
-            fmin=librosa.note_to_hz("C2"),
-            fmax=librosa.note_to_hz("C7"),
+            fmin=PYIN_FMIN,
+            fmax=PYIN_FMAX,
             sr=sample_rate,
         )
 
-        # 에너지
-        rms = librosa.feature.rms(y=audio)[0]
+        # 에너지 (compute_tempo와 관계없이 항상 파형 RMS로 계산해 특징끼리 비교 가능)
+        rms = _rms(y=audio, frame_length=PROSODY_N_FFT, hop_length=PROSODY_HOP_LENGTH)[0]
 
-        # 템포
-        tempo = self.tempo_adjuster.estimate_tempo(audio, sample_rate)
+        tempo = None
+        if compute_tempo:
+            # 템포 (STFT는 템포가 필요할 때만 계산)
+            magnitude = np.abs(
+                _stft(audio, n_fft=PROSODY_N_FFT, hop_length=PROSODY_HOP_LENGTH)
+            )
+            tempo = self.tempo_adjuster.estimate_tempo(audio, sample_rate, S=magnitude)
 
-        # 통계
-        valid_f0 = f0[f0 > 0]
+        # 통계 (유효 피치 단일 패스)
+        count, pitch_mean, pitch_std, pitch_min, pitch_max = _pitch_stats(f0)
         features = {
-            "pitch_mean": np.mean(valid_f0) if len(valid_f0) > 0 else 0,
-            "pitch_std": np.std(valid_f0) if len(valid_f0) > 0 else 0,
-            "pitch_min": np.min(valid_f0) if len(valid_f0) > 0 else 0,
-            "pitch_max": np.max(valid_f0) if len(valid_f0) > 0 else 0,
+            "pitch_mean": pitch_mean if count > 0 else 0,
+            "pitch_std": pitch_std if count > 0 else 0,
+            "pitch_min": pitch_min if count > 0 else 0,
+            "pitch_max": pitch_max if count > 0 else 0,
             "energy_mean": np.mean(rms),
             "energy_std": np.std(rms),
-            "tempo": tempo,
             "duration": len(audio) / sample_rate,
             "voiced_ratio": np.sum(voiced_flag) / len(voiced_flag),
         }
 
+        if tempo is not None:
+            features["tempo"] = tempo
+
         return features
 
     def compare_prosody(
@@ -195,6 +218,7 @@ class ProsodyMatcher:
         audio1: np.ndarray,
         audio2: np.ndarray,
         sample_rate: int,
+        compute_tempo: bool = True,
     ) -> dict:
         """
         두 오디오의 프로소디 비교
@@ -203,12 +227,20 @@ class ProsodyMatcher:
             audio1: 첫 번째 오디오
             audio2: 두 번째 오디오
             sample_rate: 샘플링 레이트
+            compute_tempo: 템포 비교 포함 여부
 
         Returns:
             비교 결과 딕셔너리
         """
-        features1 = self.extract_prosody_features(audio1, sample_rate)
-        features2 = self.extract_prosody_features(audio2, sample_rate)
+        audio1 = np.asarray(audio1, dtype=np.float32)
+        audio2 = np.asarray(audio2, dtype=np.float32)
+
+        features1 = self.extract_prosody_features(
+            audio1, sample_rate, compute_tempo=compute_tempo
+        )
+        features2 = self.extract_prosody_features(
+            audio2, sample_rate, compute_tempo=compute_tempo
+        )
 
         comparison = {}
         for key in features1.keys():
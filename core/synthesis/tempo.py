@@ -8,7 +8,13 @@ import logging
 from typing import Optional
 
 import numpy as np
-import librosa
+from librosa import frames_to_time as _frames_to_time, resample as _resample
+from librosa import power_to_db as _power_to_db
+from librosa.beat import beat_track as _beat_track
+from librosa.effects import time_stretch as _time_stretch
+from librosa.feature import melspectrogram as _melspectrogram
+from librosa.feature.rhythm import tempo as _tempo
+from librosa.onset import onset_strength as _onset_strength
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +51,8 @@ class TempoAdjuster:
         Returns:
             템포가 조정된 오디오
         """
+        audio = np.asarray(audio, dtype=np.float32)
+
         if abs(rate - 1.0) < 0.01:
             # 변화가 거의 없으면 원본 반환
             return audio
@@ -53,10 +61,10 @@ class TempoAdjuster:
 
         if self.preserve_pitch:
             # 피치 보존하며 템포 조정
-            adjusted = librosa.effects.time_stretch(audio, rate=rate)
+            adjusted = _time_stretch(audio, rate=rate)
         else:
             # 리샘플링으로 템포 조정 (피치도 변경됨)
-            adjusted = librosa.resample(
+            adjusted = _resample(
                 audio, orig_sr=sample_rate, target_sr=int(sample_rate * rate)
             )
 
@@ -79,6 +87,8 @@ class TempoAdjuster:
         Returns:
             길이가 조정된 오디오
         """
+        audio = np.asarray(audio, dtype=np.float32)
+
         current_duration = len(audio) / sample_rate
         rate = current_duration / target_duration
 
@@ -106,6 +116,9 @@ class TempoAdjuster:
         Returns:
             템포가 조정된 소스 오디오
         """
+        source_audio = np.asarray(source_audio, dtype=np.float32)
+        target_audio = np.asarray(target_audio, dtype=np.float32)
+
         # 길이 비율 계산
         source_duration = len(source_audio) / sample_rate
         target_duration = len(target_audio) / sample_rate
@@ -115,29 +128,67 @@ class TempoAdjuster:
 
         return adjusted
 
-    def estimate_tempo(self, audio: np.ndarray, sample_rate: int) -> float:
+    def compute_onset_envelope(
+        self,
+        audio: np.ndarray,
+        sample_rate: int,
+        S: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Onset strength 엔벨로프 계산
+
+        템포 추정과 비트 검출이 같은 엔벨로프를 공유할 수 있도록 분리되어 있습니다.
+
+        Args:
+            audio: 오디오 데이터
+            sample_rate: 샘플링 레이트
+            S: 미리 계산된 크기 스펙트로그램 (n_fft=2048, hop_length=512, 옵션)
+
+        Returns:
+            Onset strength 엔벨로프
+        """
+        # 스펙트로그램이 있으면 STFT 재계산 생략
+        if S is None:
+            audio = np.asarray(audio, dtype=np.float32)
+            return _onset_strength(y=audio, sr=sample_rate)
+
+        mel_db = _power_to_db(_melspectrogram(S=S**2, sr=sample_rate))
+        return _onset_strength(S=mel_db, sr=sample_rate)
+
+    def estimate_tempo(
+        self,
+        audio: np.ndarray,
+        sample_rate: int,
+        S: Optional[np.ndarray] = None,
+        onset_envelope: Optional[np.ndarray] = None,
+    ) -> float:
         """
         템포 추정 (BPM)
 
         Args:
             audio: 오디오 데이터
             sample_rate: 샘플링 레이트
+            S: 미리 계산된 크기 스펙트로그램 (n_fft=2048, hop_length=512, 옵션)
+            onset_envelope: 미리 계산된 onset strength 엔벨로프 (옵션)
 
         Returns:
             추정된 BPM
         """
-        # Onset strength 계산
-        onset_env = librosa.onset.onset_strength(y=audio, sr=sample_rate)
+        if onset_envelope is None:
+            onset_envelope = self.compute_onset_envelope(audio, sample_rate, S=S)
 
         # Tempogram 기반 템포 추정
-        tempo = librosa.feature.rhythm.tempo(onset_envelope=onset_env, sr=sample_rate)[0]
+        tempo = _tempo(onset_envelope=onset_envelope, sr=sample_rate)[0]
 
         logger.debug(f"템포 추정: {tempo:.1f} BPM")
 
         return float(tempo)
 
     def detect_beats(
-        self, audio: np.ndarray, sample_rate: int
+        self,
+        audio: np.ndarray,
+        sample_rate: int,
+        onset_envelope: Optional[np.ndarray] = None,
     ) -> tuple:
         """
         비트 검출
@@ -145,15 +196,24 @@ class TempoAdjuster:
         Args:
             audio: 오디오 데이터
             sample_rate: 샘플링 레이트
+            onset_envelope: 미리 계산된 onset strength 엔벨로프 (옵션)
 
         Returns:
-            (tempo, beat_frames) 튜플
+            (tempo, beat_times) 튜플
         """
-        # 비트 트래킹
-        tempo, beat_frames = librosa.beat.beat_track(y=audio, sr=sample_rate)
+        # Onset은 한 번만 계산하여 템포 추정과 비트 트래킹이 공유
+        if onset_envelope is None:
+            onset_envelope = self.compute_onset_envelope(audio, sample_rate)
+
+        tempo = self.estimate_tempo(audio, sample_rate, onset_envelope=onset_envelope)
+
+        # 비트 트래킹 (템포를 넘겨 내부 재추정 생략)
+        _, beat_frames = _beat_track(
+            onset_envelope=onset_envelope, sr=sample_rate, bpm=tempo
+        )
 
         # 프레임을 시간으로 변환
-        beat_times = librosa.frames_to_time(beat_frames, sr=sample_rate)
+        beat_times = _frames_to_time(beat_frames, sr=sample_rate)
 
         logger.debug(f"비트 검출: {len(beat_frames)}개 비트, {tempo:.1f} BPM")
 
@@ -8,10 +8,12 @@ from .base import BaseTTSEngine
 from .pipeline import TTSPipeline
 from .preprocessing import TextPreprocessor
 from .batch import BatchTTSProcessor
+from .server import TTSServer
 
 __all__ = [
     "BaseTTSEngine",
     "TTSPipeline",
     "TextPreprocessor",
     "BatchTTSProcessor",
+    "TTSServer",
 ]
@@ -6,13 +6,12 @@ Microsoft Edge TTS 백엔드
 
 import logging
 from pathlib import Path
-from typing import Optional
-import tempfile
+from typing import Optional, List
+import io
 import asyncio
+import threading
 
-import numpy as np
-import soundfile as sf
-
+from core.audio.bufferpool import read_mono
 from core.tts.base import BaseTTSEngine
 
 logger = logging.getLogger(__name__)
@@ -21,6 +20,13 @@ logger = logging.getLogger(__name__)
 class EdgeTTSBackend(BaseTTSEngine):
     """Edge-TTS 백엔드"""
 
+    # 모든 인스턴스가 공유하는 백그라운드 이벤트 루프 (호출마다 asyncio.run 방지)
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _loop_lock = threading.Lock()
+
+    # 배치 합성 시 기본 동시 요청 수 (서버 rate limit 방지)
+    DEFAULT_MAX_CONCURRENCY = 8
+
     def __init__(
         self,
         language: str = "ko-KR",
@@ -67,6 +73,7 @@ class EdgeTTSBackend(BaseTTSEngine):
         self,
         text: str,
         output_path: Optional[Path] = None,
+        return_array: bool = True,
     ) -> tuple:
         """
         텍스트를 음성으로 합성
@@ -74,6 +81,8 @@ class EdgeTTSBackend(BaseTTSEngine):
         Args:
             text: 합성할 텍스트
             output_path: 출력 파일 경로
+            return_array: 오디오 배열 반환 여부 (False면 디코딩을 생략하고
+                (None, None) 반환, output_path가 필요함)
 
         Returns:
             (audio_data, sample_rate) 튜플
@@ -81,32 +90,109 @@ class EdgeTTSBackend(BaseTTSEngine):
         if not self.validate_text(text):
             raise ValueError("유효하지 않은 텍스트입니다")
 
+        if not return_array and output_path is None:
+            raise ValueError("return_array=False이면 output_path가 필요합니다")
+
         logger.info(f"Edge-TTS 합성 시작: {len(text)}자")
 
-        # 임시 파일 또는 지정된 경로에 저장
-        if output_path is None:
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".mp3")
-            output_path = Path(temp_file.name)
-            temp_file.close()
+        # 비동기 TTS 실행 (MP3 바이트를 메모리로 수신)
+        mp3_bytes = self._run_async(self._async_synthesize(text))
+
+        # 호출자가 경로를 지정한 경우에만 파일로 저장
+        if output_path is not None:
+            with open(output_path, "wb") as f:
+                f.write(mp3_bytes)
+            logger.info(f"Edge-TTS 합성 완료: {output_path}")
+        else:
+            logger.info(f"Edge-TTS 합성 완료: {len(mp3_bytes)} bytes")
+
+        if not return_array:
+            return None, None
+
+        # 메모리에서 바로 디코딩 (풀 버퍼에 모노로)
+        return read_mono(io.BytesIO(mp3_bytes))
+
+    def synthesize_batch(
+        self,
+        texts: List[str],
+        output_paths: Optional[List[Path]] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[tuple]:
+        """
+        여러 텍스트를 동시에 합성
+
+        Edge-TTS는 네트워크 지연이 대부분이므로 공유 이벤트 루프에서
+        요청을 동시에 보내 전체 소요 시간을 줄입니다.
 
-        output_path = Path(output_path)
+        Args:
+            texts: 합성할 텍스트 리스트
+            output_paths: 출력 파일 경로 리스트 (옵션, texts와 같은 길이)
+            max_concurrency: 최대 동시 요청 수
+
+        Returns:
+            (audio_data, sample_rate) 튜플 리스트 (입력 순서 유지)
+        """
+        if output_paths is not None and len(output_paths) != len(texts):
+            raise ValueError("texts와 output_paths의 길이가 다릅니다")
+
+        for text in texts:
+            if not self.validate_text(text):
+                raise ValueError("유효하지 않은 텍스트입니다")
+
+        logger.info(f"Edge-TTS 배치 합성 시작: {len(texts)}개, 동시성={max_concurrency}")
 
-        # 비동기 TTS 실행
-        asyncio.run(self._async_synthesize(text, output_path))
+        mp3_list = self._run_async(self._async_synthesize_many(texts, max_concurrency))
 
-        logger.info(f"Edge-TTS 합성 완료: {output_path}")
+        results = []
+        for i, mp3_bytes in enumerate(mp3_list):
+            if output_paths is not None:
+                with open(output_paths[i], "wb") as f:
+                    f.write(mp3_bytes)
 
-        # 오디오 로드
-        audio_data, sample_rate = sf.read(output_path)
+            results.append(read_mono(io.BytesIO(mp3_bytes)))
 
-        # 모노 변환
-        if audio_data.ndim > 1:
-            audio_data = np.mean(audio_data, axis=1)
+        logger.info(f"Edge-TTS 배치 합성 완료: {len(results)}개")
 
-        return audio_data, sample_rate
+        return results
 
-    async def _async_synthesize(self, text: str, output_path: Path):
-        """비동기 TTS 합성"""
+    @classmethod
+    def _get_loop(cls) -> asyncio.AbstractEventLoop:
+        """
+        공유 이벤트 루프 반환
+
+        최초 호출 시 데몬 스레드에서 루프를 시작하고 이후 호출에서 재사용합니다.
+        """
+        with cls._loop_lock:
+            if cls._loop is None or cls._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="edge-tts-loop", daemon=True
+                )
+                thread.start()
+                cls._loop = loop
+                logger.debug("Edge-TTS 이벤트 루프 시작")
+
+        return cls._loop
+
+    def _run_async(self, coro):
+        """공유 이벤트 루프에서 코루틴을 실행하고 결과를 기다림"""
+        future = asyncio.run_coroutine_threadsafe(coro, self._get_loop())
+        return future.result()
+
+    async def _async_synthesize_many(
+        self, texts: List[str], max_concurrency: int
+    ) -> List[bytes]:
+        """세마포어로 동시성을 제한하며 여러 텍스트를 비동기 합성"""
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def bounded(text: str) -> bytes:
+            async with semaphore:
+                return await self._async_synthesize(text)
+
+        return await asyncio.gather(*(bounded(text) for text in texts))
+
+    async def _async_synthesize(self, text: str) -> bytes:
+        """비동기 TTS 합성 (MP3 바이트 반환)"""
         # 속도 및 피치를 SSML 형식 문자열로 변환
         # rate: +50%, -25% 형식 (100% = 1.0x)
         rate_percent = int((self.speech_rate - 1.0) * 100)
@@ -123,7 +209,13 @@ class EdgeTTSBackend(BaseTTSEngine):
         communicate = self.edge_tts.Communicate(
             text, self.voice, rate=rate_str, pitch=pitch_str, volume=volume_str
         )
-        await communicate.save(str(output_path))
+
+        buffer = io.BytesIO()
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                buffer.write(chunk["data"])
+
+        return buffer.getvalue()
 
     def get_available_voices(self) -> list:
         """사용 가능한 음성 목록"""
@@ -7,15 +7,85 @@ Google Text-to-Speech 백엔드
 import logging
 from pathlib import Path
 from typing import Optional
-import tempfile
+from collections import OrderedDict
+import base64
+import functools
+import hashlib
+import io
+import re
+import threading
+import urllib.request
 
 import numpy as np
 import soundfile as sf
 
+from core.audio.bufferpool import get_buffer_pool
 from core.tts.base import BaseTTSEngine
 
+# PyAV는 선택적 의존성 (설치 시 ffmpeg로 MP3 디코딩)
+try:
+    import av
+    AV_AVAILABLE = True
+except ImportError:
+    AV_AVAILABLE = False
+    av = None
+
 logger = logging.getLogger(__name__)
 
+# gTTS 응답에서 base64 오디오를 찾는 패턴 (gtts.tts.gTTS.stream과 동일)
+_RE_AUDIO = re.compile(r'jQ1olc","\[\\"(.*)\\"]')
+
+
+def _make_pooled_gtts(gTTS):
+    """
+    공유 requests.Session으로 요청하는 gTTS 하위 클래스 생성
+
+    gTTS.stream()은 텍스트 조각마다 새 Session을 열고 닫으므로 매번
+    TCP/TLS 연결을 새로 맺습니다. stream()만 재정의해 keep-alive 연결을
+    재사용하고, 요청 준비와 오류 처리는 gTTS의 것을 그대로 사용합니다.
+    내부 API(_prepare_requests)가 없는 gTTS 버전에서는 기본 stream()을 사용합니다.
+    """
+    import requests
+    from gtts.tts import gTTSError
+
+    class PooledGTTS(gTTS):
+        def __init__(self, *args, session: requests.Session, **kwargs):
+            super().__init__(*args, **kwargs)
+            self._session = session
+
+        def stream(self):
+            if not hasattr(self, "_prepare_requests"):
+                yield from super().stream()
+                return
+
+            for idx, pr in enumerate(self._prepare_requests()):
+                try:
+                    r = self._session.send(
+                        request=pr,
+                        verify=False,
+                        proxies=urllib.request.getproxies(),
+                        timeout=getattr(self, "timeout", None),
+                    )
+                    r.raise_for_status()
+                except requests.exceptions.HTTPError:
+                    raise gTTSError(tts=self, response=r)
+                except requests.exceptions.RequestException:
+                    raise gTTSError(tts=self)
+
+                for line in r.iter_lines(chunk_size=1024):
+                    decoded_line = line.decode("utf-8")
+                    if "jQ1olc" in decoded_line:
+                        audio_search = _RE_AUDIO.search(decoded_line)
+                        if audio_search:
+                            yield base64.b64decode(audio_search.group(1).encode("ascii"))
+                        else:
+                            # 응답은 성공했지만 오디오가 없는 경우
+                            raise gTTSError(tts=self, response=r)
+
+                logger.debug(f"gTTS part-{idx} 수신")
+
+    return PooledGTTS
+
 
 class GTTSBackend(BaseTTSEngine):
     """gTTS 백엔드"""
@@ -25,6 +95,8 @@ class GTTSBackend(BaseTTSEngine):
         language: str = "ko",
         tld: str = "com",
         slow: bool = False,
+        cache_dir: Optional[Path] = None,
+        cache_size: int = 256,
         **kwargs,
     ):
         """
@@ -32,15 +104,34 @@ class GTTSBackend(BaseTTSEngine):
             language: 언어 코드
             tld: 도메인 (com, co.kr, co.uk 등)
             slow: 느린 음성 여부
+            cache_dir: 디스크 캐시 디렉토리 (None이면 디스크 캐시 비활성화)
+            cache_size: 메모리 캐시 최대 항목 수 (0이면 메모리 캐시 비활성화)
         """
         super().__init__(language=language, **kwargs)
         self.tld = tld
         self.slow = slow
 
+        # 합성 결과 캐시 (key -> (audio_data, sample_rate, mp3_bytes))
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.cache_size = cache_size
+        self._mem_cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
         # gTTS 지연 로드
         try:
             from gtts import gTTS
-            self.gTTS = gTTS
+            import requests
+            import urllib3
+
+            # 모든 합성 요청이 공유하는 keep-alive 세션
+            self._session = requests.Session()
+            self.gTTS = functools.partial(_make_pooled_gtts(gTTS), session=self._session)
+
+            # gTTS와 동일하게 verify=False 경고 비활성화
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
             logger.info("gTTS 로드 성공")
         except ImportError:
             logger.error("gTTS를 설치해야 합니다: pip install gtts")
@@ -50,6 +141,7 @@ class GTTSBackend(BaseTTSEngine):
         self,
         text: str,
         output_path: Optional[Path] = None,
+        return_array: bool = True,
     ) -> tuple:
         """
         텍스트를 음성으로 합성
@@ -57,6 +149,8 @@ class GTTSBackend(BaseTTSEngine):
         Args:
             text: 합성할 텍스트
             output_path: 출력 파일 경로
+            return_array: 오디오 배열 반환 여부 (False면 디코딩을 생략하고
+                (None, None) 반환, output_path가 필요함)
 
         Returns:
             (audio_data, sample_rate) 튜플
@@ -64,36 +158,163 @@ class GTTSBackend(BaseTTSEngine):
         if not self.validate_text(text):
             raise ValueError("유효하지 않은 텍스트입니다")
 
-        logger.info(f"gTTS 합성 시작: {len(text)}자")
+        if not return_array and output_path is None:
+            raise ValueError("return_array=False이면 output_path가 필요합니다")
+
+        key = self._cache_key(text)
+        cached = self._cache_get(key)
+
+        if cached is not None:
+            audio_data, sample_rate, mp3_bytes = cached
+            logger.info(f"gTTS 캐시 사용: {key[:8]}")
+        else:
+            logger.info(f"gTTS 합성 시작: {len(text)}자")
 
-        # gTTS 객체 생성
-        tts = self.gTTS(
-            text=text,
-            lang=self.language,
-            tld=self.tld,
-            slow=self.slow,
-        )
+            # gTTS 객체 생성
+            tts = self.gTTS(
+                text=text,
+                lang=self.language,
+                tld=self.tld,
+                slow=self.slow,
+            )
 
-        # 임시 파일 또는 지정된 경로에 저장
-        if output_path is None:
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".mp3")
-            output_path = Path(temp_file.name)
-            temp_file.close()
+            # MP3 바이트를 메모리로 수신
+            buffer = io.BytesIO()
+            tts.write_to_fp(buffer)
+            mp3_bytes = buffer.getvalue()
 
-        output_path = Path(output_path)
-        tts.save(str(output_path))
+            logger.info(f"gTTS 합성 완료: {len(mp3_bytes)} bytes")
 
-        logger.info(f"gTTS 합성 완료: {output_path}")
+            if return_array:
+                audio_data, sample_rate = self._decode(mp3_bytes)
+                self._cache_put(key, audio_data, sample_rate, mp3_bytes)
+            else:
+                # 디코딩하지 않으므로 디스크 캐시에만 저장
+                self._cache_put_disk(key, mp3_bytes)
 
-        # 오디오 로드
-        audio_data, sample_rate = sf.read(output_path)
+        # 호출자가 경로를 지정한 경우에만 파일로 저장
+        if output_path is not None:
+            with open(output_path, "wb") as f:
+                f.write(mp3_bytes)
+            logger.info(f"gTTS 결과 저장: {output_path}")
+
+        if not return_array:
+            return None, None
+
+        # 캐시된 배열이 호출자에 의해 수정되지 않도록 풀 버퍼에 복사해 반환
+        result = get_buffer_pool().get(len(audio_data))
+        np.copyto(result, audio_data)
+        return result, sample_rate
+
+    @staticmethod
+    def _decode(mp3_bytes: bytes) -> tuple:
+        """MP3 바이트를 메모리에서 디코딩 (모노 변환 포함)"""
+        if AV_AVAILABLE:
+            try:
+                return GTTSBackend._decode_av(mp3_bytes)
+            except Exception as e:
+                logger.warning(f"PyAV 디코딩 실패, soundfile로 재시도: {e}")
+
+        audio_data, sample_rate = sf.read(io.BytesIO(mp3_bytes), dtype="float32")
 
         # 모노 변환
         if audio_data.ndim > 1:
-            audio_data = np.mean(audio_data, axis=1)
+            audio_data = audio_data.mean(axis=1, dtype=np.float32)
 
         return audio_data, sample_rate
 
+    @staticmethod
+    def _decode_av(mp3_bytes: bytes) -> tuple:
+        """PyAV(ffmpeg)로 MP3 바이트를 한 번에 디코딩"""
+        with av.open(io.BytesIO(mp3_bytes)) as container:
+            stream = container.streams.audio[0]
+            sample_rate = stream.rate
+
+            # 디코더 출력 포맷과 무관하게 planar float32로 통일
+            resampler = av.AudioResampler(format="fltp")
+            chunks = []
+            for frame in container.decode(stream):
+                chunks.extend(f.to_ndarray() for f in resampler.resample(frame))
+            chunks.extend(f.to_ndarray() for f in resampler.resample(None))
+
+        if not chunks:
+            return np.zeros(0, dtype=np.float32), sample_rate
+
+        # (channels, samples) → 모노
+        audio_data = np.concatenate(chunks, axis=1).mean(axis=0, dtype=np.float32)
+
+        return audio_data, sample_rate
+
+    def _cache_key(self, text: str) -> str:
+        """캐시 키 생성 (text, language, tld, slow)"""
+        raw = f"{text}|{self.language}|{self.tld}|{self.slow}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[tuple]:
+        """메모리 캐시 → 디스크 캐시 순으로 조회"""
+        with self._cache_lock:
+            cached = self._mem_cache.get(key)
+            if cached is not None:
+                self._mem_cache.move_to_end(key)
+                return cached
+
+        if self.cache_dir is None:
+            return None
+
+        cache_file = self.cache_dir / f"{key}.mp3"
+        try:
+            mp3_bytes = cache_file.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        audio_data, sample_rate = self._decode(mp3_bytes)
+        self._cache_put(key, audio_data, sample_rate, mp3_bytes, write_disk=False)
+        return audio_data, sample_rate, mp3_bytes
+
+    def _cache_put(
+        self,
+        key: str,
+        audio_data: np.ndarray,
+        sample_rate: int,
+        mp3_bytes: bytes,
+        write_disk: bool = True,
+    ):
+        """메모리 캐시(LRU)와 디스크 캐시에 저장"""
+        if self.cache_size > 0:
+            with self._cache_lock:
+                self._mem_cache[key] = (audio_data, sample_rate, mp3_bytes)
+                self._mem_cache.move_to_end(key)
+                while len(self._mem_cache) > self.cache_size:
+                    self._mem_cache.popitem(last=False)
+
+        if write_disk:
+            self._cache_put_disk(key, mp3_bytes)
+
+    def _cache_put_disk(self, key: str, mp3_bytes: bytes):
+        """디스크 캐시에 MP3 바이트 저장"""
+        if self.cache_dir is None:
+            return
+
+        try:
+            (self.cache_dir / f"{key}.mp3").write_bytes(mp3_bytes)
+        except OSError as e:
+            logger.warning(f"gTTS 디스크 캐시 저장 실패: {e}")
+
+    def close(self):
+        """HTTP 세션 종료"""
+        session = getattr(self, "_session", None)
+        if session is not None:
+            session.close()
+            self._session = None
+
+    def __del__(self):
+        self.close()
+
+    def clear_cache(self):
+        """메모리 캐시 비우기"""
+        with self._cache_lock:
+            self._mem_cache.clear()
+
     def get_available_voices(self) -> list:
         """사용 가능한 음성 목록 (gTTS는 언어만 지원)"""
         # gTTS는 다양한 언어를 지원하지만 음성 선택은 불가
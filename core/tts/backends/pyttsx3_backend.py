@@ -6,20 +6,58 @@ pyttsx3 Backend
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Optional, List
 import tempfile
+import threading
+import time
+import weakref
 
-import numpy as np
-import soundfile as sf
-
+from core.audio.bufferpool import read_mono
 from core.tts.base import BaseTTSEngine
 
 logger = logging.getLogger(__name__)
 
 
+class _DriverLoop:
+    """
+    pyttsx3 엔진 하나의 드라이버 루프 상태
+
+    pyttsx3.init()은 살아 있는 모든 호출자에게 같은 엔진을 돌려주므로
+    루프 시작 여부, 잠금, 완료 콜백은 백엔드 인스턴스가 아니라 엔진별로 하나만 둡니다.
+    """
+
+    def __init__(self, engine):
+        self.lock = threading.Lock()
+        self.started = False
+        self.finished_count = 0
+        engine.connect('finished-utterance', self._on_finished_utterance)
+
+    def _on_finished_utterance(self, name, completed):
+        """발화 완료 콜백"""
+        self.finished_count += 1
+
+
+# 엔진 -> _DriverLoop (엔진이 해제되면 함께 제거)
+_DRIVER_LOOPS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_DRIVER_LOOPS_LOCK = threading.Lock()
+
+
+def _driver_loop(engine) -> _DriverLoop:
+    """엔진의 드라이버 루프 상태 반환 (처음 요청 시 생성)"""
+    with _DRIVER_LOOPS_LOCK:
+        loop = _DRIVER_LOOPS.get(engine)
+        if loop is None:
+            loop = _DriverLoop(engine)
+            _DRIVER_LOOPS[engine] = loop
+        return loop
+
+
 class Pyttsx3Backend(BaseTTSEngine):
     """pyttsx3 백엔드 (오프라인)"""
 
+    # 발화 하나당 최대 대기 시간 (초)
+    UTTERANCE_TIMEOUT = 60.0
+
     def __init__(
         self,
         language: str = "ko",
@@ -44,13 +82,8 @@ class Pyttsx3Backend(BaseTTSEngine):
             self.engine = pyttsx3.init()
             logger.info("pyttsx3 로드 성공")
 
-            # 속도 및 볼륨 설정
-            self.engine.setProperty('rate', speech_rate)
-            self.engine.setProperty('volume', volume)
-
-            # 음성 설정
-            if voice:
-                self.engine.setProperty('voice', voice)
+            # 드라이버 루프를 엔진별로 한 번만 시작해 호출과 인스턴스 간 재사용
+            self._loop = _driver_loop(self.engine)
 
         except ImportError:
             logger.error("pyttsx3를 설치해야 합니다: pip install pyttsx3")
@@ -63,6 +96,7 @@ class Pyttsx3Backend(BaseTTSEngine):
         self,
         text: str,
         output_path: Optional[Path] = None,
+        return_array: bool = True,
     ) -> tuple:
         """
         텍스트를 음성으로 합성
@@ -70,6 +104,8 @@ class Pyttsx3Backend(BaseTTSEngine):
         Args:
             text: 합성할 텍스트
             output_path: 출력 파일 경로
+            return_array: 오디오 배열 반환 여부 (False면 디코딩을 생략하고
+                (None, None) 반환, output_path가 필요함)
 
         Returns:
             (audio_data, sample_rate) 튜플
@@ -77,30 +113,141 @@ class Pyttsx3Backend(BaseTTSEngine):
         if not self.validate_text(text):
             raise ValueError("유효하지 않은 텍스트입니다")
 
+        if not return_array and output_path is None:
+            raise ValueError("return_array=False이면 output_path가 필요합니다")
+
         logger.info(f"pyttsx3 합성 시작: {len(text)}자")
 
-        # 임시 파일 또는 지정된 경로에 저장
-        if output_path is None:
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
-            output_path = Path(temp_file.name)
-            temp_file.close()
+        # 지정된 경로 또는 블록 종료 시 삭제되는 임시 디렉토리에 저장
+        if output_path is not None:
+            return self._synthesize_to(text, output_path, return_array)
 
-        output_path = Path(output_path)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            return self._synthesize_to(text, Path(temp_dir) / "output.wav")
 
+    def _synthesize_to(
+        self,
+        text: str,
+        output_path,
+        return_array: bool = True,
+    ) -> tuple:
+        """지정된 WAV 경로(str 또는 Path)에 합성 후 로드"""
         # TTS 실행
-        self.engine.save_to_file(text, str(output_path))
-        self.engine.runAndWait()
+        with self._loop.lock:
+            self._apply_properties()
+            self.engine.save_to_file(text, str(output_path))
+            self._run_queued(1)
 
         logger.info(f"pyttsx3 합성 완료: {output_path}")
 
-        # 오디오 로드
-        audio_data, sample_rate = sf.read(output_path)
+        if not return_array:
+            return None, None
+
+        # 오디오 로드 (풀 버퍼에 모노로)
+        return read_mono(output_path)
+
+    def synthesize_batch(
+        self,
+        texts: List[str],
+        output_paths: Optional[List[Path]] = None,
+    ) -> List[tuple]:
+        """
+        여러 텍스트를 한 번의 드라이버 루프 진행으로 합성
+
+        모든 발화를 먼저 큐에 넣고 한꺼번에 처리하므로 드라이버
+        준비 비용(SAPI의 COM 활성화 등)이 항목 수만큼 반복되지 않습니다.
+
+        Args:
+            texts: 합성할 텍스트 리스트
+            output_paths: 출력 파일 경로 리스트 (옵션, texts와 같은 길이)
+
+        Returns:
+            (audio_data, sample_rate) 튜플 리스트 (입력 순서 유지)
+        """
+        if output_paths is not None and len(output_paths) != len(texts):
+            raise ValueError("texts와 output_paths의 길이가 다릅니다")
+
+        for text in texts:
+            if not self.validate_text(text):
+                raise ValueError("유효하지 않은 텍스트입니다")
+
+        if not texts:
+            return []
+
+        logger.info(f"pyttsx3 배치 합성 시작: {len(texts)}개")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            if output_paths is None:
+                paths = [Path(temp_dir) / f"{i:04d}.wav" for i in range(len(texts))]
+            else:
+                paths = list(output_paths)
+
+            # 모든 발화를 큐에 넣고 한 번에 처리
+            with self._loop.lock:
+                self._apply_properties()
+                for text, path in zip(texts, paths):
+                    self.engine.save_to_file(text, str(path))
+                self._run_queued(len(texts))
+
+            results = [read_mono(path) for path in paths]
+
+        logger.info(f"pyttsx3 배치 합성 완료: {len(results)}개")
+
+        return results
+
+    def set_voice_params(self, speech_rate: float, volume: float):
+        """
+        속도와 볼륨 변경 (다음 합성부터 적용)
+
+        Args:
+            speech_rate: 말하기 속도 (단어/분)
+            volume: 볼륨 (0.0~1.0)
+        """
+        self.speech_rate_wpm = speech_rate
+        self.volume = volume
+
+    def _apply_properties(self):
+        """
+        이 인스턴스의 속도, 볼륨, 음성을 공유 엔진에 설정
+
+        엔진 속성은 같은 엔진을 쓰는 모든 인스턴스가 공유하므로 합성마다
+        다시 설정합니다. 드라이버 루프 잠금을 잡은 상태로 호출해야 합니다.
+        """
+        self.engine.setProperty('rate', self.speech_rate_wpm)
+        self.engine.setProperty('volume', self.volume)
+        if self.voice:
+            self.engine.setProperty('voice', self.voice)
+
+    def _run_queued(self, count: int):
+        """
+        대기 중인 발화를 모두 처리할 때까지 드라이버 루프 진행
+
+        runAndWait()와 달리 루프를 종료하지 않으므로 다음 호출에서
+        드라이버를 다시 준비하지 않습니다. 드라이버 루프 잠금을 잡은 상태로 호출해야 합니다.
+
+        Args:
+            count: 완료를 기다릴 발화 수
+        """
+        loop = self._loop
+        if not loop.started:
+            self.engine.startLoop(False)
+            loop.started = True
+
+        loop.finished_count = 0
+        deadline = time.monotonic() + self.UTTERANCE_TIMEOUT * count
 
-        # 모노 변환
-        if audio_data.ndim > 1:
-            audio_data = np.mean(audio_data, axis=1)
+        while loop.finished_count < count:
+            self.engine.iterate()
+            if time.monotonic() > deadline:
+                raise TimeoutError("pyttsx3 합성 시간 초과")
+            time.sleep(0.001)
 
-        return audio_data, sample_rate
+    def close(self):
+        """드라이버 루프 종료 (같은 엔진을 쓰는 모든 인스턴스에 적용)"""
+        with self._loop.lock:
+            if self._loop.started:
+                self.engine.endLoop()
+                self._loop.started = False
 
     def get_available_voices(self) -> list:
         """사용 가능한 음성 목록"""
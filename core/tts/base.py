@@ -49,6 +49,7 @@ class BaseTTSEngine(ABC):
         self,
         text: str,
         output_path: Optional[Path] = None,
+        return_array: bool = True,
     ) -> tuple:
         """
         텍스트를 음성으로 합성
@@ -56,6 +57,8 @@ class BaseTTSEngine(ABC):
         Args:
             text: 합성할 텍스트
             output_path: 출력 파일 경로 (옵션)
+            return_array: 오디오 배열 반환 여부 (False면 디코딩을 생략하고
+                (None, None) 반환, output_path가 필요함)
 
         Returns:
             (audio_data, sample_rate) 튜플
@@ -82,14 +85,20 @@ class BaseTTSEngine(ABC):
         Returns:
             유효하면 True
         """
-        if not text or not text.strip():
+        if not text:
             logger.warning("빈 텍스트입니다")
             return False
 
+        # 길이 확인은 O(1)이므로 먼저 수행
         if len(text) > 5000:
             logger.warning("텍스트가 너무 깁니다 (5000자 초과)")
             return False
 
+        # isspace()는 첫 비공백 문자에서 멈추고 strip()처럼 복사본을 만들지 않음
+        if text.isspace():
+            logger.warning("빈 텍스트입니다")
+            return False
+
         return True
 
     def get_info(self) -> Dict[str, Any]:
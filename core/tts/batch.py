@@ -7,8 +7,16 @@ Batch TTS Processing
 import logging
 from pathlib import Path
 from typing import List, Optional
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+import multiprocessing as mp
 import time
 
+from core.audio.bufferpool import get_buffer_pool
 from core.tts.pipeline import TTSPipeline
 
 logger = logging.getLogger(__name__)
@@ -17,14 +25,27 @@ logger = logging.getLogger(__name__)
 class BatchTTSProcessor:
     """배치 TTS 처리 클래스"""
 
-    def __init__(self, pipeline: TTSPipeline):
+    def __init__(
+        self,
+        pipeline: TTSPipeline,
+        max_workers: Optional[int] = None,
+        use_processes: bool = False,
+    ):
         """
         Args:
             pipeline: TTS 파이프라인
+            max_workers: 최대 워커 수 (None이면 CPU 코어 수)
+            use_processes: 프로세스 사용 여부 (False면 스레드 사용,
+                True면 파이프라인이 pickle 가능해야 함)
         """
         self.pipeline = pipeline
+        self.max_workers = max_workers or mp.cpu_count()
+        self.use_processes = use_processes
 
-        logger.info("BatchTTSProcessor 초기화")
+        logger.info(
+            f"BatchTTSProcessor 초기화: max_workers={self.max_workers}, "
+            f"use_processes={self.use_processes}"
+        )
 
     def process_texts(
         self,
@@ -57,39 +78,104 @@ class BatchTTSProcessor:
 
         logger.info(f"배치 처리 시작: {len(texts)}개 텍스트")
 
-        for i, text in enumerate(texts, 1):
-            logger.info(f"처리 중 ({i}/{len(texts)}): {text[:50]}...")
+        # 백엔드가 배치 합성을 지원하면 TTS를 한 번에 실행
+        preprocess_text = synthesis_kwargs.pop("preprocess_text", True)
+        targets = self._synthesize_targets(texts, preprocess_text)
+
+        # Executor 선택: TTS(네트워크)는 스레드, 콜라주(CPU)는 executor_class
+        executor_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+        max_workers = max(1, min(self.max_workers, len(texts)))
+        # 동시에 처리 중인 항목 수 제한 (콜라주 대기 중인 TTS 결과가 쌓이지 않도록)
+        max_in_flight = max_workers * 2
+
+        # 접두사 경로는 한 번만 만들고 항목별로는 문자열 포맷만 수행
+        prefix = str(output_dir / output_prefix)
+        output_paths = [Path(f"{prefix}_{i:03d}.wav") for i in range(1, len(texts) + 1)]
 
-            # 출력 파일 경로
-            output_path = output_dir / f"{output_prefix}_{i:03d}.wav"
+        with ThreadPoolExecutor(max_workers=max_workers) as tts_executor, \
+                executor_class(max_workers=max_workers) as collage_executor:
+            # future -> (단계, 항목 인덱스, 타겟 오디오)
+            stages = {}
+            next_index = 0
+            completed = 0
 
-            try:
-                # TTS-to-Collage 실행
-                metadata = self.pipeline.synthesize_collage(
-                    text=text,
+            def submit_collage(index, processed_text, target):
+                target_audio, target_sr = target
+                future = collage_executor.submit(
+                    self.pipeline.synthesize_collage_from_target,
+                    text=texts[index],
+                    processed_text=processed_text,
+                    target_audio=target_audio,
+                    target_sr=target_sr,
                     source_files=source_files,
-                    output_path=output_path,
+                    output_path=output_paths[index],
                     **synthesis_kwargs,
                 )
+                stages[future] = ("collage", index, target_audio)
+
+            def submit_next():
+                nonlocal next_index
+                if next_index >= len(texts):
+                    return
+                index = next_index
+                next_index += 1
+
+                logger.info(f"처리 중 ({index + 1}/{len(texts)}): {texts[index][:50]}...")
+
+                if targets is not None:
+                    # 콜라주만 실행 (TTS는 배치로 완료됨)
+                    submit_collage(index, *targets[index])
+                else:
+                    future = tts_executor.submit(
+                        self._synthesize_target, texts[index], preprocess_text
+                    )
+                    stages[future] = ("tts", index, None)
+
+            for _ in range(max_in_flight):
+                submit_next()
 
-                metadata["index"] = i
-                metadata["success"] = True
+            while stages:
+                done, _ = wait(stages, return_when=FIRST_COMPLETED)
 
-                results.append(metadata)
+                for future in done:
+                    stage, index, target_audio = stages.pop(future)
+                    i = index + 1
 
-                if show_progress:
-                    progress = i / len(texts) * 100
-                    print(f"[{progress:5.1f}%] 완료: {output_path}")
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.error(f"처리 실패 ({i}/{len(texts)}): {str(e)}")
 
-            except Exception as e:
-                logger.error(f"처리 실패 ({i}/{len(texts)}): {str(e)}")
+                        results.append({
+                            "index": i,
+                            "text": texts[index],
+                            "success": False,
+                            "error": str(e),
+                        })
+                    else:
+                        if stage == "tts":
+                            # TTS 완료 즉시 콜라주 단계로 (다른 항목의 TTS와 겹쳐 실행)
+                            submit_collage(index, *result)
+                            continue
 
-                results.append({
-                    "index": i,
-                    "text": text,
-                    "success": False,
-                    "error": str(e),
-                })
+                        result["index"] = i
+                        result["success"] = True
+
+                        results.append(result)
+
+                        if show_progress:
+                            progress = (completed + 1) / len(texts) * 100
+                            print(f"[{progress:5.1f}%] 완료: {output_paths[index]}")
+
+                    if target_audio is not None:
+                        # 콜라주가 끝난 타겟 버퍼 반납
+                        get_buffer_pool().put(target_audio)
+
+                    completed += 1
+                    submit_next()
+
+        # 입력 순서대로 정렬
+        results.sort(key=lambda r: r["index"])
 
         total_time = time.time() - start_time
         success_count = sum(1 for r in results if r.get("success", False))
@@ -101,6 +187,55 @@ class BatchTTSProcessor:
 
         return results
 
+    def _synthesize_target(self, text: str, preprocess_text: bool) -> tuple:
+        """
+        한 항목의 TTS 실행 (TTS 단계)
+
+        Args:
+            text: 입력 텍스트
+            preprocess_text: 텍스트 전처리 여부
+
+        Returns:
+            (processed_text, (audio_data, sample_rate)) 튜플
+        """
+        processed_text = self.pipeline.prepare_text(text, preprocess_text)
+        target = self.pipeline.tts_engine.synthesize(processed_text, output_path=None)
+
+        return processed_text, target
+
+    def _synthesize_targets(
+        self,
+        texts: List[str],
+        preprocess_text: bool,
+    ) -> Optional[List[tuple]]:
+        """
+        백엔드의 synthesize_batch로 모든 텍스트의 TTS를 한 번에 실행
+
+        Args:
+            texts: 텍스트 리스트
+            preprocess_text: 텍스트 전처리 여부
+
+        Returns:
+            (processed_text, (audio_data, sample_rate)) 리스트,
+            배치 합성을 사용할 수 없으면 None
+        """
+        tts_engine = getattr(self.pipeline, "tts_engine", None)
+        if not texts or not hasattr(tts_engine, "synthesize_batch"):
+            return None
+
+        processed_texts = [
+            self.pipeline.prepare_text(text, preprocess_text) for text in texts
+        ]
+
+        try:
+            audios = tts_engine.synthesize_batch(processed_texts)
+        except Exception as e:
+            # 항목별 오류를 기록할 수 있도록 개별 처리로 전환
+            logger.warning(f"배치 TTS 실패, 개별 처리로 전환: {str(e)}")
+            return None
+
+        return list(zip(processed_texts, audios))
+
     def process_from_file(
         self,
         input_file: Path,
@@ -135,4 +270,7 @@ class BatchTTSProcessor:
         )
 
     def __repr__(self) -> str:
-        return f"BatchTTSProcessor(pipeline={self.pipeline})"
+        return (
+            f"BatchTTSProcessor(pipeline={self.pipeline}, "
+            f"max_workers={self.max_workers}, use_processes={self.use_processes})"
+        )
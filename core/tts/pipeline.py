@@ -7,7 +7,6 @@ TTS-to-Collage Pipeline
 import logging
 from pathlib import Path
 from typing import Optional, List
-import tempfile
 
 import numpy as np
 
@@ -15,6 +14,7 @@ from core.tts.base import BaseTTSEngine
 from core.tts.preprocessing import TextPreprocessor
 from core.synthesis.engine import CollageEngine
 from core.audio.io import AudioFile
+from core.audio.bufferpool import get_buffer_pool
 from algorithms.base import BaseSimilarityAlgorithm
 
 logger = logging.getLogger(__name__)
@@ -72,35 +72,85 @@ class TTSPipeline:
         logger.info(f"TTS-to-Collage 파이프라인 시작: {len(text)}자")
 
         # 1단계: 텍스트 전처리
-        if preprocess_text:
-            logger.info("텍스트 전처리 중...")
-            processed_text = self.preprocessor.preprocess(text)
-        else:
-            processed_text = text
+        processed_text = self.prepare_text(text, preprocess_text)
 
-        # 2단계: TTS로 타겟 오디오 생성
+        # 2단계: TTS로 타겟 오디오 생성 (파일 저장 없이 메모리로)
         logger.info("TTS 합성 중...")
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") as temp_file:
-            temp_tts_path = Path(temp_file.name)
-
         target_audio, target_sr = self.tts_engine.synthesize(
-            processed_text, output_path=temp_tts_path
+            processed_text, output_path=None
         )
 
         logger.info(f"TTS 완료: {len(target_audio) / target_sr:.2f}초")
 
         # 3단계: 콜라주 합성
+        try:
+            return self.synthesize_collage_from_target(
+                text=text,
+                processed_text=processed_text,
+                target_audio=target_audio,
+                target_sr=target_sr,
+                source_files=source_files,
+                output_path=output_path,
+                **synthesis_kwargs,
+            )
+        finally:
+            # 백엔드가 풀에서 받은 버퍼면 다음 요청에서 재사용
+            get_buffer_pool().put(target_audio)
+
+    def prepare_text(self, text: str, preprocess_text: bool = True) -> str:
+        """
+        TTS 입력 텍스트 준비
+
+        Args:
+            text: 입력 텍스트
+            preprocess_text: 텍스트 전처리 여부
+
+        Returns:
+            TTS에 전달할 텍스트
+        """
+        if not preprocess_text:
+            return text
+
+        logger.info("텍스트 전처리 중...")
+        return self.preprocessor.preprocess(text)
+
+    def synthesize_collage_from_target(
+        self,
+        text: str,
+        processed_text: str,
+        target_audio: np.ndarray,
+        target_sr: int,
+        source_files: List[Path],
+        output_path: Path,
+        **synthesis_kwargs,
+    ) -> dict:
+        """
+        이미 합성된 TTS 오디오로부터 콜라주 생성
+
+        배치 처리에서 TTS를 한꺼번에 실행한 뒤 항목별 콜라주만 수행할 때 사용합니다.
+
+        Args:
+            text: 원본 텍스트
+            processed_text: TTS에 사용된 텍스트
+            target_audio: TTS 오디오
+            target_sr: TTS 샘플링 레이트
+            source_files: 소스 오디오 파일 리스트
+            output_path: 출력 파일 경로
+            **synthesis_kwargs: 합성 옵션
+
+        Returns:
+            메타데이터 딕셔너리
+        """
+        # 콜라주 합성 (타겟 배열을 바로 전달)
         logger.info("콜라주 합성 중...")
-        metadata = self.collage_engine.synthesize_from_file(
-            target_file=temp_tts_path,
+        metadata = self.collage_engine.synthesize_from_array(
+            target_audio=target_audio,
+            target_sr=target_sr,
             source_files=source_files,
             output_file=output_path,
             **synthesis_kwargs,
         )
 
-        # 임시 파일 삭제
-        temp_tts_path.unlink()
-
         # 메타데이터에 TTS 정보 추가
         metadata["tts_engine"] = self.tts_engine.__class__.__name__
         metadata["original_text"] = text
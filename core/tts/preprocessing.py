@@ -4,11 +4,76 @@ Text Preprocessing
 텍스트 전처리 모듈
 """
 
+import functools
 import logging
 import re
+from typing import Iterator
 
 logger = logging.getLogger(__name__)
 
+# 전처리 정규식 (모듈 로드 시 한 번만 컴파일)
+_RE_WS = re.compile(r'\s+')
+_RE_DIGITS = re.compile(r'\d+')
+_RE_URL = re.compile(r'http[s]?://\S+')
+_RE_EMAIL = re.compile(r'\S+@\S+')
+_RE_SPECIAL = re.compile(r'[^\w\s\.\,\!\?\;\:\-\'\"]')
+_RE_SENT = re.compile(r'[\.!?]+')
+
+
+def _korean_number_str(num: int) -> str:
+    """0-99 정수를 한국어 숫자 읽기로 변환"""
+    if num == 0:
+        return "영"
+
+    units = ["", "일", "이", "삼", "사", "오", "육", "칠", "팔", "구"]
+    tens = ["", "십", "이십", "삼십", "사십", "오십", "육십", "칠십", "팔십", "구십"]
+
+    if num < 10:
+        return units[num]
+    return tens[num // 10] + units[num % 10]
+
+
+# 0-99 숫자 문자열 → 한국어 읽기 테이블 ("07" 같은 0 채움 형태 포함)
+_KO_NUM = {str(i): _korean_number_str(i) for i in range(100)}
+_KO_NUM.update({f"{i:02d}": _KO_NUM[str(i)] for i in range(10)})
+
+
+def _korean_number(match: re.Match) -> str:
+    """숫자 매치를 한국어 읽기로 변환 (테이블 조회)"""
+    digits = match.group(0)
+    word = _KO_NUM.get(digits)
+    if word is not None:
+        return word
+
+    # 테이블에 없는 경우 (긴 0 채움 또는 100 이상)
+    num = int(digits)
+    if num < 100:
+        return _KO_NUM[str(num)]
+    # 100 이상은 그대로 (간단한 구현)
+    return str(num)
+
+
+# 약어 후보 문자(ASCII 영문자) 존재 여부 확인용
+_RE_ASCII_ALPHA = re.compile(r'[A-Za-z]')
+
+# 한국어 약어 사전
+_ABBR_MAP = {
+    "TTS": "티티에스",
+    "AI": "에이아이",
+    "API": "에이피아이",
+    "URL": "유알엘",
+    "etc": "기타",
+}
+# 대소문자 무시 매칭 후 대문자 키로 조회
+_ABBR_LOOKUP = {abbr.upper(): expanded for abbr, expanded in _ABBR_MAP.items()}
+# 약어는 모두 ASCII이므로 \b 대신 ASCII 단어 문자 lookaround 사용
+# (유니코드 \b는 "TTS는"처럼 한글 조사가 붙으면 경계로 보지 않음)
+_ABBR_RE = re.compile(
+    r'(?i)(?<![0-9A-Za-z_])(?:'
+    + '|'.join(sorted(map(re.escape, _ABBR_MAP), key=len, reverse=True))
+    + r')(?![0-9A-Za-z_])'
+)
+
 
 class TextPreprocessor:
     """텍스트 전처리 클래스"""
@@ -32,6 +97,14 @@ class TextPreprocessor:
         Returns:
             전처리된 텍스트
         """
+        # 단계 메서드를 재정의한 하위 클래스는 캐시를 거치지 않음
+        if type(self) is TextPreprocessor:
+            return _preprocess_cached(text, self.language)
+
+        return self._preprocess(text)
+
+    def _preprocess(self, text: str) -> str:
+        """전처리 단계 실행"""
         # 1. 공백 정규화
         text = self.normalize_whitespace(text)
 
@@ -48,8 +121,9 @@ class TextPreprocessor:
 
     def normalize_whitespace(self, text: str) -> str:
         """공백 정규화"""
-        # 연속된 공백을 하나로
-        text = re.sub(r'\s+', ' ', text)
+        # 연속된 공백을 하나로 (ASCII 공백 외의 공백 문자는 모두 isprintable()에서 걸러짐)
+        if not text.isprintable() or "  " in text:
+            text = _RE_WS.sub(' ', text)
 
         # 앞뒤 공백 제거
         text = text.strip()
@@ -60,63 +134,69 @@ class TextPreprocessor:
         """숫자를 단어로 변환"""
         if self.language == "ko":
             # 한국어 숫자 변환 (간단한 구현)
-            def korean_number(match):
-                num = int(match.group())
-                if num == 0:
-                    return "영"
-
-                units = ["", "일", "이", "삼", "사", "오", "육", "칠", "팔", "구"]
-                tens = ["", "십", "이십", "삼십", "사십", "오십", "육십", "칠십", "팔십", "구십"]
-
-                if num < 10:
-                    return units[num]
-                elif num < 100:
-                    return tens[num // 10] + (units[num % 10] if num % 10 != 0 else "")
-                else:
-                    # 100 이상은 그대로 (간단한 구현)
-                    return str(num)
-
             # 한국어에서는 \b가 제대로 작동하지 않으므로 숫자 패턴만 사용
-            text = re.sub(r'\d+', korean_number, text)
+            text = _RE_DIGITS.sub(_korean_number, text)
 
         return text
 
     def expand_abbreviations(self, text: str) -> str:
         """약어 확장"""
-        if self.language == "ko":
-            abbreviations = {
-                "TTS": "티티에스",
-                "AI": "에이아이",
-                "API": "에이피아이",
-                "URL": "유알엘",
-                "etc": "기타",
-            }
-
-            for abbr, expanded in abbreviations.items():
-                text = re.sub(r'\b' + abbr + r'\b', expanded, text, flags=re.IGNORECASE)
+        if self.language == "ko" and _RE_ASCII_ALPHA.search(text):
+            # 모든 약어를 하나의 정규식으로 한 번에 치환
+            text = _ABBR_RE.sub(lambda m: _ABBR_LOOKUP[m.group(0).upper()], text)
 
         return text
 
     def handle_special_characters(self, text: str) -> str:
         """특수 문자 처리"""
         # 이메일, URL 등은 제거하거나 읽기 쉽게 변환
-        text = re.sub(r'http[s]?://\S+', ' 링크 ', text)
-        text = re.sub(r'\S+@\S+', ' 이메일 ', text)
+        if "://" in text:
+            text = _RE_URL.sub(' 링크 ', text)
+        if "@" in text:
+            text = _RE_EMAIL.sub(' 이메일 ', text)
 
         # 불필요한 특수 문자 제거 (문장 부호는 유지)
-        text = re.sub(r'[^\w\s\.\,\!\?\;\:\-\'\"]', '', text)
+        text = _RE_SPECIAL.sub('', text)
 
         return text
 
     def split_sentences(self, text: str) -> list:
         """문장 분리"""
-        # 간단한 문장 분리 (마침표, 느낌표, 물음표 기준)
-        sentences = re.split(r'[\.!?]+', text)
+        return list(self.iter_sentences(text))
 
-        # 빈 문장 제거 및 공백 정리
-        sentences = [s.strip() for s in sentences if s.strip()]
+    def iter_sentences(self, text: str) -> Iterator[str]:
+        """
+        문장을 하나씩 생성 (긴 문서를 앞 문장부터 처리할 때 사용)
 
-        return sentences
+        Args:
+            text: 입력 텍스트
+
+        Yields:
+            공백이 정리된 문장 (빈 문장 제외)
+        """
+        # 간단한 문장 분리 (마침표, 느낌표, 물음표 기준)
+        last = 0
+        for match in _RE_SENT.finditer(text):
+            sentence = text[last:match.start()].strip()
+            last = match.end()
+            if sentence:
+                yield sentence
+
+        tail = text[last:].strip()
+        if tail:
+            yield tail
 
     def __repr__(self) -> str:
         return f"TextPreprocessor(language={self.language})"
+
+
+@functools.lru_cache(maxsize=None)
+def _get_preprocessor(language: str) -> TextPreprocessor:
+    """언어별 공유 전처리기"""
+    return TextPreprocessor(language)
+
+
+@functools.lru_cache(maxsize=4096)
+def _preprocess_cached(text: str, language: str) -> str:
+    """(text, language)별 전처리 결과 캐시"""
+    return _get_preprocessor(language)._preprocess(text)
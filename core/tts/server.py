@@ -0,0 +1,306 @@
+"""
+TTS Request Server
+
+동시 요청을 처리하는 비동기 TTS-to-Collage 서비스 모듈
+"""
+
+import asyncio
+import itertools
+import logging
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from core.audio.bufferpool import get_buffer_pool
+from core.tts.pipeline import TTSPipeline
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RequestState:
+    """
+    요청 상태
+
+    Attributes:
+        request_id: 요청 ID
+        text: 입력 텍스트
+        source_files: 소스 오디오 파일 리스트
+        output_path: 출력 파일 경로
+        synthesis_kwargs: 합성 옵션
+        future: 결과 메타데이터를 받을 Future
+        stage: 처리 단계 ("frontend" → "tts" → "collage")
+        processed_text: 전처리된 텍스트
+    """
+
+    request_id: int
+    text: str
+    source_files: List[Path]
+    output_path: Path
+    synthesis_kwargs: dict
+    future: asyncio.Future
+    stage: str = "frontend"
+    processed_text: Optional[str] = None
+    target: Optional[tuple] = field(default=None, repr=False)
+
+
+class TTSServer:
+    """
+    TTS-to-Collage 요청 풀
+
+    들어온 요청을 request_pool에 모아 단계별로 처리합니다.
+    전처리는 대기 중인 요청을 묶어 한 번에 실행하고, TTS(네트워크)는
+    세마포어로 동시 요청 수를 제한해 스레드에서, 콜라주(CPU)는 별도
+    executor에서 실행하므로 한 요청의 TTS 대기와 다른 요청의 콜라주가 겹칩니다.
+
+    Example:
+        async with TTSServer(pipeline) as server:
+            metadata = await server.submit("안녕하세요", source_files, "out.wav")
+    """
+
+    def __init__(
+        self,
+        pipeline: TTSPipeline,
+        max_tts_concurrency: int = 8,
+        max_workers: Optional[int] = None,
+        use_processes: bool = False,
+    ):
+        """
+        Args:
+            pipeline: TTS 파이프라인
+            max_tts_concurrency: 최대 동시 TTS 요청 수
+            max_workers: 콜라주 워커 수 (None이면 CPU 코어 수)
+            use_processes: 콜라주에 프로세스 사용 여부 (True면 파이프라인이 pickle 가능해야 함)
+        """
+        self.pipeline = pipeline
+        self.max_tts_concurrency = max_tts_concurrency
+        self.max_workers = max_workers or mp.cpu_count()
+        self.use_processes = use_processes
+
+        self.request_pool: Dict[int, RequestState] = {}
+        self._ids = itertools.count(1)
+
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tts_semaphore: Optional[asyncio.Semaphore] = None
+        self._serve_task: Optional[asyncio.Task] = None
+        self._tasks: set = set()
+        self._closing = False
+
+        self._thread_executor: Optional[ThreadPoolExecutor] = None
+        self._collage_executor = None
+
+        logger.info(
+            f"TTSServer 초기화: max_tts_concurrency={max_tts_concurrency}, "
+            f"max_workers={self.max_workers}, use_processes={use_processes}"
+        )
+
+    async def start(self):
+        """요청 처리 루프 시작"""
+        if self._serve_task is not None:
+            return
+
+        self._closing = False
+        self._wakeup = asyncio.Event()
+        self._tts_semaphore = asyncio.Semaphore(self.max_tts_concurrency)
+        self._thread_executor = ThreadPoolExecutor(
+            max_workers=self.max_tts_concurrency + 1,
+            thread_name_prefix="tts-server",
+        )
+        executor_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+        self._collage_executor = executor_class(max_workers=self.max_workers)
+
+        self._serve_task = asyncio.create_task(self._serve())
+
+        logger.info("TTSServer 시작")
+
+    async def stop(self):
+        """남은 요청을 모두 처리한 뒤 루프 종료"""
+        if self._serve_task is None:
+            return
+
+        self._closing = True
+        self._wakeup.set()
+        await self._serve_task
+        self._serve_task = None
+
+        self._thread_executor.shutdown(wait=True)
+        self._collage_executor.shutdown(wait=True)
+
+        logger.info("TTSServer 종료")
+
+    async def __aenter__(self) -> "TTSServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    async def submit(
+        self,
+        text: str,
+        source_files: List[Path],
+        output_path: Path,
+        **synthesis_kwargs,
+    ) -> dict:
+        """
+        요청 제출 후 결과 대기
+
+        Args:
+            text: 입력 텍스트
+            source_files: 소스 오디오 파일 리스트
+            output_path: 출력 파일 경로
+            **synthesis_kwargs: 합성 옵션 (preprocess_text 포함)
+
+        Returns:
+            메타데이터 딕셔너리
+        """
+        if self._serve_task is None or self._closing:
+            raise RuntimeError("TTSServer가 실행 중이 아닙니다")
+
+        state = RequestState(
+            request_id=next(self._ids),
+            text=text,
+            source_files=source_files,
+            output_path=Path(output_path),
+            synthesis_kwargs=synthesis_kwargs,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        self.request_pool[state.request_id] = state
+        self._wakeup.set()
+
+        logger.debug(f"요청 등록: {state.request_id}")
+
+        return await state.future
+
+    async def _serve(self):
+        """요청 처리 루프"""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+            # 1단계: 대기 중인 요청을 묶어 한 번에 전처리
+            frontend = [s for s in self.request_pool.values() if s.stage == "frontend"]
+            if frontend:
+                try:
+                    processed = await loop.run_in_executor(
+                        self._thread_executor, self._preprocess_batch, frontend
+                    )
+                except Exception as e:
+                    for state in frontend:
+                        self._finish(state, error=e)
+                else:
+                    for state, processed_text in zip(frontend, processed):
+                        state.processed_text = processed_text
+                        state.stage = "tts"
+                        task = asyncio.create_task(self._run_backend(state))
+                        self._tasks.add(task)
+                        task.add_done_callback(self._tasks.discard)
+
+                # 전처리 중 들어온 요청 처리
+                continue
+
+            # 종료 요청 후 남은 요청이 모두 끝나면 종료 (_finish가 깨움)
+            if self._closing and not self.request_pool:
+                break
+
+    def _preprocess_batch(self, states: List[RequestState]) -> List[str]:
+        """요청 묶음 전처리 (스레드에서 실행)"""
+        return [
+            self.pipeline.prepare_text(
+                state.text, state.synthesis_kwargs.pop("preprocess_text", True)
+            )
+            for state in states
+        ]
+
+    async def _run_backend(self, state: RequestState):
+        """TTS와 콜라주 단계 실행"""
+        loop = asyncio.get_running_loop()
+
+        try:
+            # 2단계: TTS (네트워크 대기 위주이므로 동시 실행 수만 제한)
+            async with self._tts_semaphore:
+                state.target = await loop.run_in_executor(
+                    self._thread_executor,
+                    self.pipeline.tts_engine.synthesize,
+                    state.processed_text,
+                    None,
+                )
+
+            # 3단계: 콜라주 (CPU 위주)
+            state.stage = "collage"
+            target_audio, target_sr = state.target
+            metadata = await loop.run_in_executor(
+                self._collage_executor,
+                _collage_job,
+                self.pipeline,
+                state.text,
+                state.processed_text,
+                target_audio,
+                target_sr,
+                state.source_files,
+                state.output_path,
+                state.synthesis_kwargs,
+            )
+        except Exception as e:
+            logger.error(f"요청 실패 ({state.request_id}): {str(e)}")
+            self._finish(state, error=e)
+        else:
+            metadata["request_id"] = state.request_id
+            self._finish(state, result=metadata)
+
+    def _finish(
+        self,
+        state: RequestState,
+        result: Optional[dict] = None,
+        error: Optional[Exception] = None,
+    ):
+        """요청 완료 처리"""
+        self.request_pool.pop(state.request_id, None)
+
+        if state.target is not None:
+            get_buffer_pool().put(state.target[0])
+            state.target = None
+
+        if not state.future.done():
+            if error is not None:
+                state.future.set_exception(error)
+            else:
+                state.future.set_result(result)
+
+        if self._closing:
+            self._wakeup.set()
+
+    def __repr__(self) -> str:
+        return (
+            f"TTSServer(pending={len(self.request_pool)}, "
+            f"max_tts_concurrency={self.max_tts_concurrency}, "
+            f"max_workers={self.max_workers})"
+        )
+
+
+def _collage_job(
+    pipeline: TTSPipeline,
+    text: str,
+    processed_text: str,
+    target_audio: np.ndarray,
+    target_sr: int,
+    source_files: List[Path],
+    output_path: Path,
+    synthesis_kwargs: dict,
+) -> dict:
+    """콜라주 작업 (프로세스 풀에서도 실행 가능하도록 모듈 수준 함수)"""
+    return pipeline.synthesize_collage_from_target(
+        text=text,
+        processed_text=processed_text,
+        target_audio=target_audio,
+        target_sr=target_sr,
+        source_files=source_files,
+        output_path=output_path,
+        **synthesis_kwargs,
+    )
@@ -6,36 +6,43 @@ Main Application
 
 import sys
 import logging
+import importlib
 from pathlib import Path
-from typing import Optional
 
 from PyQt6.QtWidgets import (
     QApplication,
     QMainWindow,
     QWidget,
     QVBoxLayout,
-    QHBoxLayout,
     QTabWidget,
-    QMenuBar,
-    QMenu,
     QToolBar,
     QStatusBar,
     QMessageBox,
     QFileDialog,
 )
-from PyQt6.QtGui import QAction, QIcon
-from PyQt6.QtCore import Qt, QSettings
-
-from gui.panels.synthesis_panel import SynthesisPanel
-from gui.panels.tts_panel import TTSPanel
-from gui.panels.batch_panel import BatchPanel
-from gui.dialogs.settings import SettingsDialog
-from gui.dialogs.help import HelpDialog
+from PyQt6.QtGui import QAction
+from PyQt6.QtCore import QSettings
+
 from gui.themes import ThemeManager
 from config import get_config
 
 logger = logging.getLogger(__name__)
 
+# 정보 대화상자 내용
+_ABOUT_HTML = (
+    "<h2>Personal Voice TTS AI</h2>"
+    "<p>버전: 0.7.0</p>"
+    "<p>음성 콜라주 및 합성 기반의 고급 TTS 시스템</p>"
+    "<p><br></p>"
+    "<p>주요 기능:</p>"
+    "<ul>"
+    "<li>다양한 유사도 검출 알고리즘</li>"
+    "<li>고급 오디오 합성</li>"
+    "<li>TTS 통합</li>"
+    "<li>배치 처리</li>"
+    "</ul>"
+)
+
 
 class MainWindow(QMainWindow):
     """메인 윈도우 클래스"""
@@ -45,6 +52,11 @@ class MainWindow(QMainWindow):
 
         self.settings = QSettings("PersonalVoiceTTS", "PersonalVoiceTTSAI")
         self.config = get_config()
+        self._home_str = str(Path.home())  # 파일 대화상자 기본 경로
+
+        # 대화상자는 처음 열 때 생성해 재사용
+        self._settings_dialog = None
+        self._help_dialog = None
 
         self._init_ui()
         self._create_menu_bar()
@@ -83,19 +95,50 @@ class MainWindow(QMainWindow):
         self.tab_widget = QTabWidget()
         layout.addWidget(self.tab_widget)
 
-        # 합성 패널
-        self.synthesis_panel = SynthesisPanel()
-        self.tab_widget.addTab(self.synthesis_panel, "오디오 합성")
+        # 패널은 탭을 처음 열 때 import 및 생성
+        # (index -> (속성 이름, 모듈 경로, 클래스 이름, 탭 제목))
+        self._tab_factories = {
+            0: ("synthesis_panel", "gui.panels.synthesis_panel", "SynthesisPanel", "오디오 합성"),
+            1: ("tts_panel", "gui.panels.tts_panel", "TTSPanel", "TTS"),
+            2: ("batch_panel", "gui.panels.batch_panel", "BatchPanel", "배치 처리"),
+        }
+        for index in sorted(self._tab_factories):
+            attr, _, _, title = self._tab_factories[index]
+            setattr(self, attr, None)
+            self.tab_widget.addTab(QWidget(), title)
+
+        # 첫 화면이 비어 있지 않도록 첫 탭은 바로 생성
+        self._ensure_tab(0)
+        self.tab_widget.currentChanged.connect(self._ensure_tab)
 
-        # TTS 패널
-        self.tts_panel = TTSPanel()
-        self.tab_widget.addTab(self.tts_panel, "TTS")
+        logger.debug("UI 초기화 완료")
 
-        # 배치 처리 패널
-        self.batch_panel = BatchPanel()
-        self.tab_widget.addTab(self.batch_panel, "배치 처리")
+    def _ensure_tab(self, index: int):
+        """
+        탭 패널이 아직 생성되지 않았으면 생성해 자리표시자와 교체
 
-        logger.debug("UI 초기화 완료")
+        Args:
+            index: 탭 인덱스
+        """
+        factory = self._tab_factories.pop(index, None)
+        if factory is None:
+            return
+
+        attr, module_name, class_name, title = factory
+        panel_class = getattr(importlib.import_module(module_name), class_name)
+        panel = panel_class()
+        setattr(self, attr, panel)
+
+        # 교체 중 currentChanged 재진입 방지
+        self.tab_widget.blockSignals(True)
+        placeholder = self.tab_widget.widget(index)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, panel, title)
+        self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+
+        logger.debug(f"탭 생성: {title}")
 
     def _create_menu_bar(self):
         """메뉴바 생성"""
@@ -181,22 +224,29 @@ class MainWindow(QMainWindow):
 
     def _restore_settings(self):
         """설정 복원"""
+        self.settings.beginGroup("MainWindow")
+
         # 윈도우 위치 및 크기 복원
-        geometry = self.settings.value("geometry")
-        if geometry:
-            self.restoreGeometry(geometry)
+        if self.settings.contains("geometry"):
+            self.restoreGeometry(self.settings.value("geometry"))
 
         # 윈도우 상태 복원
-        state = self.settings.value("windowState")
-        if state:
-            self.restoreState(state)
+        if self.settings.contains("windowState"):
+            self.restoreState(self.settings.value("windowState"))
+
+        self.settings.endGroup()
 
         logger.debug("설정 복원 완료")
 
     def _save_settings(self):
         """설정 저장"""
+        self.settings.beginGroup("MainWindow")
         self.settings.setValue("geometry", self.saveGeometry())
         self.settings.setValue("windowState", self.saveState())
+        self.settings.endGroup()
+
+        # 디스크 기록은 한 번만
+        self.settings.sync()
 
         logger.debug("설정 저장 완료")
 
@@ -205,7 +255,7 @@ class MainWindow(QMainWindow):
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "오디오 파일 열기",
-            str(Path.home()),
+            self._home_str,
             "Audio Files (*.wav *.mp3 *.flac *.ogg);;All Files (*)",
         )
 
@@ -218,7 +268,7 @@ class MainWindow(QMainWindow):
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "저장",
-            str(Path.home()),
+            self._home_str,
             "Audio Files (*.wav *.mp3 *.flac);;All Files (*)",
         )
 
@@ -228,31 +278,21 @@ class MainWindow(QMainWindow):
 
     def _on_settings(self):
         """설정 대화상자"""
-        dialog = SettingsDialog(self)
-        dialog.exec()
+        if self._settings_dialog is None:
+            from gui.dialogs.settings import SettingsDialog
+            self._settings_dialog = SettingsDialog(self)
+        self._settings_dialog.exec()
 
     def _on_help(self):
         """도움말 대화상자"""
-        dialog = HelpDialog(self)
-        dialog.exec()
+        if self._help_dialog is None:
+            from gui.dialogs.help import HelpDialog
+            self._help_dialog = HelpDialog(self)
+        self._help_dialog.exec()
 
     def _on_about(self):
         """정보 대화상자"""
-        QMessageBox.about(
-            self,
-            "Personal Voice TTS AI 정보",
-            "<h2>Personal Voice TTS AI</h2>"
-            "<p>버전: 0.7.0</p>"
-            "<p>음성 콜라주 및 합성 기반의 고급 TTS 시스템</p>"
-            "<p><br></p>"
-            "<p>주요 기능:</p>"
-            "<ul>"
-            "<li>다양한 유사도 검출 알고리즘</li>"
-            "<li>고급 오디오 합성</li>"
-            "<li>TTS 통합</li>"
-            "<li>배치 처리</li>"
-            "</ul>",
-        )
+        QMessageBox.about(self, "Personal Voice TTS AI 정보", _ABOUT_HTML)
 
     def closeEvent(self, event):
         """윈도우 닫기 이벤트"""
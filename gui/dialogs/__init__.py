@@ -2,10 +2,25 @@
 GUI Dialogs Module
 """
 
-from gui.dialogs.settings import SettingsDialog
-from gui.dialogs.help import HelpDialog
+import importlib
+
+# 대화상자는 처음 열 때만 필요하므로 속성 접근 시점에 import (PEP 562)
+_LAZY_IMPORTS = {
+    "SettingsDialog": "gui.dialogs.settings",
+    "HelpDialog": "gui.dialogs.help",
+}
 
 __all__ = [
     "SettingsDialog",
     "HelpDialog",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
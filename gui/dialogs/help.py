@@ -12,6 +12,7 @@ from PyQt6.QtWidgets import (
     QDialogButtonBox,
 )
 from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QTextDocument
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +20,9 @@ logger = logging.getLogger(__name__)
 class HelpDialog(QDialog):
     """도움말 대화상자"""
 
+    # 파싱된 도움말 문서 (모든 인스턴스가 공유, 최초 생성 시 한 번만 파싱)
+    _HELP_DOC = None
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -36,7 +40,11 @@ class HelpDialog(QDialog):
         # 텍스트 브라우저
         self.text_browser = QTextBrowser()
         self.text_browser.setOpenExternalLinks(True)
-        self.text_browser.setHtml(self._get_help_content())
+        if HelpDialog._HELP_DOC is None:
+            document = QTextDocument()
+            document.setHtml(self._get_help_content())
+            HelpDialog._HELP_DOC = document
+        self.text_browser.setDocument(HelpDialog._HELP_DOC)
         layout.addWidget(self.text_browser)
 
         # 버튼
@@ -5,6 +5,8 @@ Settings Dialog
 """
 
 import logging
+import os
+
 from PyQt6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -20,11 +22,22 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QDialogButtonBox,
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QSettings
 
 logger = logging.getLogger(__name__)
 
 
+def max_workers_setting() -> int:
+    """
+    설정 대화상자의 최대 워커 수
+
+    Returns:
+        저장된 워커 수 (없으면 CPU 코어 수)
+    """
+    settings = QSettings("PersonalVoiceTTS", "PersonalVoiceTTSAI")
+    return settings.value("Performance/max_workers", 0, type=int) or os.cpu_count() or 1
+
+
 class SettingsDialog(QDialog):
     """설정 대화상자"""
 
@@ -34,6 +47,8 @@ class SettingsDialog(QDialog):
         self.setWindowTitle("설정")
         self.setMinimumSize(600, 400)
 
+        self.settings = QSettings("PersonalVoiceTTS", "PersonalVoiceTTSAI")
+
         self._init_ui()
 
         logger.debug("SettingsDialog 초기화")
@@ -67,6 +82,15 @@ class SettingsDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
 
+    def accept(self):
+        """설정 저장 후 닫기"""
+        self.settings.setValue("Performance/max_workers", self.workers_spin.value())
+        self.settings.sync()
+
+        logger.debug("설정 저장 완료")
+
+        super().accept()
+
     def _create_general_tab(self) -> QWidget:
         """일반 설정 탭"""
         widget = QWidget()
@@ -103,10 +127,13 @@ class SettingsDialog(QDialog):
         # 워커 수
         workers_layout = QHBoxLayout()
         workers_layout.addWidget(QLabel("최대 워커 수:"))
-        workers_spin = QSpinBox()
-        workers_spin.setRange(1, 16)
-        workers_spin.setValue(4)
-        workers_layout.addWidget(workers_spin)
+        cpu_count = os.cpu_count() or 4
+        self.workers_spin = QSpinBox()
+        self.workers_spin.setRange(1, max(16, cpu_count))
+        self.workers_spin.setValue(
+            self.settings.value("Performance/max_workers", cpu_count, type=int)
+        )
+        workers_layout.addWidget(self.workers_spin)
         workers_layout.addStretch()
         perf_layout.addLayout(workers_layout)
 
@@ -2,12 +2,28 @@
 GUI Panels Module
 """
 
-from gui.panels.synthesis_panel import SynthesisPanel
-from gui.panels.tts_panel import TTSPanel
-from gui.panels.batch_panel import BatchPanel
+import importlib
+
+# 패널 모듈은 무거운 의존성(librosa, TTS 백엔드 등)을 끌어오므로
+# 속성 접근 시점에 import (PEP 562)
+_LAZY_IMPORTS = {
+    "SynthesisPanel": "gui.panels.synthesis_panel",
+    "TTSPanel": "gui.panels.tts_panel",
+    "BatchPanel": "gui.panels.batch_panel",
+}
 
 __all__ = [
     "SynthesisPanel",
     "TTSPanel",
     "BatchPanel",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -5,8 +5,9 @@ Batch Processing Panel
 """
 
 import logging
+import os
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from PyQt6.QtWidgets import (
     QWidget,
@@ -23,44 +24,61 @@ from PyQt6.QtWidgets import (
     QListWidget,
     QTextEdit,
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
+
+from gui.dialogs.settings import max_workers_setting
+from gui.preload import preload_modules
 
 logger = logging.getLogger(__name__)
 
 
-class BatchWorker(QThread):
-    """배치 처리 워커 스레드"""
+# BatchWorker가 사용하는 무거운 모듈 (패널 생성 시 백그라운드에서 미리 임포트)
+_WORKER_MODULES = (
+    "core.batch.processor",
+    "core.tts.backends",
+    "algorithms.traditional.mfcc",
+    "core.tts.pipeline",
+)
+
+
+class BatchWorkerSignals(QObject):
+    """배치 처리 워커 시그널"""
 
     progress = pyqtSignal(int, int)  # current, total
     job_finished = pyqtSignal(str)  # job_id
     finished = pyqtSignal(dict)
     error = pyqtSignal(str)
 
+
+class BatchWorker(QRunnable):
+    """배치 처리 워커 (전역 QThreadPool에서 실행)"""
+
     def __init__(
         self,
         workflow: str,
         input_file: Path,
         source_files: List[Path],
         output_dir: Path,
+        max_workers: Optional[int] = None,
     ):
         super().__init__()
+        # 패널이 참조를 보관하므로 실행 후 C++ 쪽에서 삭제하지 않음
+        self.setAutoDelete(False)
+        self.signals = BatchWorkerSignals()
         self.workflow = workflow
         self.input_file = input_file
         self.source_files = source_files
         self.output_dir = output_dir
+        self.max_workers = max_workers or os.cpu_count() or 4
 
     def run(self):
         """워커 실행"""
         try:
             from core.batch.processor import BatchProcessor
 
-            # 입력 파일 읽기
-            with open(self.input_file, 'r', encoding='utf-8') as f:
-                inputs = [line.strip() for line in f if line.strip()]
-
             # 배치 프로세서 생성
             processor = BatchProcessor(
-                max_workers=4,
+                max_workers=self.max_workers,
                 use_processes=False,
                 continue_on_error=True,
                 show_progress=False,
@@ -76,29 +94,40 @@ class BatchWorker(QThread):
                 sim_algo = MFCCSimilarity()
                 pipeline = TTSPipeline(tts_engine=tts_backend, similarity_algorithm=sim_algo)
 
-                for i, text in enumerate(inputs, 1):
-                    output_path = self.output_dir / f"output_{i:03d}.wav"
-                    processor.add_job(
-                        job_id=f"tts_collage_{i}",
-                        func=pipeline.synthesize_collage,
-                        kwargs={
-                            "text": text,
-                            "source_files": self.source_files,
-                            "output_path": output_path,
-                        },
-                        priority=0,
-                    )
-
-                    self.progress.emit(0, len(inputs))
-
-            # 처리 실행
-            summary = processor.process_all()
-
-            self.finished.emit(summary)
+                # 입력 파일을 줄 단위로 읽으며 바로 작업 생성
+                with open(self.input_file, 'r', encoding='utf-8') as f:
+                    texts = filter(None, (line.strip() for line in f))
+                    jobs = [
+                        (
+                            f"tts_collage_{i}",
+                            pipeline.synthesize_collage,
+                            {
+                                "text": text,
+                                "source_files": self.source_files,
+                                "output_path": self.output_dir / f"output_{i:03d}.wav",
+                            },
+                        )
+                        for i, text in enumerate(texts, 1)
+                    ]
+                processor.add_jobs(jobs)
+
+                self.signals.progress.emit(0, len(jobs))
+
+            # 처리 실행 (진행률은 약 1% 단위로만 전달)
+            summary = processor.process_all(progress_callback=self._on_job_done)
+
+            self.signals.finished.emit(summary)
 
         except Exception as e:
             logger.error(f"배치 처리 오류: {str(e)}", exc_info=True)
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
+
+    def _on_job_done(self, job_id: str, current: int, total: int):
+        """작업 종료 콜백 (워커 스레드에서 호출)"""
+        self.signals.job_finished.emit(job_id)
+
+        if current % max(1, total // 100) == 0 or current == total:
+            self.signals.progress.emit(current, total)
 
 
 class BatchPanel(QWidget):
@@ -109,10 +138,15 @@ class BatchPanel(QWidget):
 
         self.input_file: Path = None
         self.source_files: List[Path] = []
+        self._source_set: set = set()
         self.output_dir: Path = None
+        self._home_str = str(Path.home())  # 파일 대화상자 기본 경로
 
         self._init_ui()
 
+        # 시작 버튼 클릭 시 임포트 지연이 없도록 워커 모듈 미리 로드
+        preload_modules(_WORKER_MODULES)
+
         logger.debug("BatchPanel 초기화")
 
     def _init_ui(self):
@@ -212,7 +246,7 @@ class BatchPanel(QWidget):
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "입력 파일 선택 (텍스트 파일)",
-            str(Path.home()),
+            self._home_str,
             "Text Files (*.txt);;All Files (*)",
         )
 
@@ -226,22 +260,32 @@ class BatchPanel(QWidget):
         file_paths, _ = QFileDialog.getOpenFileNames(
             self,
             "소스 오디오 파일 선택",
-            str(Path.home()),
+            self._home_str,
             "Audio Files (*.wav *.mp3 *.flac);;All Files (*)",
         )
 
+        names = []
         for file_path in file_paths:
-            source_file = Path(file_path)
-            if source_file not in self.source_files:
+            # 심볼릭 링크/대소문자만 다른 경로도 같은 파일로 중복 제거
+            source_file = Path(os.path.realpath(file_path))
+            if source_file not in self._source_set:
+                self._source_set.add(source_file)
                 self.source_files.append(source_file)
-                self.source_list.addItem(source_file.name)
+                names.append(source_file.name)
                 logger.info(f"소스 파일 추가: {source_file}")
 
+        if names:
+            # 목록 갱신은 한 번에 (항목마다 다시 그리지 않도록)
+            self.source_list.setUpdatesEnabled(False)
+            self.source_list.addItems(names)
+            self.source_list.setUpdatesEnabled(True)
+
     def _on_remove_source(self):
         """소스 파일 제거"""
         current_row = self.source_list.currentRow()
         if current_row >= 0:
             removed_file = self.source_files.pop(current_row)
+            self._source_set.discard(removed_file)
             self.source_list.takeItem(current_row)
             logger.info(f"소스 파일 제거: {removed_file}")
 
@@ -250,7 +294,7 @@ class BatchPanel(QWidget):
         dir_path = QFileDialog.getExistingDirectory(
             self,
             "출력 디렉토리 선택",
-            str(Path.home()),
+            self._home_str,
         )
 
         if dir_path:
@@ -276,18 +320,20 @@ class BatchPanel(QWidget):
         # 출력 디렉토리 생성
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        # 워커 스레드 생성
+        # 워커 스레드 생성 (워커 수는 설정 대화상자 값 사용)
         self.worker = BatchWorker(
             workflow=self.workflow_combo.currentText(),
             input_file=self.input_file,
             source_files=self.source_files,
             output_dir=self.output_dir,
+            max_workers=max_workers_setting(),
         )
 
-        self.worker.progress.connect(self._on_progress)
-        self.worker.job_finished.connect(self._on_job_finished)
-        self.worker.finished.connect(self._on_batch_finished)
-        self.worker.error.connect(self._on_batch_error)
+        queued = Qt.ConnectionType.QueuedConnection
+        self.worker.signals.progress.connect(self._on_progress, queued)
+        self.worker.signals.job_finished.connect(self._on_job_finished, queued)
+        self.worker.signals.finished.connect(self._on_batch_finished)
+        self.worker.signals.error.connect(self._on_batch_error)
 
         # UI 업데이트
         self.start_btn.setEnabled(False)
@@ -297,16 +343,21 @@ class BatchPanel(QWidget):
         self.log_text.clear()
 
         # 워커 시작
-        self.worker.start()
+        QThreadPool.globalInstance().start(self.worker)
 
         logger.info("배치 처리 시작")
 
     def _on_progress(self, current, total):
         """진행률 업데이트"""
         if total > 0:
+            # 값이 바뀐 경우에만 갱신 (불필요한 다시 그리기 방지)
             percentage = int((current / total) * 100)
-            self.progress_bar.setValue(percentage)
-            self.status_label.setText(f"처리 중... ({current}/{total})")
+            if percentage != self.progress_bar.value():
+                self.progress_bar.setValue(percentage)
+
+            status = f"처리 중... ({current}/{total})"
+            if status != self.status_label.text():
+                self.status_label.setText(status)
 
     def _on_job_finished(self, job_id):
         """작업 완료"""
@@ -4,10 +4,17 @@ Synthesis Panel
 오디오 합성 패널
 """
 
+import functools
 import logging
+import os
+import queue
+from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional
 
+import numpy as np
+import soundfile as sf
+
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -22,60 +29,246 @@ from PyQt6.QtWidgets import (
     QMessageBox,
     QListWidget,
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import (
+    Qt, QCoreApplication, QObject, QThread, pyqtSignal, pyqtSlot
+)
 
+from gui.dialogs.settings import max_workers_setting
+from gui.preload import preload_modules
+from gui.progress import scaled_progress
 from gui.widgets.player import AudioPlayerWidget
 from gui.widgets.waveform import WaveformWidget
-from gui.widgets.spectrogram import SpectrogramWidget
+from gui.widgets.spectrogram import SpectrogramWidget, compute_spectrogram_db
 
 logger = logging.getLogger(__name__)
 
+# SynthesisJobRunner가 사용하는 무거운 모듈 (패널 생성 시 백그라운드에서 미리 임포트)
+# hybrid는 torch를 끌어오므로 선택했을 때만 임포트
+_WORKER_MODULES = (
+    "core.synthesis.engine",
+    "algorithms.traditional.mfcc",
+)
+
+# 소스 검색을 프로세스로 분산할 수 있는 알고리즘 (GPU 텐서/모델을 들고 있지 않음)
+_PROCESS_SAFE_ALGORITHMS = ("mfcc", "spectral")
+
+# 미리보기 스펙트로그램 프레임 설정
+_VIZ_N_FFT = 512
+_VIZ_HOP_LENGTH = 160
+# 스펙트로그램은 표시용이므로 이 샘플링 레이트로 낮춰서 계산
+_VIZ_SR = 16000
+
+# 이보다 큰 파일은 전체를 읽지 않고 블록 단위로 스트리밍
+_STREAM_THRESHOLD = 20 * 1024 * 1024
+_ENVELOPE_POINTS = 2000
+_STREAM_SPEC_SR = 8000
+_STREAM_CHUNK = 1 << 20
+
+
+@dataclass
+class AudioPreview:
+    """
+    미리보기 데이터
+
+    Attributes:
+        sample_rate: 원본 샘플레이트
+        duration: 길이 (초)
+        S_db: 스펙트로그램 (dB)
+        spec_sample_rate: 스펙트로그램 계산에 사용한 샘플레이트
+        audio: 전체 디코딩한 경우 오디오 데이터
+        envelope: 스트리밍한 경우 (최소, 최대) 포락선
+    """
+
+    sample_rate: int
+    duration: float
+    S_db: np.ndarray
+    spec_sample_rate: float
+    audio: Optional[np.ndarray] = None
+    envelope: Optional[np.ndarray] = None
+
+
+def _stream_preview(path_str: str) -> AudioPreview:
+    """
+    큰 파일을 블록 단위로 읽어 포락선과 저해상도 스펙트로그램 계산
+
+    블록마다 파형 포락선(구간별 최소/최대)과 스펙트로그램용으로
+    평균 데시메이션한 신호만 남기므로 전체 샘플을 메모리에 올리지 않습니다.
+    """
+    with sf.SoundFile(path_str) as f:
+        sample_rate, frames = f.samplerate, f.frames
+
+        stride = max(1, -(-frames // _ENVELOPE_POINTS))
+        q = max(1, sample_rate // _STREAM_SPEC_SR)
+        # 블록 크기는 stride와 q의 배수 (마지막 블록만 나머지가 생김)
+        blocksize = stride * q * max(1, _STREAM_CHUNK // (stride * q))
+
+        env_parts, dec_parts = [], []
+        for block in f.blocks(blocksize=blocksize, dtype="float32"):
+            if block.ndim == 2:
+                block = block.mean(axis=1)
+
+            n_full = len(block) // stride * stride
+            if n_full:
+                segments = block[:n_full].reshape(-1, stride)
+                env_parts.append(np.stack([segments.min(axis=1), segments.max(axis=1)], axis=1))
+            if n_full < len(block):
+                tail = block[n_full:]
+                env_parts.append(np.array([[tail.min(), tail.max()]], dtype=np.float32))
+
+            n_dec = len(block) // q * q
+            dec_parts.append(block[:n_dec].reshape(-1, q).mean(axis=1))
+
+    decimated = np.concatenate(dec_parts)
+    spec_sample_rate = sample_rate / q
+
+    return AudioPreview(
+        sample_rate=sample_rate,
+        duration=frames / sample_rate,
+        S_db=compute_spectrogram_db(decimated, n_fft=_VIZ_N_FFT, hop_length=_VIZ_HOP_LENGTH),
+        spec_sample_rate=spec_sample_rate,
+        envelope=np.concatenate(env_parts),
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_preview(path_str: str, mtime_ns: int, size: int) -> AudioPreview:
+    """미리보기 데이터 캐시 (파일이 바뀌면 mtime/size가 달라져 다시 읽음)"""
+    if size > _STREAM_THRESHOLD:
+        return _stream_preview(path_str)
+
+    audio_data, sample_rate = sf.read(path_str, dtype="float32")
+
+    # 파형은 원본 그대로, 스펙트로그램만 다운샘플링한 모노 신호로 계산
+    spec_audio, spec_sample_rate = audio_data, sample_rate
+    if spec_audio.ndim == 2:
+        spec_audio = spec_audio.mean(axis=1)
+    if sample_rate > _VIZ_SR:
+        from scipy.signal import resample_poly
+
+        spec_audio = resample_poly(spec_audio, _VIZ_SR, sample_rate).astype(np.float32, copy=False)
+        spec_sample_rate = _VIZ_SR
+
+    return AudioPreview(
+        sample_rate=sample_rate,
+        duration=len(audio_data) / sample_rate,
+        S_db=compute_spectrogram_db(spec_audio, n_fft=_VIZ_N_FFT, hop_length=_VIZ_HOP_LENGTH),
+        spec_sample_rate=spec_sample_rate,
+        audio=audio_data,
+    )
+
+
+class VisualizationWorker(QThread):
+    """시각화 워커 스레드 (패널당 하나를 계속 재사용)"""
+
+    loaded = pyqtSignal(object, object)  # path, AudioPreview
+    error = pyqtSignal(object, str)  # path, message
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._requests: queue.Queue = queue.Queue()
+
+    def request(self, audio_file: Path):
+        """파일 로드 요청"""
+        self._requests.put(audio_file)
+
+    def stop(self):
+        """스레드 종료 (대기 중인 요청은 버림)"""
+        self._requests.put(None)
+        self.wait()
+
+    def run(self):
+        """워커 실행"""
+        while True:
+            # 밀린 요청은 가장 최근 것만 처리
+            audio_file = self._requests.get()
+            while audio_file is not None and not self._requests.empty():
+                audio_file = self._requests.get_nowait()
+
+            if audio_file is None:
+                break
+
+            self._load(audio_file)
+
+    def _load(self, audio_file: Path):
+        """오디오 디코딩 및 스펙트로그램 계산"""
+        try:
+            stat = audio_file.stat()
+            key = (str(audio_file), stat.st_mtime_ns, stat.st_size)
+
+            self.loaded.emit(audio_file, _cached_preview(*key))
+
+        except Exception as e:
+            logger.error(f"오디오 로드 오류: {str(e)}")
+            self.error.emit(audio_file, str(e))
+
 
-class SynthesisWorker(QThread):
-    """합성 작업 워커 스레드"""
+class SynthesisJobRunner(QObject):
+    """
+    합성 작업 실행기
+
+    패널 수명 동안 하나의 QThread에서 계속 실행되며, 작업은 큐 연결된
+    시그널로 전달됩니다. 알고리즘별 합성 엔진을 보관해 다음 작업에서 재사용합니다.
+    """
 
     progress = pyqtSignal(int)
     finished = pyqtSignal(dict)
     error = pyqtSignal(str)
 
-    def __init__(
-        self,
-        target_file: Path,
-        source_files: List[Path],
-        output_file: Path,
-        algorithm: str,
-    ):
+    def __init__(self):
         super().__init__()
-        self.target_file = target_file
-        self.source_files = source_files
-        self.output_file = output_file
-        self.algorithm = algorithm
+        # 알고리즘별 합성 엔진 (세그먼트 캐시 유지)
+        self._engines = {}
 
-    def run(self):
-        """워커 실행"""
-        try:
-            from core.synthesis.engine import CollageEngine
-            from algorithms.traditional.mfcc import MFCCSimilarity
-            from algorithms.ai_based.hybrid import HybridSimilarity
+    def _get_engine(self, algorithm: str):
+        """선택된 알고리즘의 합성 엔진 반환 (없으면 생성)"""
+        engine = self._engines.get(algorithm)
+        if engine is not None:
+            return engine
 
-            # 알고리즘 선택
-            if self.algorithm == "mfcc":
-                sim_algo = MFCCSimilarity()
-            elif self.algorithm == "hybrid":
-                sim_algo = HybridSimilarity()
+        from core.synthesis.engine import CollageEngine
+        from algorithms.traditional.mfcc import MFCCSimilarity
+
+        # 알고리즘 선택
+        if algorithm == "hybrid":
+            from algorithms.ai_based.hybrid import HybridSimilarity
+            sim_algo = HybridSimilarity()
+        elif algorithm == "mfcc-gpu":
+            from algorithms.traditional.mfcc_cuda import (
+                CudaBatchedMFCCSimilarity,
+                is_cuda_available,
+            )
+            if is_cuda_available():
+                sim_algo = CudaBatchedMFCCSimilarity(batch_size=256, device="cuda")
             else:
+                logger.warning("CUDA를 사용할 수 없어 MFCC(CPU)로 대체합니다")
                 sim_algo = MFCCSimilarity()
+        else:
+            # 같은 소스로 반복 합성할 때 윈도우 MFCC 재사용
+            from core.synthesis.cache import FeatureCache
+            sim_algo = MFCCSimilarity(feature_cache=FeatureCache())
+
+        engine = CollageEngine(similarity_algorithm=sim_algo)
+        self._engines[algorithm] = engine
+        return engine
+
+    @pyqtSlot(object)
+    def run_job(self, params: dict):
+        """
+        합성 작업 실행
+
+        Args:
+            params: target_file, source_files, output_file, algorithm, max_workers
+        """
+        try:
+            engine = self._get_engine(params["algorithm"])
 
-            # 합성 엔진
-            engine = CollageEngine(similarity_algorithm=sim_algo)
-
-            # 합성 실행
-            self.progress.emit(50)
-
+            # 합성 실행 (엔진 단계별 진행률 전달, 나머지는 저장)
             metadata = engine.synthesize_from_file(
-                target_file=self.target_file,
-                source_files=self.source_files,
-                output_path=self.output_file,
+                target_file=params["target_file"],
+                source_files=params["source_files"],
+                output_file=params["output_file"],
+                max_workers=params.get("max_workers", 1),
+                progress_callback=scaled_progress(self.progress.emit, 0, 95),
             )
 
             self.progress.emit(100)
@@ -89,17 +282,54 @@ class SynthesisWorker(QThread):
 class SynthesisPanel(QWidget):
     """오디오 합성 패널"""
 
+    # 작업 스레드로 합성 작업 전달 (스레드 경계를 넘으므로 큐 연결)
+    job_requested = pyqtSignal(object)
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
         self.target_file: Optional[Path] = None
         self.source_files: List[Path] = []
+        self._source_set: set = set()
         self.output_file: Optional[Path] = None
+        # 파일 대화상자 시작 경로 (동작별로 마지막 사용 디렉토리 기억)
+        home_str = str(Path.home())
+        self._last_target_dir = home_str
+        self._last_source_dir = home_str
+        self._last_output_dir = home_str
+
+        # 합성 작업 스레드 (한 번 만들어 계속 재사용)
+        self._job_thread = QThread(self)
+        self._runner = SynthesisJobRunner()
+        self._runner.moveToThread(self._job_thread)
+        self._job_thread.finished.connect(self._runner.deleteLater)
+        self.job_requested.connect(self._runner.run_job)
+        self._runner.progress.connect(self._on_progress)
+        self._runner.finished.connect(self._on_synthesis_finished)
+        self._runner.error.connect(self._on_synthesis_error)
+        self._job_thread.start()
+
+        # 시각화 워커 (디코딩과 스펙트로그램 계산을 GUI 스레드 밖에서 처리)
+        self._viz_file: Optional[Path] = None
+        self._viz_worker = VisualizationWorker(self)
+        self._viz_worker.loaded.connect(self._on_visualization_loaded)
+        self._viz_worker.error.connect(self._on_visualization_error)
+        self._viz_worker.start()
+        QCoreApplication.instance().aboutToQuit.connect(self._stop_threads)
 
         self._init_ui()
 
+        # 첫 합성 때 임포트 지연이 없도록 워커 모듈 미리 로드
+        preload_modules(_WORKER_MODULES)
+
         logger.debug("SynthesisPanel 초기화")
 
+    def _stop_threads(self):
+        """애플리케이션 종료 시 작업/시각화 스레드 정리"""
+        self._job_thread.quit()
+        self._job_thread.wait()
+        self._viz_worker.stop()
+
     def _init_ui(self):
         """UI 초기화"""
         layout = QVBoxLayout(self)
@@ -154,7 +384,7 @@ class SynthesisPanel(QWidget):
         algo_layout = QHBoxLayout(algo_group)
         algo_layout.addWidget(QLabel("유사도 알고리즘:"))
         self.algo_combo = QComboBox()
-        self.algo_combo.addItems(["mfcc", "hybrid", "spectral"])
+        self.algo_combo.addItems(["mfcc", "mfcc-gpu", "hybrid", "spectral"])
         algo_layout.addWidget(self.algo_combo)
         algo_layout.addStretch()
         layout.addWidget(algo_group)
@@ -198,12 +428,14 @@ class SynthesisPanel(QWidget):
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "타겟 오디오 파일 선택",
-            str(Path.home()),
+            self._last_target_dir,
             "Audio Files (*.wav *.mp3 *.flac);;All Files (*)",
+            options=QFileDialog.Option.ReadOnly,
         )
 
         if file_path:
             self.target_file = Path(file_path)
+            self._last_target_dir = str(self.target_file.parent)
             self.target_edit.setText(str(self.target_file))
             logger.info(f"타겟 파일 선택: {self.target_file}")
 
@@ -215,22 +447,36 @@ class SynthesisPanel(QWidget):
         file_paths, _ = QFileDialog.getOpenFileNames(
             self,
             "소스 오디오 파일 선택",
-            str(Path.home()),
+            self._last_source_dir,
             "Audio Files (*.wav *.mp3 *.flac);;All Files (*)",
+            options=QFileDialog.Option.ReadOnly,
         )
 
+        if file_paths:
+            self._last_source_dir = str(Path(file_paths[0]).parent)
+
+        names = []
         for file_path in file_paths:
-            source_file = Path(file_path)
-            if source_file not in self.source_files:
+            # 심볼릭 링크/대소문자만 다른 경로도 같은 파일로 중복 제거
+            source_file = Path(os.path.realpath(file_path))
+            if source_file not in self._source_set:
+                self._source_set.add(source_file)
                 self.source_files.append(source_file)
-                self.source_list.addItem(source_file.name)
+                names.append(source_file.name)
                 logger.info(f"소스 파일 추가: {source_file}")
 
+        if names:
+            # 목록 갱신은 한 번에 (항목마다 다시 그리지 않도록)
+            self.source_list.setUpdatesEnabled(False)
+            self.source_list.addItems(names)
+            self.source_list.setUpdatesEnabled(True)
+
     def _on_remove_source(self):
         """소스 파일 제거"""
         current_row = self.source_list.currentRow()
         if current_row >= 0:
             removed_file = self.source_files.pop(current_row)
+            self._source_set.discard(removed_file)
             self.source_list.takeItem(current_row)
             logger.info(f"소스 파일 제거: {removed_file}")
 
@@ -239,35 +485,47 @@ class SynthesisPanel(QWidget):
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "출력 파일 선택",
-            str(Path.home()),
+            self._last_output_dir,
             "Audio Files (*.wav *.mp3 *.flac);;All Files (*)",
         )
 
         if file_path:
             self.output_file = Path(file_path)
+            self._last_output_dir = str(self.output_file.parent)
             self.output_edit.setText(str(self.output_file))
             logger.info(f"출력 파일 선택: {self.output_file}")
 
     def _load_and_visualize(self, audio_file: Path):
-        """오디오 로드 및 시각화"""
-        try:
-            import soundfile as sf
+        """오디오 로드 및 시각화 (결과는 _on_visualization_loaded로 전달)"""
+        self._viz_file = audio_file
+        self._viz_worker.request(audio_file)
+
+    def _on_visualization_loaded(self, audio_file, preview: AudioPreview):
+        """시각화 데이터 로드 완료"""
+        # 그 사이 다른 파일이 선택된 경우 무시
+        if audio_file != self._viz_file:
+            return
 
-            # 오디오 로드
-            audio_data, sample_rate = sf.read(audio_file)
+        # 파형 표시 (큰 파일은 포락선)
+        if preview.audio is not None:
+            self.waveform_widget.plot_waveform(preview.audio, preview.sample_rate)
+        else:
+            self.waveform_widget.plot_envelope(preview.envelope, preview.duration)
 
-            # 파형 표시
-            self.waveform_widget.plot_waveform(audio_data, sample_rate)
+        # 스펙트로그램 표시
+        self.spectrogram_widget.plot_spectrogram_precomputed(
+            preview.S_db, preview.spec_sample_rate, hop_length=_VIZ_HOP_LENGTH
+        )
 
-            # 스펙트로그램 표시
-            self.spectrogram_widget.plot_spectrogram(audio_data, sample_rate)
+        # 플레이어 로드
+        self.player_widget.load_audio(audio_file)
 
-            # 플레이어 로드
-            self.player_widget.load_audio(audio_file)
+    def _on_visualization_error(self, audio_file, error_msg):
+        """시각화 데이터 로드 오류"""
+        if audio_file != self._viz_file:
+            return
 
-        except Exception as e:
-            logger.error(f"오디오 로드 오류: {str(e)}")
-            QMessageBox.critical(self, "오류", f"오디오 로드 실패: {str(e)}")
+        QMessageBox.critical(self, "오류", f"오디오 로드 실패: {error_msg}")
 
     def _on_synthesize(self):
         """합성 시작"""
@@ -284,25 +542,25 @@ class SynthesisPanel(QWidget):
             QMessageBox.warning(self, "경고", "출력 파일을 선택하세요.")
             return
 
-        # 워커 스레드 생성
-        self.worker = SynthesisWorker(
-            target_file=self.target_file,
-            source_files=self.source_files,
-            output_file=self.output_file,
-            algorithm=self.algo_combo.currentText(),
-        )
-
-        self.worker.progress.connect(self._on_progress)
-        self.worker.finished.connect(self._on_synthesis_finished)
-        self.worker.error.connect(self._on_synthesis_error)
-
         # UI 업데이트
         self.synthesize_btn.setEnabled(False)
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
 
-        # 워커 시작
-        self.worker.start()
+        # 소스 검색 프로세스 수 (설정 대화상자 값 사용)
+        algorithm = self.algo_combo.currentText()
+        max_workers = 1
+        if algorithm in _PROCESS_SAFE_ALGORITHMS:
+            max_workers = max_workers_setting()
+
+        # 작업 스레드에 전달
+        self.job_requested.emit({
+            "target_file": self.target_file,
+            "source_files": list(self.source_files),
+            "output_file": self.output_file,
+            "algorithm": algorithm,
+            "max_workers": max_workers,
+        })
 
         logger.info("합성 시작")
 
@@ -4,8 +4,14 @@ TTS Panel
 TTS 패널
 """
 
+import asyncio
+import importlib
 import logging
+import os
 import random
+import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
@@ -27,8 +33,14 @@ from PyQt6.QtWidgets import (
     QSlider,
     QFrame,
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import (
+    Qt, QCoreApplication, QObject, QThread, QTimer, QUrl, pyqtSignal, pyqtSlot,
+)
+from PyQt6.QtMultimedia import QSoundEffect
 
+from gui.dialogs.settings import max_workers_setting
+from gui.preload import preload_modules
+from gui.progress import JobCancelled, scaled_progress
 from gui.widgets.player import AudioPlayerWidget
 from utils.temp_manager import TempFileManager
 
@@ -48,107 +60,465 @@ VOICE_PRESETS: Dict[str, Optional[Dict[str, int]]] = {
 # 미리 듣기용 샘플 텍스트
 PREVIEW_SAMPLE_TEXT = "안녕하세요, 음성 테스트입니다."
 
+# 이보다 작은 WAV는 자동 재생 시 QSoundEffect로 바로 재생 (미디어 플레이어 지연 없음)
+_SOUND_EFFECT_MAX_BYTES = 2_000_000
+
+# 소스 목록 변경 후 미리 디코딩을 시작하기까지 대기 시간 (연속 추가/제거를 한 번으로 묶음)
+_PREFETCH_DEBOUNCE_MS = 500
+
+# TTSJobRunner가 사용하는 무거운 모듈 (패널 생성 시 백그라운드에서 미리 임포트)
+_WORKER_MODULES = (
+    "core.tts.backends",
+    "algorithms.traditional.mfcc",
+    "core.tts.pipeline",
+)
+
+# 백엔드 이름 -> (모듈, 클래스 이름), 처음 사용할 때 임포트해 _BACKEND_CLASS_CACHE에 보관
+_BACKEND_CLASSES = {
+    "gtts": ("core.tts.backends.gtts_backend", "GTTSBackend"),
+    "pyttsx3": ("core.tts.backends.pyttsx3_backend", "Pyttsx3Backend"),
+    "edge-tts": ("core.tts.backends.edge_backend", "EdgeTTSBackend"),
+}
+_BACKEND_CLASS_CACHE: Dict[str, type] = {}
+
+# 작업 간 재사용하는 TTS 백엔드 ((이름, 옵션) -> 인스턴스, 최근 사용 순)
+_BACKENDS: "OrderedDict[tuple, Any]" = OrderedDict()
+_BACKENDS_LOCK = threading.Lock()
+_MAX_BACKENDS = 4
+
+# 슬라이더 라벨 갱신 간격 (드래그 중 화면 한 프레임에 한 번)
+_SLIDER_LABEL_INTERVAL_MS = 16
+
+# 이보다 긴 일반 TTS 텍스트는 문장 묶음으로 나눠 동시에 합성 (pyttsx3 제외)
+_TTS_CHUNK_MIN_TEXT = 200
+# 문장 묶음 최소 길이 (짧은 문장은 이웃과 합쳐 요청 수를 줄임)
+_TTS_CHUNK_MIN_CHARS = 60
+# 동시 합성 요청 수
+_TTS_CHUNK_WORKERS = 3
+# 문장 경계 (문장 부호는 앞 문장에 남김)
+_RE_TTS_SENTENCE = re.compile(r"(?<=[.!?。…])\s+")
+
+# 풀에 보관하는 백엔드의 음성 파라미터 간격 (이 안의 슬라이더 변화는 같은 인스턴스 사용)
+_VOICE_PARAM_STEP = 0.05
+
+
+def _quantize_voice_param(value: float) -> float:
+    """음성 파라미터를 _VOICE_PARAM_STEP 간격으로 반올림"""
+    return round(round(value / _VOICE_PARAM_STEP) * _VOICE_PARAM_STEP, 2)
+
+
+def _split_tts_chunks(text: str) -> List[str]:
+    """
+    긴 텍스트를 동시에 합성할 문장 묶음으로 분리
+
+    문장 부호 뒤 공백에서 나누고, _TTS_CHUNK_MIN_CHARS보다 짧은 묶음은
+    다음 문장과 합칩니다.
+
+    Args:
+        text: 입력 텍스트
+
+    Returns:
+        원문 순서대로의 문장 묶음 리스트
+    """
+    chunks = []
+    current = ""
+    for sentence in _RE_TTS_SENTENCE.split(text.strip()):
+        current = f"{current} {sentence}" if current else sentence
+        if len(current) >= _TTS_CHUNK_MIN_CHARS:
+            chunks.append(current)
+            current = ""
+
+    if current:
+        if chunks:
+            chunks[-1] = f"{chunks[-1]} {current}"
+        else:
+            chunks.append(current)
+
+    return chunks
+
 
-class TTSWorker(QThread):
-    """TTS 작업 워커 스레드"""
+def _backend_class(name: str) -> type:
+    """
+    백엔드 클래스 반환 (처음 요청될 때 한 번만 임포트)
+
+    Args:
+        name: 백엔드 이름 ("gtts", "pyttsx3", "edge-tts")
+
+    Returns:
+        BaseTTSEngine 하위 클래스
+    """
+    backend_class = _BACKEND_CLASS_CACHE.get(name)
+    if backend_class is None:
+        module_name, class_name = _BACKEND_CLASSES[name]
+        backend_class = getattr(importlib.import_module(module_name), class_name)
+        _BACKEND_CLASS_CACHE[name] = backend_class
+    return backend_class
+
+
+def _get_backend(name: str, **options):
+    """
+    풀에 보관된 TTS 백엔드 반환 (없으면 생성)
+
+    같은 옵션의 백엔드는 한 번만 만들어 HTTP 세션과 합성 캐시를 공유합니다.
+    최근 사용한 _MAX_BACKENDS개만 보관하며, 여러 스레드에서 호출될 수
+    있으므로 생성은 잠금 안에서 수행합니다.
+
+    Args:
+        name: 백엔드 이름 ("gtts", "pyttsx3", "edge-tts")
+        **options: 백엔드 생성자 인자
+
+    Returns:
+        BaseTTSEngine: TTS 백엔드 인스턴스
+    """
+    key = (name, tuple(sorted(options.items())))
+
+    with _BACKENDS_LOCK:
+        backend = _BACKENDS.get(key)
+        if backend is None:
+            backend = _backend_class(name)(**options)
+            _BACKENDS[key] = backend
+            if len(_BACKENDS) > _MAX_BACKENDS:
+                _BACKENDS.popitem(last=False)
+        else:
+            _BACKENDS.move_to_end(key)
+
+    return backend
+
+
+def _create_gtts(params: dict):
+    """gTTS 백엔드 (옵션이 slow 하나뿐이므로 풀의 인스턴스 재사용, 0.8배 미만이면 slow)"""
+    return _get_backend("gtts", language="ko", slow=params["speech_rate"] < 0.8)
+
+
+def _create_pyttsx3(params: dict):
+    """
+    pyttsx3 백엔드
+
+    pyttsx3.init()은 드라이버별 엔진 하나를 공유하므로 풀의 인스턴스 하나를 재사용하고
+    속도와 볼륨은 작업마다 설정합니다. 속도는 WPM (단어/분) 단위이므로 기본 150에 배율을 적용합니다.
+    """
+    backend = _get_backend("pyttsx3", language="ko")
+    backend.set_voice_params(
+        speech_rate=int(150 * params["speech_rate"]),
+        volume=params["volume"],
+    )
+    return backend
+
+
+def _create_edge_tts(params: dict):
+    """edge-tts 백엔드 (슬라이더 값을 간격 단위로 묶어 같은 설정이면 풀의 인스턴스 재사용)"""
+    return _get_backend(
+        "edge-tts",
+        language="ko-KR",
+        speech_rate=_quantize_voice_param(params["speech_rate"]),
+        pitch=_quantize_voice_param(params["pitch"]),
+        volume=_quantize_voice_param(params["volume"]),
+    )
+
+
+# 백엔드 이름 -> 작업 파라미터로 백엔드를 만드는 함수
+_BACKEND_FACTORIES = {
+    "gtts": _create_gtts,
+    "pyttsx3": _create_pyttsx3,
+    "edge-tts": _create_edge_tts,
+}
+
+
+class TTSJobRunner(QObject):
+    """
+    TTS 작업 실행기
+
+    패널 수명 동안 하나의 QThread에서 계속 실행되며, 작업은 큐 연결된
+    시그널로 전달됩니다. 콜라주 파이프라인(유사도 알고리즘, 콜라주 엔진),
+    디코딩된 소스 오디오와 소스 검색 프로세스 풀은 작업 간 재사용합니다.
+    """
 
     progress = pyqtSignal(int)
     finished = pyqtSignal(dict, bool)  # metadata, auto_play
     error = pyqtSignal(str)
+    cancelled = pyqtSignal()
 
-    def __init__(
-        self,
-        text: str,
-        source_files: List[Path],
-        output_file: Path,
-        backend: str,
-        collage: bool = False,
-        auto_play: bool = False,
-        speech_rate: float = 1.0,
-        pitch: float = 1.0,
-        volume: float = 1.0,
-    ):
+    def __init__(self):
         super().__init__()
-        self.text = text
-        self.source_files = source_files
-        self.output_file = output_file
-        self.backend = backend
-        self.collage = collage
-        self.auto_play = auto_play
-        self.speech_rate = speech_rate
-        self.pitch = pitch
-        self.volume = volume
-
-    def _create_backend(self):
+        self._pipeline = None
+        # 실행 중인 작업 취소 요청 (작업 스레드가 바쁘므로 시그널 대신 GUI 스레드에서 직접 설정)
+        self.cancel_event = threading.Event()
+        # 소스 경로 -> (mtime_ns, AudioFile), 발화마다 소스를 다시 디코딩하지 않도록 유지
+        self._source_audio: Dict[Path, tuple] = {}
+        # 콜라주 소스 검색 프로세스 풀 (발화마다 새로 만들지 않도록 유지)
+        self._search_executor = None
+        self._search_workers = 0
+
+    def _load_sources(self, source_files: List[Path]) -> dict:
+        """
+        콜라주 소스 오디오 반환 (바뀌었거나 새로 추가된 파일만 로드)
+
+        목록에서 빠진 소스는 캐시에서 제거합니다.
+
+        Args:
+            source_files: 소스 오디오 파일 리스트
+
+        Returns:
+            소스 경로 -> AudioFile 딕셔너리
         """
-        선택된 백엔드에 따라 TTS 엔진 인스턴스를 생성
+        from core.audio.io import AudioFile
+
+        cache = {}
+        for source_file in source_files:
+            mtime_ns = source_file.stat().st_mtime_ns
+            entry = self._source_audio.get(source_file)
+            if entry is None or entry[0] != mtime_ns:
+                entry = (mtime_ns, AudioFile.load(source_file))
+            cache[source_file] = entry
+
+        self._source_audio = cache
+        return {path: audio_file for path, (_, audio_file) in cache.items()}
+
+    def _get_search_executor(self, max_workers: int, n_sources: int):
+        """
+        콜라주 소스 검색 프로세스 풀 반환 (워커 수 설정이 바뀌면 다시 생성)
+
+        Args:
+            max_workers: 설정된 프로세스 수
+            n_sources: 소스 파일 수
+
+        Returns:
+            ProcessPoolExecutor, 순차 처리가 나으면 None
+        """
+        if max_workers <= 1 or n_sources <= 1:
+            return None
+
+        if self._search_executor is None or self._search_workers != max_workers:
+            from core.synthesis.engine import create_search_executor
+
+            self.shutdown()
+            self._search_executor = create_search_executor(max_workers)
+            self._search_workers = max_workers
+
+        return self._search_executor
+
+    def shutdown(self):
+        """소스 검색 프로세스 풀 종료"""
+        if self._search_executor is not None:
+            self._search_executor.shutdown(cancel_futures=True)
+            self._search_executor = None
+
+    def _create_backend(self, params: dict):
+        """
+        선택된 백엔드에 따라 TTS 엔진 인스턴스를 생성 (gTTS, edge-tts는 풀에서 재사용)
+
+        Args:
+            params: 작업 파라미터 (backend, speech_rate, pitch, volume)
 
         Returns:
             BaseTTSEngine: TTS 백엔드 인스턴스
         """
-        if self.backend == "gtts":
-            from core.tts.backends import GTTSBackend
-            # gTTS는 slow 옵션으로 속도 조절 (0.8 미만일 때 slow=True)
-            return GTTSBackend(language="ko", slow=(self.speech_rate < 0.8))
-
-        elif self.backend == "pyttsx3":
-            from core.tts.backends import Pyttsx3Backend
-            # pyttsx3는 WPM (단어/분) 단위 사용, 기본 150에 배율 적용
-            return Pyttsx3Backend(
-                language="ko",
-                speech_rate=int(150 * self.speech_rate),
-                volume=self.volume,
-            )
+        factory = _BACKEND_FACTORIES.get(params["backend"])
+        if factory is None:
+            # 알 수 없는 이름은 gTTS 기본 옵션 사용
+            return _get_backend("gtts", language="ko", slow=False)
+        return factory(params)
+
+    def _get_pipeline(self, tts_backend):
+        """
+        콜라주 파이프라인 반환 (처음 한 번만 생성, 이후 백엔드만 교체)
+
+        Args:
+            tts_backend: 이번 작업의 TTS 백엔드
 
-        elif self.backend == "edge-tts":
-            from core.tts.backends import EdgeTTSBackend
-            return EdgeTTSBackend(
-                language="ko-KR",
-                speech_rate=self.speech_rate,
-                pitch=self.pitch,
-                volume=self.volume,
+        Returns:
+            TTSPipeline: 콜라주 파이프라인
+        """
+        if self._pipeline is None:
+            from core.tts.pipeline import TTSPipeline
+            from algorithms.traditional.mfcc import MFCCSimilarity
+            from core.synthesis.cache import FeatureCache
+
+            self._pipeline = TTSPipeline(
+                tts_engine=tts_backend,
+                similarity_algorithm=MFCCSimilarity(feature_cache=FeatureCache()),
             )
 
-        else:
-            # 기본값: gTTS
-            from core.tts.backends import GTTSBackend
-            return GTTSBackend(language="ko")
+        # 백엔드만 작업별로 교체 (콜라주 엔진과 세그먼트 캐시는 유지)
+        self._pipeline.tts_engine = tts_backend
+        return self._pipeline
+
+    def _synthesize_chunks(self, tts_backend, chunks: List[str], output_file: Path):
+        """
+        문장 묶음을 동시에 합성해 순서대로 이어 WAV로 저장
+
+        gTTS/edge-tts 요청은 대부분 응답 대기이므로 여러 묶음을 함께 보내면
+        전체 대기 시간이 줄어듭니다. 진행률은 묶음이 끝날 때마다 전달합니다.
+
+        Args:
+            tts_backend: TTS 백엔드 (여러 스레드에서 호출 가능해야 함)
+            chunks: 문장 묶음 리스트
+            output_file: 출력 WAV 경로
+        """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        import numpy as np
+        import soundfile as sf
+
+        from core.audio.bufferpool import get_buffer_pool
+
+        self.progress.emit(10)
+
+        parts = [None] * len(chunks)
+        with ThreadPoolExecutor(max_workers=_TTS_CHUNK_WORKERS) as executor:
+            futures = {
+                executor.submit(tts_backend.synthesize, chunk, None): i
+                for i, chunk in enumerate(chunks)
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                parts[futures[future]] = future.result()
+                self.progress.emit(10 + done * 85 // len(chunks))
 
-    def run(self):
-        """워커 실행"""
         try:
-            tts_backend = self._create_backend()
+            sample_rate = parts[0][1]
+            sf.write(str(output_file), np.concatenate([audio for audio, _ in parts]), sample_rate)
+        finally:
+            # 백엔드가 풀에서 받은 버퍼면 다음 요청에서 재사용
+            pool = get_buffer_pool()
+            for audio, _ in parts:
+                pool.put(audio)
+
+    async def _synthesize_with_sources(self, tts_backend, text: str, source_files: List[Path]):
+        """
+        TTS 합성과 소스 오디오 로드를 동시에 실행
+
+        gTTS는 대부분 HTTP 응답을 기다리므로 그동안 아직 디코딩되지 않은
+        소스를 읽습니다. 이 작업이 끝날 때까지 작업 스레드는 다른 슬롯을
+        실행하지 않으므로 _load_sources가 겹쳐 실행되지 않습니다.
 
-            if self.collage:
+        Args:
+            tts_backend: TTS 백엔드
+            text: TTS에 전달할 텍스트
+            source_files: 소스 오디오 파일 리스트
+
+        Returns:
+            ((target_audio, target_sr), 소스 경로 -> AudioFile) 튜플
+        """
+        return await asyncio.gather(
+            asyncio.to_thread(tts_backend.synthesize, text, None),
+            asyncio.to_thread(self._load_sources, source_files),
+        )
+
+    @pyqtSlot(object)
+    def warm_up(self, params: dict):
+        """
+        첫 작업 전 유휴 시간에 임시 디렉토리, 백엔드와 콜라주 파이프라인 미리 생성
+
+        Args:
+            params: backend, speech_rate, pitch, volume
+        """
+        try:
+            TempFileManager.get_temp_dir()
+            self._get_pipeline(self._create_backend(params))
+        except Exception as e:
+            # 실제 오류는 작업 실행 시 다시 보고됨
+            logger.debug(f"파이프라인 준비 실패: {str(e)}")
+
+    @pyqtSlot(object)
+    def prefetch_sources(self, source_files: list):
+        """
+        소스 목록이 바뀌었을 때 작업 사이 유휴 시간에 미리 디코딩
+
+        Args:
+            source_files: 현재 소스 오디오 파일 리스트
+        """
+        try:
+            self._load_sources(source_files)
+        except Exception as e:
+            # 실제 오류는 작업 실행 시 다시 보고됨
+            logger.debug(f"소스 미리 로드 실패: {str(e)}")
+
+    @pyqtSlot(object)
+    def run_job(self, params: dict):
+        """
+        TTS 작업 실행
+
+        Args:
+            params: text, source_files, output_file, backend, collage,
+                auto_play, speech_rate, pitch, volume, max_workers (콜라주)
+        """
+        output_file = params["output_file"]
+        auto_play = params["auto_play"]
+
+        try:
+            tts_backend = self._create_backend(params)
+
+            if params["collage"]:
                 # TTS-to-Collage 파이프라인
-                from algorithms.traditional.mfcc import MFCCSimilarity
-                from core.tts.pipeline import TTSPipeline
+                pipeline = self._get_pipeline(tts_backend)
 
-                sim_algo = MFCCSimilarity()
-                pipeline = TTSPipeline(tts_engine=tts_backend, similarity_algorithm=sim_algo)
+                from core.audio.bufferpool import get_buffer_pool
 
-                self.progress.emit(50)
+                processed_text = pipeline.prepare_text(params["text"])
+                self.progress.emit(10)
 
-                metadata = pipeline.synthesize_collage(
-                    text=self.text,
-                    source_files=self.source_files,
-                    output_path=self.output_file,
+                # TTS(네트워크 대기)와 소스 디코딩을 겹쳐서 실행
+                (target_audio, target_sr), source_audio = asyncio.run(
+                    self._synthesize_with_sources(
+                        tts_backend, processed_text, params["source_files"]
+                    )
                 )
+                self.progress.emit(50)
+
+                try:
+                    if self.cancel_event.is_set():
+                        raise JobCancelled()
+
+                    # 콜라주 단계 진행률을 50~95 구간으로 전달 (소스마다 취소 여부 확인)
+                    metadata = pipeline.synthesize_collage_from_target(
+                        text=params["text"],
+                        processed_text=processed_text,
+                        target_audio=target_audio,
+                        target_sr=target_sr,
+                        source_files=params["source_files"],
+                        output_path=output_file,
+                        source_audio=source_audio,
+                        executor=self._get_search_executor(
+                            params.get("max_workers", 1), len(params["source_files"])
+                        ),
+                        progress_callback=scaled_progress(
+                            self.progress.emit, 50, 95, self.cancel_event
+                        ),
+                    )
+                finally:
+                    # 백엔드가 풀에서 받은 버퍼면 다음 요청에서 재사용
+                    get_buffer_pool().put(target_audio)
 
                 self.progress.emit(100)
-                self.finished.emit(metadata, self.auto_play)
+                self.finished.emit(metadata, auto_play)
 
             else:
                 # 일반 TTS
-                self.progress.emit(50)
-
-                audio_data, sample_rate = tts_backend.synthesize(
-                    text=self.text,
-                    output_path=self.output_file,
-                )
+                chunks = [params["text"]]
+                if (
+                    len(params["text"]) > _TTS_CHUNK_MIN_TEXT
+                    and params["backend"] != "pyttsx3"
+                    and Path(output_file).suffix.lower() == ".wav"
+                ):
+                    chunks = _split_tts_chunks(params["text"])
+
+                if len(chunks) > 1:
+                    self._synthesize_chunks(tts_backend, chunks, output_file)
+                else:
+                    self.progress.emit(50)
+
+                    tts_backend.synthesize(
+                        text=params["text"],
+                        output_path=output_file,
+                        return_array=False,
+                    )
 
                 self.progress.emit(100)
-                self.finished.emit({"output_path": str(self.output_file)}, self.auto_play)
+                self.finished.emit({"output_path": str(output_file)}, auto_play)
+
+        except JobCancelled:
+            logger.info("TTS 작업 취소됨")
+            self.cancelled.emit()
 
         except Exception as e:
             logger.error(f"TTS 오류: {str(e)}", exc_info=True)
@@ -158,17 +528,68 @@ class TTSWorker(QThread):
 class TTSPanel(QWidget):
     """TTS 패널"""
 
+    # 작업 스레드로 TTS 작업 전달 (스레드 경계를 넘으므로 큐 연결)
+    job_requested = pyqtSignal(object)
+    # 소스 목록 변경 알림 (작업 스레드에서 미리 디코딩)
+    sources_changed = pyqtSignal(object)
+    # 작업 스레드에서 백엔드와 콜라주 파이프라인 미리 생성
+    warmup_requested = pyqtSignal(object)
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
         self.source_files: List[Path] = []
+        self._source_set: set = set()
         self.output_file: Optional[Path] = None
         self.last_output_path: Optional[Path] = None  # 마지막 생성된 음성 경로
+        self._sound_effect: Optional[QSoundEffect] = None  # 짧은 WAV 자동 재생용 (첫 사용 시 생성)
+        self._home_str = str(Path.home())  # 파일 대화상자 기본 경로
+
+        # TTS 작업 스레드 (한 번 만들어 계속 재사용)
+        self._job_thread = QThread(self)
+        self._runner = TTSJobRunner()
+        self._runner.moveToThread(self._job_thread)
+        self._job_thread.finished.connect(self._runner.deleteLater)
+        self.job_requested.connect(self._runner.run_job)
+        self.sources_changed.connect(self._runner.prefetch_sources)
+        self.warmup_requested.connect(self._runner.warm_up)
+        self._runner.progress.connect(self._on_progress)
+        self._runner.finished.connect(self._on_tts_finished)
+        self._runner.error.connect(self._on_tts_error)
+        self._runner.cancelled.connect(self._on_tts_cancelled)
+        self._job_thread.start()
+        QCoreApplication.instance().aboutToQuit.connect(self._stop_job_thread)
+
+        # 소스 미리 디코딩 요청 디바운스 (마지막 변경 후 한 번만 전달)
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(_PREFETCH_DEBOUNCE_MS)
+        self._prefetch_timer.timeout.connect(
+            lambda: self.sources_changed.emit(list(self.source_files))
+        )
+
+        # 슬라이더 라벨 갱신 묶음 (드래그 중 값마다 다시 배치하지 않도록)
+        self._slider_timer = QTimer(self)
+        self._slider_timer.setSingleShot(True)
+        self._slider_timer.setInterval(_SLIDER_LABEL_INTERVAL_MS)
+        self._slider_timer.timeout.connect(self._update_slider_labels)
 
         self._init_ui()
 
+        # 첫 생성 때 임포트 지연이 없도록 워커 모듈 미리 로드
+        preload_modules(_WORKER_MODULES)
+        self.warmup_requested.emit(
+            {"backend": self.backend_combo.currentText(), **self._get_voice_params()}
+        )
+
         logger.debug("TTSPanel 초기화")
 
+    def _stop_job_thread(self):
+        """애플리케이션 종료 시 작업 스레드 정리"""
+        self._job_thread.quit()
+        self._job_thread.wait()
+        self._runner.shutdown()
+
     def _init_ui(self):
         """UI 초기화"""
         layout = QVBoxLayout(self)
@@ -372,6 +793,12 @@ class TTSPanel(QWidget):
         self.collage_btn.clicked.connect(lambda: self._on_generate_tts(collage=True))
         button_layout.addWidget(self.collage_btn)
 
+        self.cancel_btn = QPushButton("취소")
+        self.cancel_btn.setToolTip("진행 중인 콜라주 생성을 중단합니다")
+        self.cancel_btn.clicked.connect(self._on_cancel)
+        self.cancel_btn.setEnabled(False)
+        button_layout.addWidget(self.cancel_btn)
+
         layout.addLayout(button_layout)
 
     def _get_voice_params(self) -> Dict[str, float]:
@@ -388,14 +815,23 @@ class TTSPanel(QWidget):
         }
 
     def _on_slider_changed(self):
-        """슬라이더 값 변경 시 라벨 업데이트"""
+        """슬라이더 값 변경 시 라벨 업데이트 예약 (타이머 동안의 변경은 한 번으로 묶음)"""
+        if not self._slider_timer.isActive():
+            self._slider_timer.start()
+
+    def _update_slider_labels(self):
+        """슬라이더 라벨 업데이트 (글자가 바뀐 라벨만 갱신)"""
         speed = self.speed_slider.value()
         pitch = self.pitch_slider.value()
         volume = self.volume_slider.value()
 
-        self.speed_label.setText(f"{speed / 100:.1f}x")
-        self.pitch_label.setText(f"{pitch / 100:.1f}x")
-        self.volume_label.setText(f"{volume}%")
+        for label, text in (
+            (self.speed_label, f"{speed / 100:.1f}x"),
+            (self.pitch_label, f"{pitch / 100:.1f}x"),
+            (self.volume_label, f"{volume}%"),
+        ):
+            if label.text() != text:
+                label.setText(text)
 
     def _on_preset_changed(self, preset_name: str):
         """프리셋 선택 시 슬라이더 값 변경"""
@@ -426,7 +862,7 @@ class TTSPanel(QWidget):
         self.volume_slider.blockSignals(False)
 
         # 라벨 업데이트
-        self._on_slider_changed()
+        self._update_slider_labels()
 
         logger.debug(f"프리셋 적용: {preset_name} (속도={speed}, 피치={pitch}, 볼륨={volume})")
 
@@ -448,29 +884,22 @@ class TTSPanel(QWidget):
     def _on_preview(self):
         """미리 듣기: 샘플 텍스트로 현재 설정 테스트"""
         output_path = TempFileManager.create_temp_file(suffix=".wav")
-        params = self._get_voice_params()
-
-        self.worker = TTSWorker(
-            text=PREVIEW_SAMPLE_TEXT,
-            source_files=[],
-            output_file=output_path,
-            backend=self.backend_combo.currentText(),
-            collage=False,
-            auto_play=True,
-            speech_rate=params["speech_rate"],
-            pitch=params["pitch"],
-            volume=params["volume"],
-        )
 
-        self.worker.progress.connect(self._on_progress)
-        self.worker.finished.connect(self._on_tts_finished)
-        self.worker.error.connect(self._on_tts_error)
+        params = {
+            "text": PREVIEW_SAMPLE_TEXT,
+            "source_files": [],
+            "output_file": output_path,
+            "backend": self.backend_combo.currentText(),
+            "collage": False,
+            "auto_play": True,
+            **self._get_voice_params(),
+        }
 
         self._set_buttons_enabled(False)
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
 
-        self.worker.start()
+        self.job_requested.emit(params)
         logger.info("미리 듣기 시작")
 
     def _on_replay(self):
@@ -487,37 +916,53 @@ class TTSPanel(QWidget):
         self.preview_btn.setEnabled(enabled)
         self.speak_btn.setEnabled(enabled)
         self.collage_btn.setEnabled(enabled)
+        if enabled:
+            self.cancel_btn.setEnabled(False)
 
     def _on_add_source(self):
         """소스 파일 추가"""
         file_paths, _ = QFileDialog.getOpenFileNames(
             self,
             "소스 오디오 파일 선택",
-            str(Path.home()),
+            self._home_str,
             "Audio Files (*.wav *.mp3 *.flac);;All Files (*)",
         )
 
+        names = []
         for file_path in file_paths:
-            source_file = Path(file_path)
-            if source_file not in self.source_files:
+            # 심볼릭 링크/대소문자만 다른 경로도 같은 파일로 중복 제거
+            source_file = Path(os.path.realpath(file_path))
+            if source_file not in self._source_set:
+                self._source_set.add(source_file)
                 self.source_files.append(source_file)
-                self.source_list.addItem(source_file.name)
+                names.append(source_file.name)
                 logger.info(f"소스 파일 추가: {source_file}")
 
+        if names:
+            # 목록 갱신은 한 번에 (항목마다 다시 그리지 않도록)
+            self.source_list.setUpdatesEnabled(False)
+            self.source_list.addItems(names)
+            self.source_list.setUpdatesEnabled(True)
+
+            self._prefetch_timer.start()
+
     def _on_remove_source(self):
         """소스 파일 제거"""
         current_row = self.source_list.currentRow()
         if current_row >= 0:
             removed_file = self.source_files.pop(current_row)
+            self._source_set.discard(removed_file)
             self.source_list.takeItem(current_row)
             logger.info(f"소스 파일 제거: {removed_file}")
 
+            self._prefetch_timer.start()
+
     def _on_select_output(self):
         """출력 파일 선택"""
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "출력 파일 선택",
-            str(Path.home()),
+            self._home_str,
             "Audio Files (*.wav *.mp3);;All Files (*)",
         )
 
@@ -554,32 +999,25 @@ class TTSPanel(QWidget):
 
         # 임시 파일 경로 생성
         output_path = TempFileManager.create_temp_file(suffix=".wav")
-        params = self._get_voice_params()
-
-        # 워커 스레드 생성 (auto_play=True)
-        self.worker = TTSWorker(
-            text=text,
-            source_files=[],
-            output_file=output_path,
-            backend=self.backend_combo.currentText(),
-            collage=False,
-            auto_play=True,
-            speech_rate=params["speech_rate"],
-            pitch=params["pitch"],
-            volume=params["volume"],
-        )
 
-        self.worker.progress.connect(self._on_progress)
-        self.worker.finished.connect(self._on_tts_finished)
-        self.worker.error.connect(self._on_tts_error)
+        # 작업 파라미터 (auto_play=True)
+        params = {
+            "text": text,
+            "source_files": [],
+            "output_file": output_path,
+            "backend": self.backend_combo.currentText(),
+            "collage": False,
+            "auto_play": True,
+            **self._get_voice_params(),
+        }
 
         # UI 업데이트
         self._set_buttons_enabled(False)
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
 
-        # 워커 시작
-        self.worker.start()
+        # 작업 스레드에 전달
+        self.job_requested.emit(params)
 
         logger.info("바로 듣기 시작")
 
@@ -602,35 +1040,48 @@ class TTSPanel(QWidget):
 
         # auto_play 옵션 확인
         auto_play = self.auto_play_checkbox.isChecked()
-        params = self._get_voice_params()
-
-        # 워커 스레드 생성
-        self.worker = TTSWorker(
-            text=text,
-            source_files=self.source_files,
-            output_file=output_path,
-            backend=self.backend_combo.currentText(),
-            collage=collage,
-            auto_play=auto_play,
-            speech_rate=params["speech_rate"],
-            pitch=params["pitch"],
-            volume=params["volume"],
-        )
 
-        self.worker.progress.connect(self._on_progress)
-        self.worker.finished.connect(self._on_tts_finished)
-        self.worker.error.connect(self._on_tts_error)
+        # 작업 파라미터
+        params = {
+            "text": text,
+            "source_files": list(self.source_files),
+            "output_file": output_path,
+            "backend": self.backend_combo.currentText(),
+            "collage": collage,
+            "auto_play": auto_play,
+            **self._get_voice_params(),
+        }
+
+        if collage:
+            # 소스 검색 프로세스 수 (설정 대화상자 값 사용)
+            params["max_workers"] = max_workers_setting()
 
         # UI 업데이트
         self._set_buttons_enabled(False)
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
 
-        # 워커 시작
-        self.worker.start()
+        # 취소는 콜라주 단계에서만 지원 (작업 전달 전에 이전 요청 초기화)
+        self._runner.cancel_event.clear()
+        self.cancel_btn.setEnabled(collage)
+
+        # 작업 스레드에 전달
+        self.job_requested.emit(params)
 
         logger.info(f"TTS 생성 시작 (collage={collage}, auto_play={auto_play})")
 
+    def _on_cancel(self):
+        """콜라주 생성 취소 (다음 진행률 보고 시점에 중단)"""
+        self._runner.cancel_event.set()
+        self.cancel_btn.setEnabled(False)
+
+        logger.info("TTS 작업 취소 요청")
+
+    def _on_tts_cancelled(self):
+        """TTS 작업 취소 완료"""
+        self._set_buttons_enabled(True)
+        self.progress_bar.setVisible(False)
+
     def _on_progress(self, value):
         """진행률 업데이트"""
         self.progress_bar.setValue(value)
@@ -650,13 +1101,38 @@ class TTSPanel(QWidget):
             QMessageBox.information(self, "완료", f"음성 생성이 완료되었습니다.\n\n출력: {output_path}")
 
         # 결과 플레이어 로드 (및 자동 재생)
-        if auto_play:
+        if auto_play and self._is_short_wav(output_path):
+            # 짧은 WAV는 저지연 재생, 플레이어에는 다시 듣기/탐색용으로만 로드
+            if self._sound_effect is None:
+                self._sound_effect = QSoundEffect(self)
+            self._sound_effect.setSource(QUrl.fromLocalFile(str(output_path.absolute())))
+            self._sound_effect.play()
+            self.player_widget.load_audio(output_path)
+        elif auto_play:
             self.player_widget.load_and_play(output_path)
         else:
             self.player_widget.load_audio(output_path)
 
         logger.info(f"TTS 생성 완료 (auto_play={auto_play})")
 
+    @staticmethod
+    def _is_short_wav(path: Path) -> bool:
+        """
+        QSoundEffect로 재생할 짧은 WAV 파일인지 확인
+
+        gTTS는 확장자와 관계없이 MP3를 저장하므로 헤더로 형식을 확인합니다.
+        """
+        if path.suffix.lower() != ".wav":
+            return False
+        try:
+            if path.stat().st_size >= _SOUND_EFFECT_MAX_BYTES:
+                return False
+            with open(path, "rb") as f:
+                header = f.read(12)
+        except OSError:
+            return False
+        return header[:4] == b"RIFF" and header[8:12] == b"WAVE"
+
     def _on_tts_error(self, error_msg):
         """TTS 생성 오류"""
         self._set_buttons_enabled(True)
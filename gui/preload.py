@@ -0,0 +1,42 @@
+"""
+Module Preloader
+
+무거운 모듈을 백그라운드에서 미리 임포트하는 유틸리티
+"""
+
+import importlib
+import logging
+from typing import Iterable
+
+from PyQt6.QtCore import QRunnable, QThreadPool
+
+logger = logging.getLogger(__name__)
+
+
+class ModulePreloader(QRunnable):
+    """모듈 사전 로드 작업 (sys.modules만 채우고 참조는 보관하지 않음)"""
+
+    def __init__(self, modules: Iterable[str]):
+        super().__init__()
+        self.modules = tuple(modules)
+
+    def run(self):
+        """워커 실행"""
+        for name in self.modules:
+            try:
+                importlib.import_module(name)
+            except Exception as e:
+                # 실제 오류는 작업 실행 시 다시 보고됨
+                logger.debug(f"모듈 사전 로드 실패 ({name}): {str(e)}")
+
+
+def preload_modules(modules: Iterable[str]):
+    """
+    전역 QThreadPool에서 모듈 사전 로드
+
+    워커의 지연 임포트가 첫 실행 때 sys.modules 조회로 끝나도록 합니다.
+
+    Args:
+        modules: 모듈 경로 목록
+    """
+    QThreadPool.globalInstance().start(ModulePreloader(modules))
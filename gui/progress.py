@@ -0,0 +1,49 @@
+"""
+Progress Helpers
+
+작업 스레드 진행률 전달 유틸리티
+"""
+
+import threading
+from typing import Callable, Optional
+
+
+class JobCancelled(Exception):
+    """사용자가 작업을 취소함 (진행률 콜백에서 발생)"""
+
+
+def scaled_progress(
+    emit: Callable[[int], None],
+    start: int,
+    end: int,
+    cancel_event: Optional[threading.Event] = None,
+) -> Callable:
+    """
+    엔진 진행률 콜백을 정수 진행률 시그널로 변환
+
+    엔진의 (0.0~1.0, 메시지) 진행률을 start~end 범위의 정수로 바꾸고,
+    값이 바뀔 때만 emit을 호출하므로 큐 연결된 시그널이 최대
+    (end - start + 1)번만 전달됩니다.
+
+    Args:
+        emit: 정수 진행률을 받는 함수 (예: pyqtSignal.emit)
+        start: 0.0에 해당하는 진행률
+        end: 1.0에 해당하는 진행률
+        cancel_event: 설정되면 다음 진행률 보고에서 JobCancelled 발생
+
+    Returns:
+        progress_callback(progress, message) 함수
+    """
+    last = None
+
+    def callback(progress: float, message: str = ""):
+        nonlocal last
+        if cancel_event is not None and cancel_event.is_set():
+            raise JobCancelled()
+
+        value = start + int(progress * (end - start))
+        if value != last:
+            last = value
+            emit(value)
+
+    return callback
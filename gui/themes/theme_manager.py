@@ -6,7 +6,7 @@ Theme Manager
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QFontDatabase, QFont
@@ -23,6 +23,9 @@ class ThemeManager:
     # 커스텀 폰트 이름
     NEO_FONT_FAMILY: Optional[str] = None
 
+    # 스타일시트 캐시 ((경로, 폰트 이름) -> (수정 시각, 폰트 치환된 스타일시트))
+    _QSS_CACHE: Dict[Tuple[str, Optional[str]], Tuple[int, str]] = {}
+
     def __init__(self, app: QApplication):
         """
         테마 관리자 초기화
@@ -87,22 +90,18 @@ class ThemeManager:
         """Windows 98 테마 적용"""
         qss_path = self._themes_dir / "win98" / "style.qss"
 
-        if not qss_path.exists():
+        try:
+            mtime_ns = qss_path.stat().st_mtime_ns
+        except OSError:
             logger.error(f"스타일시트 파일을 찾을 수 없음: {qss_path}")
             return False
 
         try:
-            with open(qss_path, "r", encoding="utf-8") as f:
-                stylesheet = f.read()
-
-            # 커스텀 폰트가 로드되었으면 폰트 이름 치환
-            if ThemeManager.NEO_FONT_FAMILY:
-                stylesheet = stylesheet.replace(
-                    '"NeoDunggeunmo Pro"',
-                    f'"{ThemeManager.NEO_FONT_FAMILY}"'
-                )
+            stylesheet = self._load_stylesheet(qss_path, mtime_ns)
 
-            self.app.setStyleSheet(stylesheet)
+            # 같은 스타일시트가 이미 적용되어 있으면 Qt의 재파싱/재폴리시 생략
+            if self.app.styleSheet() != stylesheet:
+                self.app.setStyleSheet(stylesheet)
             self.current_theme = "win98"
             logger.info("Windows 98 테마 적용 완료")
             return True
@@ -111,6 +110,36 @@ class ThemeManager:
             logger.error(f"테마 적용 실패: {e}")
             return False
 
+    @classmethod
+    def _load_stylesheet(cls, qss_path: Path, mtime_ns: int) -> str:
+        """
+        폰트 이름을 치환한 스타일시트 반환 (파일이 바뀌지 않았으면 캐시 사용)
+
+        Args:
+            qss_path: 스타일시트 경로
+            mtime_ns: 스타일시트 수정 시각
+
+        Returns:
+            스타일시트 문자열
+        """
+        key = (str(qss_path), cls.NEO_FONT_FAMILY)
+        cached = cls._QSS_CACHE.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        with open(qss_path, "r", encoding="utf-8") as f:
+            stylesheet = f.read()
+
+        # 커스텀 폰트가 로드되었으면 폰트 이름 치환
+        if cls.NEO_FONT_FAMILY:
+            stylesheet = stylesheet.replace(
+                '"NeoDunggeunmo Pro"',
+                f'"{cls.NEO_FONT_FAMILY}"'
+            )
+
+        cls._QSS_CACHE[key] = (mtime_ns, stylesheet)
+        return stylesheet
+
     def get_current_theme(self) -> Optional[str]:
         """현재 적용된 테마 이름 반환"""
         return self.current_theme
@@ -18,6 +18,50 @@ from gui.themes.win98.colors import Win98Colors
 logger = logging.getLogger(__name__)
 
 
+def compute_spectrogram_db(
+    audio_data: np.ndarray,
+    n_fft: int = 2048,
+    hop_length: int = 512,
+    top_db: float = 80.0,
+) -> np.ndarray:
+    """
+    dB 스케일 스펙트로그램 계산
+
+    위젯 없이 계산만 하므로 워커 스레드에서 미리 계산해 캐시할 수 있습니다.
+
+    Args:
+        audio_data: 오디오 데이터 (1D 또는 2D numpy array)
+        n_fft: FFT 윈도우 크기
+        hop_length: Hop 길이
+        top_db: 최대값 대비 표시할 dB 범위
+
+    Returns:
+        (주파수 빈, 프레임) 모양의 dB 배열
+    """
+    # 스테레오인 경우 모노로 변환
+    if audio_data.ndim == 2:
+        audio_data = np.mean(audio_data, axis=1)
+
+    try:
+        import librosa
+        import scipy.fft
+
+        # librosa는 scipy.fft를 사용하므로 FFT를 모든 코어로 분산
+        # (FFT 계획은 pocketfft가 크기별로 캐시해 재사용)
+        with scipy.fft.set_workers(-1):
+            magnitude = np.abs(librosa.stft(audio_data, n_fft=n_fft, hop_length=hop_length))
+    except ImportError:
+        from scipy.signal import stft
+
+        _, _, Z = stft(audio_data, nperseg=n_fft, noverlap=n_fft - hop_length)
+        magnitude = np.abs(Z)
+
+    # amplitude_to_db(ref=np.max)와 동일한 변환
+    S_db = 20.0 * np.log10(np.maximum(magnitude, 1e-5))
+    S_db -= S_db.max()
+    return np.maximum(S_db, -top_db)
+
+
 class SpectrogramWidget(QWidget):
     """스펙트로그램 시각화 위젯"""
 
@@ -131,6 +175,41 @@ class SpectrogramWidget(QWidget):
 
         logger.debug(f"스펙트로그램 그리기 완료: {sample_rate} Hz")
 
+    def plot_spectrogram_precomputed(
+        self,
+        S_db: np.ndarray,
+        sample_rate: int,
+        hop_length: int = 512,
+    ):
+        """
+        미리 계산된 스펙트로그램 그리기
+
+        Args:
+            S_db: compute_spectrogram_db()의 결과
+            sample_rate: 샘플레이트
+            hop_length: 계산에 사용한 Hop 길이
+        """
+        self.sample_rate = sample_rate
+
+        # 초기화 (Windows 98 스타일 유지)
+        self.ax.clear()
+        self._apply_win98_style()
+
+        duration = S_db.shape[1] * hop_length / sample_rate
+        img = self.ax.imshow(
+            S_db,
+            origin="lower",
+            aspect="auto",
+            extent=[0, duration, 0, sample_rate / 2],
+            cmap="viridis",
+        )
+
+        self.figure.colorbar(img, ax=self.ax, format="%+2.0f dB")
+
+        self.canvas.draw()
+
+        logger.debug(f"스펙트로그램 그리기 완료 (사전 계산): {sample_rate} Hz")
+
     def clear(self):
         """스펙트로그램 지우기"""
         self.ax.clear()
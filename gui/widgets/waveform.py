@@ -108,6 +108,38 @@ class WaveformWidget(QWidget):
 
         logger.debug(f"파형 그리기 완료: {len(audio_data)} 샘플, {sample_rate} Hz")
 
+    def plot_envelope(self, envelope: np.ndarray, duration: float):
+        """
+        최소/최대 포락선으로 파형 그리기
+
+        전체 샘플 없이 스트리밍으로 계산한 포락선만으로 긴 파일을 표시합니다.
+
+        Args:
+            envelope: (점 개수, 2) 모양의 (최소, 최대) 배열
+            duration: 오디오 길이 (초)
+        """
+        self.audio_data = None
+        self.sample_rate = None
+
+        # 초기화 (Windows 98 스타일 유지)
+        self.ax.clear()
+        self._apply_win98_style()
+
+        time = np.linspace(0, duration, len(envelope))
+        self.ax.fill_between(
+            time,
+            envelope[:, 0],
+            envelope[:, 1],
+            linewidth=0.5,
+            color=Win98Colors.PLOT_LINE,
+        )
+        self.ax.set_xlim(0, duration)
+        self.ax.set_ylim(-1.0, 1.0)
+
+        self.canvas.draw()
+
+        logger.debug(f"포락선 그리기 완료: {len(envelope)} 점, {duration:.1f}초")
+
     def clear(self):
         """파형 지우기"""
         self.ax.clear()
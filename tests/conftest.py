@@ -52,6 +52,27 @@ def sample_audio_stereo():
     return audio_data, sample_rate
 
 
+@pytest.fixture
+def mp3_bytes():
+    """
+    스테레오 MP3 인코딩 결과를 생성합니다 (TTS 백엔드 응답 대용).
+
+    Returns:
+        bytes: 24kHz 스테레오 사인파 MP3 데이터
+    """
+    import io
+    import soundfile as sf
+
+    sample_rate = 24000
+    t = np.arange(sample_rate, dtype=np.float32) / sample_rate
+    stereo = np.stack([np.sin(2 * np.pi * 220 * t), np.sin(2 * np.pi * 330 * t)], axis=1) * 0.3
+
+    buffer = io.BytesIO()
+    sf.write(buffer, stereo, sample_rate, format="MP3")
+
+    return buffer.getvalue()
+
+
 @pytest.fixture
 def temp_audio_file(tmp_path, sample_audio_mono):
     """
@@ -98,3 +119,39 @@ def config():
     from config import get_config
 
     return get_config()
+
+
+@pytest.fixture
+def stub_collage_pipeline(monkeypatch):
+    """
+    콜라주 단계를 대체한 TTSPipeline 생성 함수를 반환합니다.
+
+    대체된 콜라주 단계는 합성 없이 호출 정보(target_sr, length, output_file,
+    thread)를 기록하고, on_collage가 주어지면 먼저 호출합니다.
+
+    Returns:
+        Callable: (tts_engine, on_collage=None) -> (TTSPipeline, 호출 기록 리스트)
+    """
+    import threading
+    from algorithms.traditional.mfcc import MFCCSimilarity
+    from core.tts.pipeline import TTSPipeline
+
+    def make(tts_engine, on_collage=None):
+        pipeline = TTSPipeline(tts_engine, MFCCSimilarity())
+        calls = []
+
+        def synthesize_from_array(target_audio, target_sr, source_files, output_file, **kwargs):
+            if on_collage is not None:
+                on_collage()
+            calls.append({
+                "target_sr": target_sr,
+                "length": len(target_audio),
+                "output_file": str(output_file),
+                "thread": threading.current_thread().name,
+            })
+            return {"output_file": str(output_file)}
+
+        monkeypatch.setattr(pipeline.collage_engine, "synthesize_from_array", synthesize_from_array)
+        return pipeline, calls
+
+    return make
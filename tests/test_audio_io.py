@@ -116,3 +116,50 @@ class TestAudioFile:
         repr_str = repr(audio)
         assert "AudioFile" in repr_str
         assert str(sample_rate) in repr_str
+
+
+class TestBufferPool:
+    """BufferPool 테스트"""
+
+    def test_reuse_after_put(self):
+        """반납한 버퍼가 같은 버킷 요청에서 재사용되는지 테스트"""
+        from core.audio.bufferpool import BufferPool
+
+        pool = BufferPool()
+        a = pool.get(1000)
+        assert a.shape == (1000,)
+        assert a.dtype == np.float32
+
+        assert pool.put(a)
+        b = pool.get(900)
+        assert b.base is a.base
+        assert pool.hits == 1
+
+    def test_put_foreign_array(self):
+        """풀에서 나가지 않은 배열은 반납되지 않는지 테스트"""
+        from core.audio.bufferpool import BufferPool
+
+        pool = BufferPool()
+        assert not pool.put(np.zeros(1024, dtype=np.float32))
+
+        a = pool.get(10)
+        assert pool.put(a)
+        # 이중 반납 방지
+        assert not pool.put(a)
+
+    def test_read_mono_stereo(self, tmp_path, sample_audio_stereo):
+        """스테레오 파일을 풀 버퍼에 모노로 읽는지 테스트"""
+        import soundfile as sf
+        from core.audio.bufferpool import BufferPool, read_mono
+
+        audio_data, sample_rate = sample_audio_stereo
+        path = tmp_path / "stereo.wav"
+        sf.write(path, audio_data, sample_rate, subtype="FLOAT")
+
+        pool = BufferPool()
+        mono, sr = read_mono(path, pool)
+
+        assert sr == sample_rate
+        assert mono.dtype == np.float32
+        np.testing.assert_allclose(mono, audio_data.mean(axis=1), atol=1e-6)
+        assert pool.put(mono)
@@ -54,6 +54,19 @@ class TestJobQueue:
         with pytest.raises(ValueError):
             queue.add(job2)
 
+    def test_add_many_duplicate(self):
+        """일괄 추가 중복 ID 테스트 (아무것도 추가되지 않음)"""
+        queue = JobQueue()
+        queue.add(Job(job_id="test_1", func=dummy_task))
+
+        with pytest.raises(ValueError):
+            queue.add_many([
+                Job(job_id="test_2", func=dummy_task),
+                Job(job_id="test_1", func=dummy_task),
+            ])
+
+        assert len(queue) == 1
+
     def test_get_by_status(self):
         """상태별 작업 조회 테스트"""
         queue = JobQueue()
@@ -211,6 +224,19 @@ class TestBatchProcessor:
         assert job.job_id == "test_1"
         assert len(processor.job_queue.jobs) == 1
 
+    def test_add_jobs(self):
+        """작업 일괄 추가 테스트"""
+        processor = BatchProcessor(max_workers=2, show_progress=False)
+        jobs = processor.add_jobs(
+            [(f"job_{i}", dummy_task, {"value": i}) for i in range(3)],
+            priority=1,
+        )
+
+        assert [job.job_id for job in jobs] == ["job_0", "job_1", "job_2"]
+        assert all(job.priority == 1 for job in jobs)
+        assert jobs[2].kwargs == {"value": 2}
+        assert len(processor.job_queue) == 3
+
     def test_process_all_success(self):
         """전체 작업 처리 테스트 (성공)"""
         processor = BatchProcessor(max_workers=2, show_progress=False)
@@ -107,6 +107,129 @@ class TestMFCCSimilarity:
         for i in range(len(matches) - 1):
             assert matches[i].similarity >= matches[i+1].similarity
 
+    def test_extract_mfcc_chunked(self, sample_audio_mono):
+        """청크 MFCC가 전체 계산과 일치하는지 테스트"""
+        audio_data, sample_rate = sample_audio_mono
+
+        chunked = MFCCSimilarity(chunk_seconds=0.25)._extract_mfcc(audio_data, sample_rate)
+        full = MFCCSimilarity(chunk_seconds=None)._extract_mfcc(audio_data, sample_rate)
+
+        assert chunked.shape == full.shape
+        np.testing.assert_allclose(chunked, full, atol=1e-3)
+
+    def test_batch_mfcc_matches_librosa(self, sample_audio_mono):
+        """배치 MFCC 커널이 librosa와 일치하는지 테스트"""
+        from algorithms.traditional.mfcc_numba import batch_mfcc
+
+        audio_data, sample_rate = sample_audio_mono
+        windows = np.stack(
+            [audio_data[:sample_rate // 2], audio_data[sample_rate // 2:sample_rate]]
+        )
+
+        batched = batch_mfcc(windows, sample_rate)
+        algo = MFCCSimilarity(chunk_seconds=None)
+
+        for window, mfcc in zip(windows, batched):
+            np.testing.assert_allclose(mfcc, algo._extract_mfcc(window, sample_rate), atol=1e-2)
+
+    def test_window_distances_batch_matches_loop(self, sample_audio_mono):
+        """배치 윈도우 거리가 윈도우별 계산과 일치하는지 테스트"""
+        audio_data, sample_rate = sample_audio_mono
+        algo = MFCCSimilarity()
+        target_mfcc = algo._extract_mfcc(audio_data[:sample_rate // 2], sample_rate)
+        args = (target_mfcc, audio_data, sample_rate, sample_rate // 2, sample_rate // 10)
+
+        batched = algo._window_distances(*args)
+        looped = [
+            algo._compute_distance(
+                target_mfcc,
+                algo._extract_mfcc(audio_data[start:start + sample_rate // 2], sample_rate),
+            )
+            for start in range(0, len(audio_data) - sample_rate // 2 + 1, sample_rate // 10)
+        ]
+
+        np.testing.assert_allclose(batched, looped, rtol=1e-3, atol=1e-3)
+
+    def test_find_similar_segments_in_file(self, sample_audio_mono, tmp_path, monkeypatch):
+        """블록 단위 파일 검색이 메모리 배열 검색과 일치하는지 테스트"""
+        import soundfile as sf
+        import algorithms.traditional.mfcc as mfcc_module
+
+        # 블록이 여러 개로 나뉘도록 묶음 크기 축소
+        monkeypatch.setattr(mfcc_module, "_BATCH_FRAME_SAMPLES", 1 << 16)
+
+        audio_data, sample_rate = sample_audio_mono
+        source_file = tmp_path / "source.wav"
+        sf.write(source_file, audio_data, sample_rate, subtype="FLOAT")
+
+        algo = MFCCSimilarity(similarity_threshold=0.0)
+        target = audio_data[:sample_rate // 2]
+
+        expected = algo.find_similar_segments(
+            target, audio_data, sample_rate, sample_rate, top_k=100
+        )
+        matches = algo.find_similar_segments_in_file(target, sample_rate, source_file, top_k=100)
+
+        assert [m.source_start for m in matches] == [m.source_start for m in expected]
+        np.testing.assert_allclose(
+            [m.similarity for m in matches], [m.similarity for m in expected], rtol=1e-5
+        )
+
+    def test_quantized_feature_cache(self, sample_audio_mono, tmp_path):
+        """int8 캐시 검색 순위와 거리가 캐시 없는 검색과 거의 같은지 테스트"""
+        from core.synthesis.cache import FeatureCache
+
+        audio_data, sample_rate = sample_audio_mono
+        source_file = tmp_path / "source.wav"
+        source_file.write_bytes(b"data")
+        target = audio_data[:sample_rate // 2]
+
+        expected = MFCCSimilarity(similarity_threshold=0.0).find_similar_segments(
+            target, audio_data, sample_rate, sample_rate, top_k=100
+        )
+
+        algo = MFCCSimilarity(
+            similarity_threshold=0.0, feature_cache=FeatureCache(tmp_path / "cache")
+        )
+        for _ in range(2):  # 미스 후 히트
+            matches = algo.find_similar_segments(
+                target, audio_data, sample_rate, sample_rate, top_k=100, source_file=source_file
+            )
+            assert [m.source_start for m in matches] == [m.source_start for m in expected]
+            np.testing.assert_allclose(
+                [m.metadata["distance"] for m in matches],
+                [m.metadata["distance"] for m in expected],
+                atol=1.0,
+            )
+
+
+class TestCudaBatchedMFCCSimilarity:
+    """배치 MFCC 유사도 알고리즘 테스트"""
+
+    def test_matches_cpu_implementation(self, sample_audio_mono):
+        """배치 결과가 CPU 구현과 일치하는지 테스트"""
+        pytest.importorskip("torch")
+        from algorithms.traditional.mfcc_cuda import CudaBatchedMFCCSimilarity
+
+        audio_data, sample_rate = sample_audio_mono
+        batched = CudaBatchedMFCCSimilarity(batch_size=4, device="cpu")
+        reference = MFCCSimilarity()
+
+        np.testing.assert_allclose(
+            batched._extract_mfcc(audio_data, sample_rate),
+            reference._extract_mfcc(audio_data, sample_rate),
+            atol=1e-2,
+        )
+
+        target_mfcc = reference._extract_mfcc(audio_data[:sample_rate // 2], sample_rate)
+        args = (target_mfcc, audio_data, sample_rate, sample_rate // 2, sample_rate // 10)
+        np.testing.assert_allclose(
+            batched._window_distances(*args),
+            reference._window_distances(*args),
+            rtol=1e-3,
+            atol=1e-2,
+        )
+
 
 class TestSpectralSimilarity:
     """스펙트럼 기반 유사도 알고리즘 테스트"""
@@ -2,6 +2,10 @@
 Tests for Synthesis Modules
 """
 
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 import numpy as np
 
@@ -12,7 +16,8 @@ from core.synthesis.tempo import TempoAdjuster
 from core.synthesis.prosody import ProsodyMatcher
 from core.synthesis.enhancement import QualityEnhancer
 from core.synthesis.metrics import QualityMetrics
-from core.synthesis.cache import SegmentCache
+from core.synthesis.cache import SegmentCache, FeatureCache
+from core.audio.io import AudioFile
 from algorithms.base import SimilarityMatch
 
 
@@ -118,6 +123,23 @@ class TestPitchAdjuster:
         assert isinstance(adjusted, np.ndarray)
         assert len(adjusted) > 0
 
+    def test_pitch_stats_matches_numpy(self):
+        """단일 패스 피치 통계와 NumPy 기준값 비교 테스트"""
+        from core.synthesis.pitch import _pitch_stats
+
+        f0 = np.array([np.nan, 110.0, 0.0, 220.0, np.nan, 165.0, -1.0])
+        valid = f0[f0 > 0]
+
+        count, mean, std, f_min, f_max = _pitch_stats(f0)
+
+        assert count == 3
+        assert mean == pytest.approx(np.mean(valid))
+        assert std == pytest.approx(np.std(valid))
+        assert f_min == 110.0
+        assert f_max == 220.0
+
+        assert _pitch_stats(np.full(4, np.nan))[0] == 0
+
 
 class TestTempoAdjuster:
     """TempoAdjuster 테스트"""
@@ -138,6 +160,21 @@ class TestTempoAdjuster:
         assert isinstance(adjusted, np.ndarray)
         assert len(adjusted) > 0
 
+    def test_detect_beats_shares_onset(self, sample_audio_mono):
+        """비트 검출 템포가 템포 추정과 일치하는지 테스트"""
+        audio_data, sample_rate = sample_audio_mono
+
+        adjuster = TempoAdjuster()
+        onset_env = adjuster.compute_onset_envelope(audio_data, sample_rate)
+        tempo, beat_times = adjuster.detect_beats(
+            audio_data, sample_rate, onset_envelope=onset_env
+        )
+
+        assert tempo == pytest.approx(
+            adjuster.estimate_tempo(audio_data, sample_rate, onset_envelope=onset_env)
+        )
+        assert isinstance(beat_times, np.ndarray)
+
 
 class TestProsodyMatcher:
     """ProsodyMatcher 테스트"""
@@ -149,6 +186,28 @@ class TestProsodyMatcher:
         assert matcher.match_pitch == True
         assert matcher.match_energy == True
 
+    def test_match_prosody_does_not_mutate_source(self, sample_audio_mono):
+        """프로소디 매칭이 소스 배열을 변경하지 않는지 테스트"""
+        audio_data, sample_rate = sample_audio_mono
+        original = audio_data.copy()
+
+        matcher = ProsodyMatcher(match_pitch=False, match_duration=False)
+        adjusted = matcher.match_prosody(audio_data, audio_data * 3.0, sample_rate)
+
+        assert adjusted is not audio_data
+        assert np.array_equal(audio_data, original)
+        assert np.abs(adjusted).max() <= 1.0
+
+    def test_match_prosody_returns_float32(self, sample_audio_mono):
+        """float64 입력도 float32로 처리되는지 테스트"""
+        audio_data, sample_rate = sample_audio_mono
+        audio64 = audio_data.astype(np.float64)
+
+        matcher = ProsodyMatcher(match_pitch=False)
+        adjusted = matcher.match_prosody(audio64, audio64[: len(audio64) // 2], sample_rate)
+
+        assert adjusted.dtype == np.float32
+
     def test_extract_prosody_features(self, sample_audio_mono):
         """프로소디 특징 추출 테스트"""
         audio_data, sample_rate = sample_audio_mono
@@ -160,6 +219,43 @@ class TestProsodyMatcher:
         assert "pitch_mean" in features
         assert "energy_mean" in features
 
+    def test_extract_prosody_features_shared_stft(self, sample_audio_mono):
+        """에너지/템포가 개별 계산과 일치하는지 테스트"""
+        import librosa
+
+        audio_data, sample_rate = sample_audio_mono
+
+        matcher = ProsodyMatcher()
+        features = matcher.extract_prosody_features(audio_data, sample_rate, compute_tempo=True)
+
+        expected_energy = np.mean(librosa.feature.rms(y=audio_data)[0])
+        expected_tempo = matcher.tempo_adjuster.estimate_tempo(audio_data, sample_rate)
+
+        assert features["energy_mean"] == pytest.approx(expected_energy, rel=0.05)
+        assert features["tempo"] == pytest.approx(expected_tempo)
+
+    def test_energy_independent_of_tempo(self):
+        """compute_tempo 여부와 관계없이 에너지 특징이 같은지 테스트"""
+        rng = np.random.default_rng(0)
+        audio_data = (rng.normal(0, 0.01, 22050) * np.linspace(0, 1, 22050)).astype(np.float32)
+
+        matcher = ProsodyMatcher()
+        with_tempo = matcher.extract_prosody_features(audio_data, 22050, compute_tempo=True)
+        without_tempo = matcher.extract_prosody_features(audio_data, 22050)
+
+        assert with_tempo["energy_mean"] == without_tempo["energy_mean"]
+        assert with_tempo["energy_std"] == without_tempo["energy_std"]
+
+    def test_extract_prosody_features_without_tempo(self, sample_audio_mono):
+        """템포 추정 생략 테스트"""
+        audio_data, sample_rate = sample_audio_mono
+
+        matcher = ProsodyMatcher()
+        features = matcher.extract_prosody_features(audio_data, sample_rate)
+
+        assert "tempo" not in features
+        assert "energy_mean" in features
+
 
 class TestQualityEnhancer:
     """QualityEnhancer 테스트"""
@@ -193,6 +289,48 @@ class TestQualityMetrics:
 
         assert isinstance(snr, float)
 
+    def test_compute_snr_matches_numpy(self, sample_audio_mono):
+        """SNR 커널과 NumPy 기준값 비교 테스트"""
+        audio_data, sample_rate = sample_audio_mono
+        noisy = audio_data + 0.01 * np.random.randn(len(audio_data))
+
+        metrics = QualityMetrics()
+        snr = metrics.compute_snr(audio_data, noisy[:-100])
+
+        clean = audio_data[: len(noisy) - 100]
+        expected = 10 * np.log10(
+            np.mean(clean**2) / np.mean((noisy[: len(clean)] - clean) ** 2)
+        )
+        assert snr == pytest.approx(expected, rel=1e-6)
+
+    def test_compute_mse_matches_numpy(self, sample_audio_mono):
+        """MSE 커널과 NumPy 기준값 비교 테스트"""
+        audio_data, sample_rate = sample_audio_mono
+        degraded = (audio_data * 0.5).astype(np.float32)
+
+        metrics = QualityMetrics()
+        mse = metrics.compute_mse(audio_data, degraded)
+
+        expected = np.mean((audio_data - degraded) ** 2)
+        assert isinstance(mse, float)
+        assert mse == pytest.approx(expected, rel=1e-5)
+
+    def test_compute_spectral_distance_matches_librosa(self, sample_audio_mono):
+        """캐시된 필터뱅크 기반 스펙트럼 거리와 librosa 기준값 비교 테스트"""
+        import librosa
+
+        audio_data, sample_rate = sample_audio_mono
+        other = np.roll(audio_data, 1000)
+
+        metrics = QualityMetrics()
+        distance = metrics.compute_spectral_distance(audio_data, other, sample_rate)
+
+        mel1_db = librosa.power_to_db(librosa.feature.melspectrogram(y=audio_data, sr=sample_rate))
+        mel2_db = librosa.power_to_db(librosa.feature.melspectrogram(y=other, sr=sample_rate))
+        expected = np.sqrt(np.mean((mel1_db - mel2_db) ** 2))
+
+        assert distance == pytest.approx(expected, rel=1e-4)
+
     def test_analyze_quality(self, sample_audio_mono):
         """품질 분석 테스트"""
         audio_data, sample_rate = sample_audio_mono
@@ -259,3 +397,136 @@ class TestSegmentCache:
         assert isinstance(stats, dict)
         assert "size" in stats
         assert "hit_rate" in stats
+
+
+class TestFeatureCache:
+    """FeatureCache 테스트"""
+
+    def test_put_get(self, tmp_path):
+        """저장 후 float16 메모리 맵으로 로드되는지 테스트"""
+        source_file = tmp_path / "source.wav"
+        source_file.write_bytes(b"data")
+        cache = FeatureCache(tmp_path / "cache")
+
+        assert cache.get(source_file, "params") is None
+
+        features = np.random.randn(3, 13, 20).astype(np.float32)
+        stored = cache.put(source_file, "params", features)
+        loaded = cache.get(source_file, "params")
+
+        assert isinstance(loaded, np.memmap)
+        assert loaded.dtype == np.float16
+        np.testing.assert_array_equal(loaded, stored)
+        assert cache.get(source_file, "other") is None
+
+    def test_concurrent_put_same_key(self, tmp_path, monkeypatch):
+        """여러 스레드가 같은 키를 동시에 저장해도 임시 파일이 겹치지 않는지 테스트"""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        source_file = tmp_path / "source.wav"
+        source_file.write_bytes(b"data")
+        cache = FeatureCache(tmp_path / "cache")
+
+        # 모든 스레드가 임시 파일을 연 상태에서 함께 쓰도록 대기
+        n_threads = 4
+        barrier = threading.Barrier(n_threads, timeout=10)
+        tmp_names = []
+        save = np.save
+
+        def synchronized_save(f, arr):
+            tmp_names.append(f.name)
+            barrier.wait()
+            save(f, arr)
+
+        monkeypatch.setattr(np, "save", synchronized_save)
+
+        features = [np.full((4, 13, 200), i, dtype=np.float32) for i in range(n_threads)]
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            list(executor.map(lambda f: cache.put(source_file, "params", f), features))
+
+        assert len(set(tmp_names)) == n_threads
+        loaded = cache.get(source_file, "params")
+        assert loaded is not None
+        assert np.all(loaded == loaded.flat[0])
+        assert not list((tmp_path / "cache").glob("*.tmp"))
+
+    def test_invalidated_on_change(self, tmp_path):
+        """파일이 바뀌면 캐시 미스인지 테스트"""
+        source_file = tmp_path / "source.wav"
+        source_file.write_bytes(b"data")
+        cache = FeatureCache(tmp_path / "cache")
+        cache.put(source_file, "params", np.zeros((1, 13, 5)))
+
+        source_file.write_bytes(b"changed data")
+
+        assert cache.get(source_file, "params") is None
+
+
+# Numba parallel 커널을 실행한 뒤 프로세스 풀 경로로 합성 (별도 인터프리터에서 실행)
+_POOL_AFTER_PARALLEL_KERNEL = """
+import sys
+from pathlib import Path
+import numpy as np
+from algorithms.traditional.mfcc import MFCCSimilarity
+from core.synthesis.engine import CollageEngine
+from core.synthesis.metrics import QualityMetrics
+
+sources = [Path(p) for p in sys.argv[1:]]
+target = np.sin(np.arange(16000) * 0.01).astype(np.float32)
+QualityMetrics().compute_snr(target, 0.9 * target)
+engine = CollageEngine(MFCCSimilarity(), use_cache=False)
+engine.synthesize(target, 16000, sources[:1], max_workers=1)
+engine.synthesize(target, 16000, sources, max_workers=2)
+print("done")
+"""
+
+
+def _write_sources(tmp_path, target, count=2):
+    """타겟을 노이즈 사이에 넣은 소스 WAV 파일 생성"""
+    rng = np.random.default_rng(0)
+    sources = []
+    for i in range(count):
+        noise = rng.normal(0, 0.1, 8000).astype(np.float32)
+        source_file = tmp_path / f"source_{i}.wav"
+        AudioFile(np.concatenate([noise, target, noise]), 16000).save(source_file)
+        sources.append(source_file)
+    return sources
+
+
+class TestCollageEngine:
+    """CollageEngine 테스트"""
+
+    def test_reuses_given_executor(self, tmp_path):
+        """전달된 executor로 검색하고 합성 후에도 종료하지 않는지 테스트"""
+        from concurrent.futures import ThreadPoolExecutor
+        from algorithms.traditional.mfcc import MFCCSimilarity
+        from core.synthesis.engine import CollageEngine
+
+        target = np.sin(np.arange(16000) * 0.01).astype(np.float32)
+        sources = _write_sources(tmp_path, target)
+        engine = CollageEngine(MFCCSimilarity(), use_cache=False)
+
+        _, _, expected = engine.synthesize(target, 16000, sources, max_workers=1)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for _ in range(2):
+                _, _, metadata = engine.synthesize(target, 16000, sources, executor=executor)
+                assert metadata["source_file"] == expected["source_file"]
+                assert metadata["source_start"] == expected["source_start"]
+            assert executor.submit(int, 1).result() == 1
+
+    def test_process_pool_after_parallel_kernel(self, tmp_path):
+        """parallel 커널 실행 후 프로세스 풀로 검색해도 종료 시 멈추지 않는지 테스트"""
+        target = np.sin(np.arange(16000) * 0.01).astype(np.float32)
+        sources = [str(path) for path in _write_sources(tmp_path, target)]
+
+        result = subprocess.run(
+            [sys.executable, "-c", _POOL_AFTER_PARALLEL_KERNEL, *sources],
+            cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "done"
@@ -3,6 +3,7 @@ Tests for TTS Modules
 """
 
 import pytest
+import numpy as np
 from pathlib import Path
 
 from core.tts.base import BaseTTSEngine
@@ -13,7 +14,6 @@ class MockTTSEngine(BaseTTSEngine):
     """테스트용 Mock TTS 엔진"""
 
     def synthesize(self, text, output_path=None):
-        import numpy as np
         # 더미 오디오 데이터 반환
         audio = np.random.randn(16000).astype(np.float32)
         return audio, 16000
@@ -22,6 +22,45 @@ class MockTTSEngine(BaseTTSEngine):
         return ["mock_voice_1", "mock_voice_2"]
 
 
+class FakePyttsx3Engine:
+    """pyttsx3 엔진 대용 (startLoop 중복 호출 시 실제 엔진처럼 RuntimeError)"""
+
+    def __init__(self):
+        self.callbacks = []
+        self.queue = []
+        self.properties = {}
+        self.rates = []
+        self.start_count = 0
+        self._in_loop = False
+
+    def setProperty(self, name, value):
+        self.properties[name] = value
+
+    def connect(self, topic, cb):
+        self.callbacks.append(cb)
+
+    def save_to_file(self, text, path):
+        self.rates.append(self.properties.get("rate"))
+        self.queue.append(path)
+
+    def startLoop(self, use_driver_loop=True):
+        if self._in_loop:
+            raise RuntimeError("run loop already started")
+        self._in_loop = True
+        self.start_count += 1
+
+    def iterate(self):
+        import soundfile as sf
+
+        if self.queue:
+            sf.write(self.queue.pop(0), np.zeros(1600, dtype=np.float32), 16000)
+            for cb in self.callbacks:
+                cb(None, True)
+
+    def runAndWait(self):
+        raise AssertionError("runAndWait()는 호출되지 않아야 합니다")
+
+
 class TestBaseTTSEngine:
     """BaseTTSEngine 테스트"""
 
@@ -39,6 +78,8 @@ class TestBaseTTSEngine:
         assert engine.validate_text("안녕하세요") == True
         assert engine.validate_text("") == False
         assert engine.validate_text("   ") == False
+        assert engine.validate_text("\n\t ") == False
+        assert engine.validate_text("가" * 5001) == False
 
     def test_get_info(self):
         """정보 반환 테스트"""
@@ -70,6 +111,9 @@ class TestTextPreprocessor:
         assert "    " not in normalized
         assert normalized == "안녕하세요 반갑습니다"
 
+        # 단일 공백이 아닌 공백 문자도 정규화
+        assert preprocessor.normalize_whitespace("a\tb\u3000c") == "a b c"
+
     def test_numbers_to_words_korean(self):
         """한국어 숫자 변환 테스트"""
         preprocessor = TextPreprocessor(language="ko")
@@ -80,6 +124,14 @@ class TestTextPreprocessor:
         assert "1" not in converted
         assert "일" in converted
 
+    def test_numbers_to_words_korean_table(self):
+        """한국어 숫자 테이블 변환 테스트"""
+        preprocessor = TextPreprocessor(language="ko")
+
+        converted = preprocessor.numbers_to_words("0 07 10 25 99 100")
+
+        assert converted == "영 칠 십 이십오 구십구 100"
+
     def test_split_sentences(self):
         """문장 분리 테스트"""
         preprocessor = TextPreprocessor()
@@ -91,6 +143,27 @@ class TestTextPreprocessor:
         assert "안녕하세요" in sentences[0]
         assert "반갑습니다" in sentences[1]
 
+    def test_expand_abbreviations(self):
+        """약어 확장 테스트 (대소문자 무시, 긴 약어 우선)"""
+        preprocessor = TextPreprocessor(language="ko")
+
+        result = preprocessor.expand_abbreviations("tts API ai Etc APIs")
+
+        assert result == "티티에스 에이피아이 에이아이 기타 APIs"
+
+        # 한글 조사가 붙은 약어도 확장
+        assert preprocessor.expand_abbreviations("TTS는 AI로") == "티티에스는 에이아이로"
+
+    def test_iter_sentences(self):
+        """문장 생성기 테스트"""
+        preprocessor = TextPreprocessor()
+
+        sentences = preprocessor.iter_sentences("첫 문장. 두 번째!! 세 번째? 꼬리 ")
+
+        assert next(sentences) == "첫 문장"
+        assert list(sentences) == ["두 번째", "세 번째", "꼬리"]
+        assert list(preprocessor.iter_sentences("...")) == []
+
     def test_preprocess(self):
         """전체 전처리 테스트"""
         preprocessor = TextPreprocessor(language="ko")
@@ -101,6 +174,19 @@ class TestTextPreprocessor:
         assert isinstance(processed, str)
         assert "   " not in processed
 
+    def test_preprocess_cached(self):
+        """동일 입력의 전처리 결과 캐시 테스트"""
+        from core.tts.preprocessing import _preprocess_cached
+
+        preprocessor = TextPreprocessor(language="ko")
+        before = _preprocess_cached.cache_info().hits
+
+        first = preprocessor.preprocess("캐시 테스트 TTS 3번")
+        second = TextPreprocessor(language="ko").preprocess("캐시 테스트 TTS 3번")
+
+        assert first == second == "캐시 테스트 티티에스 삼번"
+        assert _preprocess_cached.cache_info().hits == before + 1
+
 
 class TestTTSBackends:
     """TTS 백엔드 테스트 (선택적)"""
@@ -113,6 +199,77 @@ class TestTTSBackends:
         backend = GTTSBackend(language="ko")
         assert backend.language == "ko"
 
+    def test_gtts_backend_streams_in_memory(self, tmp_path, mp3_bytes):
+        """gTTS 결과를 임시 파일 없이 메모리에서 디코딩하는지 테스트"""
+        pytest.importorskip("gtts")
+        from core.tts.backends import GTTSBackend
+
+        class FakeGTTS:
+            def __init__(self, text, lang, tld, slow):
+                self.text = text
+
+            def write_to_fp(self, fp):
+                fp.write(mp3_bytes)
+
+            def save(self, path):
+                raise AssertionError("save()는 호출되지 않아야 합니다")
+
+        backend = GTTSBackend(language="ko")
+        backend.gTTS = FakeGTTS
+
+        audio, sr = backend.synthesize("안녕하세요")
+        assert sr == 24000
+        assert audio.ndim == 1
+        assert audio.dtype == np.float32
+
+        output_path = tmp_path / "out.mp3"
+        backend.synthesize("안녕하세요", output_path=output_path)
+        assert output_path.read_bytes() == mp3_bytes
+
+    def test_gtts_backend_cache(self, tmp_path, mp3_bytes):
+        """동일 텍스트 재합성 시 캐시를 사용하는지 테스트"""
+        pytest.importorskip("gtts")
+        from core.tts.backends import GTTSBackend
+
+        calls = []
+
+        class FakeGTTS:
+            def __init__(self, text, lang, tld, slow):
+                calls.append(text)
+
+            def write_to_fp(self, fp):
+                fp.write(mp3_bytes)
+
+        backend = GTTSBackend(language="ko", cache_dir=tmp_path / "cache")
+        backend.gTTS = FakeGTTS
+
+        backend.synthesize("안녕하세요")
+        audio, sr = backend.synthesize("안녕하세요")
+        assert calls == ["안녕하세요"]
+        assert sr == 24000
+
+        # 메모리 캐시를 비워도 디스크 캐시에서 복원
+        backend.clear_cache()
+        backend.synthesize("안녕하세요", output_path=tmp_path / "out.mp3")
+        assert calls == ["안녕하세요"]
+        assert (tmp_path / "out.mp3").read_bytes() == mp3_bytes
+
+    def test_gtts_decode_av_matches_soundfile(self, mp3_bytes):
+        """PyAV 디코딩 결과가 soundfile과 일치하는지 테스트"""
+        pytest.importorskip("av")
+        import io
+        import soundfile as sf
+        from core.tts.backends.gtts_backend import GTTSBackend
+
+        audio_av, sr_av = GTTSBackend._decode_av(mp3_bytes)
+        audio_sf, sr_sf = sf.read(io.BytesIO(mp3_bytes), dtype="float32")
+
+        assert sr_av == sr_sf == 24000
+        assert audio_av.dtype == np.float32
+        assert audio_av.ndim == 1
+        # 디코더마다 앞쪽 지연(padding)이 다를 수 있으므로 길이만 근사 비교
+        assert abs(len(audio_av) - len(audio_sf)) < 2048
+
     @pytest.mark.skipif(True, reason="실제 TTS 백엔드 테스트는 선택적")
     def test_pyttsx3_backend(self):
         """pyttsx3 백엔드 테스트"""
@@ -120,3 +277,354 @@ class TestTTSBackends:
 
         backend = Pyttsx3Backend(language="ko")
         assert backend.language == "ko"
+
+    def test_pyttsx3_backend_reuses_driver_loop(self, tmp_path, monkeypatch):
+        """pyttsx3 드라이버 루프를 호출 간 재사용하는지 테스트"""
+        pyttsx3 = pytest.importorskip("pyttsx3")
+        from core.tts.backends import Pyttsx3Backend
+
+        engine = FakePyttsx3Engine()
+        monkeypatch.setattr(pyttsx3, "init", lambda: engine)
+
+        backend = Pyttsx3Backend(language="ko")
+        for i in range(3):
+            audio, sr = backend.synthesize("안녕하세요", output_path=tmp_path / f"{i}.wav")
+            assert sr == 16000
+
+        assert engine.start_count == 1
+
+    def test_pyttsx3_backends_share_engine(self, tmp_path, monkeypatch):
+        """같은 엔진을 쓰는 두 인스턴스가 루프와 콜백을 공유하고 속성을 각자 적용하는지 테스트"""
+        pyttsx3 = pytest.importorskip("pyttsx3")
+        from core.tts.backends import Pyttsx3Backend
+
+        engine = FakePyttsx3Engine()
+        monkeypatch.setattr(pyttsx3, "init", lambda: engine)
+
+        slow = Pyttsx3Backend(language="ko", speech_rate=100)
+        fast = Pyttsx3Backend(language="ko", speech_rate=200)
+        for i, backend in enumerate([slow, fast, slow]):
+            backend.synthesize("안녕하세요", output_path=tmp_path / f"{i}.wav")
+
+        assert engine.start_count == 1
+        assert len(engine.callbacks) == 1
+        assert engine.rates == [100, 200, 100]
+
+        fast.set_voice_params(speech_rate=180, volume=0.5)
+        fast.synthesize("안녕하세요", output_path=tmp_path / "3.wav")
+        assert engine.rates[-1] == 180
+        assert engine.properties["volume"] == 0.5
+
+    def test_edge_backend_reuses_event_loop(self):
+        """Edge-TTS 백엔드 이벤트 루프 재사용 테스트"""
+        pytest.importorskip("edge_tts")
+        from core.tts.backends import EdgeTTSBackend
+
+        async def double(x):
+            return x * 2
+
+        backend1 = EdgeTTSBackend(language="ko-KR")
+        backend2 = EdgeTTSBackend(language="en-US")
+
+        assert backend1._run_async(double(2)) == 4
+        assert backend2._run_async(double(3)) == 6
+        assert backend1._get_loop() is backend2._get_loop()
+
+    def test_edge_backend_streams_in_memory(self, tmp_path, mp3_bytes):
+        """Edge-TTS 백엔드 메모리 스트리밍 테스트 (네트워크 없이)"""
+        pytest.importorskip("edge_tts")
+        from core.tts.backends import EdgeTTSBackend
+
+        class FakeCommunicate:
+            def __init__(self, text, voice, **kwargs):
+                self.text = text
+
+            async def stream(self):
+                yield {"type": "audio", "data": mp3_bytes[:100]}
+                yield {"type": "WordBoundary", "offset": 0}
+                yield {"type": "audio", "data": mp3_bytes[100:]}
+
+        backend = EdgeTTSBackend(language="ko-KR")
+        backend.edge_tts = type("FakeEdgeTTS", (), {"Communicate": FakeCommunicate})
+
+        audio, sr = backend.synthesize("안녕하세요")
+        assert sr == 24000
+        assert len(audio) > 0
+        assert audio.dtype == np.float32
+
+        output_path = tmp_path / "out.mp3"
+        backend.synthesize("안녕하세요", output_path=output_path)
+        assert output_path.read_bytes() == mp3_bytes
+
+    def test_edge_backend_synthesize_batch(self, tmp_path, mp3_bytes):
+        """Edge-TTS 배치 합성 동시성 제한 테스트 (네트워크 없이)"""
+        pytest.importorskip("edge_tts")
+        import asyncio
+        from core.tts.backends import EdgeTTSBackend
+
+        state = {"active": 0, "peak": 0}
+
+        class FakeCommunicate:
+            def __init__(self, text, voice, **kwargs):
+                self.text = text
+
+            async def stream(self):
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+                await asyncio.sleep(0.01)
+                state["active"] -= 1
+                yield {"type": "audio", "data": mp3_bytes}
+
+        backend = EdgeTTSBackend(language="ko-KR")
+        backend.edge_tts = type("FakeEdgeTTS", (), {"Communicate": FakeCommunicate})
+
+        texts = [f"문장 {i}" for i in range(6)]
+        paths = [tmp_path / f"out_{i}.mp3" for i in range(6)]
+        results = backend.synthesize_batch(texts, output_paths=paths, max_concurrency=2)
+
+        assert len(results) == 6
+        assert all(sr == 24000 for _, sr in results)
+        assert all(p.exists() for p in paths)
+        assert state["peak"] == 2
+
+    def test_edge_backend_skip_decode(self, tmp_path):
+        """return_array=False이면 디코딩 없이 파일만 저장하는지 테스트"""
+        pytest.importorskip("edge_tts")
+        from core.tts.backends import EdgeTTSBackend
+
+        class FakeCommunicate:
+            def __init__(self, text, voice, **kwargs):
+                pass
+
+            async def stream(self):
+                # 디코딩하면 실패하는 바이트
+                yield {"type": "audio", "data": b"not an mp3"}
+
+        backend = EdgeTTSBackend(language="ko-KR")
+        backend.edge_tts = type("FakeEdgeTTS", (), {"Communicate": FakeCommunicate})
+
+        output_path = tmp_path / "out.mp3"
+        result = backend.synthesize("안녕하세요", output_path=output_path, return_array=False)
+
+        assert result == (None, None)
+        assert output_path.read_bytes() == b"not an mp3"
+
+        with pytest.raises(ValueError):
+            backend.synthesize("안녕하세요", return_array=False)
+
+    def test_pooled_gtts_stream_uses_session(self):
+        """PooledGTTS.stream이 공유 세션으로 요청하고 오디오를 디코딩하는지 테스트"""
+        pytest.importorskip("gtts")
+        import base64
+        from unittest import mock
+        import requests
+        from gtts import gTTS
+        from gtts.tts import gTTSError
+        from core.tts.backends.gtts_backend import _make_pooled_gtts
+
+        payload = b"mp3 audio"
+        encoded = base64.b64encode(payload).decode("ascii")
+        line = f'[["wrb.fr","jQ1olc","[\\"{encoded}\\"]",null]]'.encode("utf-8")
+
+        response = mock.Mock()
+        response.iter_lines.return_value = [b")]}'", line]
+        session = mock.Mock(spec=requests.Session)
+        session.send.return_value = response
+
+        tts = _make_pooled_gtts(gTTS)("안녕하세요", lang="ko", session=session)
+        assert b"".join(tts.stream()) == payload
+        session.send.assert_called_once()
+        assert "batchexecute" in session.send.call_args.kwargs["request"].url
+
+        # 오디오가 없는 응답과 HTTP 오류는 gTTSError
+        response.iter_lines.return_value = [b'[["wrb.fr","jQ1olc",null]]']
+        with pytest.raises(gTTSError):
+            list(tts.stream())
+
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError()
+        with pytest.raises(gTTSError):
+            list(tts.stream())
+
+    def test_pooled_gtts_falls_back_to_stock_stream(self):
+        """내부 API가 없는 gTTS에서는 기본 stream()을 사용하는지 테스트"""
+        pytest.importorskip("gtts")
+        from unittest import mock
+        import requests
+        from core.tts.backends.gtts_backend import _make_pooled_gtts
+
+        class StockGTTS:
+            def __init__(self, text, lang):
+                pass
+
+            def stream(self):
+                yield b"stock"
+
+        session = mock.Mock(spec=requests.Session)
+        tts = _make_pooled_gtts(StockGTTS)("안녕하세요", lang="ko", session=session)
+
+        assert list(tts.stream()) == [b"stock"]
+        session.send.assert_not_called()
+
+
+class TestTTSPipeline:
+    """TTSPipeline 테스트"""
+
+    def test_synthesize_collage_passes_array(self, tmp_path, monkeypatch, stub_collage_pipeline):
+        """TTS 결과가 임시 파일 없이 배열로 콜라주 엔진에 전달되는지 테스트"""
+        pipeline, calls = stub_collage_pipeline(MockTTSEngine())
+        monkeypatch.setattr(pipeline.collage_engine, "synthesize_from_file", None)
+
+        output_path = tmp_path / "collage.wav"
+        metadata = pipeline.synthesize_collage("안녕하세요", [], output_path)
+
+        assert [(c["target_sr"], c["length"]) for c in calls] == [(16000, 16000)]
+        assert metadata["output_file"] == str(output_path)
+        assert metadata["tts_engine"] == "MockTTSEngine"
+
+
+class TestBatchTTSProcessor:
+    """BatchTTSProcessor 테스트"""
+
+    def test_process_texts_parallel_preserves_order(self, tmp_path, stub_collage_pipeline):
+        """병렬 처리 결과가 입력 순서를 유지하는지 테스트"""
+        import time
+        from core.tts.batch import BatchTTSProcessor
+
+        class VariableTTSEngine(MockTTSEngine):
+            def synthesize(self, text, output_path=None):
+                if text == "fail":
+                    raise RuntimeError("boom")
+                # 앞선 항목이 더 늦게 끝나도록
+                time.sleep(0.05 / (len(text) + 1))
+                return super().synthesize(text, output_path)
+
+        pipeline, calls = stub_collage_pipeline(VariableTTSEngine())
+
+        processor = BatchTTSProcessor(pipeline, max_workers=4)
+        texts = ["a", "bb", "fail", "dddd"]
+        results = processor.process_texts(
+            texts, [], tmp_path, show_progress=False, preprocess_text=False
+        )
+
+        assert [r["index"] for r in results] == [1, 2, 3, 4]
+        assert [r["success"] for r in results] == [True, True, False, True]
+        assert results[2]["error"] == "boom"
+        assert results[3]["output_file"] == str(tmp_path / "output_004.wav")
+        assert results[3]["processed_text"] == "dddd"
+        assert len(calls) == 3
+
+    def test_process_texts_limits_in_flight(self, tmp_path, stub_collage_pipeline):
+        """TTS가 콜라주보다 최대 처리 중 항목 수 이상 앞서지 않는지 테스트"""
+        import threading
+        import time
+        from core.tts.batch import BatchTTSProcessor
+
+        state = {"tts": 0, "collage": 0, "max_ahead": 0}
+        lock = threading.Lock()
+
+        class CountingTTSEngine(MockTTSEngine):
+            def synthesize(self, text, output_path=None):
+                with lock:
+                    state["tts"] += 1
+                    state["max_ahead"] = max(state["max_ahead"], state["tts"] - state["collage"])
+                return super().synthesize(text, output_path)
+
+        def slow_collage():
+            time.sleep(0.01)
+            with lock:
+                state["collage"] += 1
+
+        pipeline, _ = stub_collage_pipeline(CountingTTSEngine(), on_collage=slow_collage)
+
+        processor = BatchTTSProcessor(pipeline, max_workers=2)
+        results = processor.process_texts(
+            [f"문장 {i}" for i in range(12)], [], tmp_path, show_progress=False
+        )
+
+        assert all(r["success"] for r in results)
+        assert state["max_ahead"] <= 4
+
+    def test_process_texts_uses_backend_batch(self, tmp_path, stub_collage_pipeline):
+        """백엔드가 synthesize_batch를 제공하면 TTS를 한 번에 실행하는지 테스트"""
+        from core.tts.batch import BatchTTSProcessor
+
+        class BatchMockTTSEngine(MockTTSEngine):
+            def __init__(self):
+                super().__init__()
+                self.batch_calls = []
+
+            def synthesize(self, text, output_path=None):
+                raise AssertionError("개별 synthesize()는 호출되지 않아야 합니다")
+
+            def synthesize_batch(self, texts, output_paths=None):
+                self.batch_calls.append(list(texts))
+                return [
+                    (np.zeros(160 * (i + 1), dtype=np.float32), 16000)
+                    for i in range(len(texts))
+                ]
+
+        engine = BatchMockTTSEngine()
+        pipeline, calls = stub_collage_pipeline(engine)
+
+        processor = BatchTTSProcessor(pipeline, max_workers=2)
+        results = processor.process_texts(["하나", "둘", "셋"], [], tmp_path, show_progress=False)
+
+        assert engine.batch_calls == [["하나", "둘", "셋"]]
+        assert all(r["success"] for r in results)
+        lengths = {Path(c["output_file"]).name: c["length"] for c in calls}
+        assert lengths == {"output_001.wav": 160, "output_002.wav": 320, "output_003.wav": 480}
+
+
+class TestTTSServer:
+    """TTSServer 테스트"""
+
+    def test_concurrent_requests(self, tmp_path, stub_collage_pipeline):
+        """동시 요청이 모두 처리되고 TTS가 겹쳐 실행되는지 테스트"""
+        import asyncio
+        import threading
+        import time
+        from core.tts.server import TTSServer
+
+        state = {"active": 0, "peak": 0}
+        lock = threading.Lock()
+
+        class SlowTTSEngine(MockTTSEngine):
+            def synthesize(self, text, output_path=None):
+                with lock:
+                    state["active"] += 1
+                    state["peak"] = max(state["peak"], state["active"])
+                time.sleep(0.05)
+                with lock:
+                    state["active"] -= 1
+                return super().synthesize(text, output_path)
+
+        pipeline, _ = stub_collage_pipeline(SlowTTSEngine())
+
+        async def run():
+            async with TTSServer(pipeline, max_tts_concurrency=3, max_workers=2) as server:
+                return await asyncio.gather(*[
+                    server.submit(f"문장 {i}", [], tmp_path / f"{i}.wav") for i in range(6)
+                ])
+
+        results = asyncio.run(run())
+
+        assert [r["output_file"] for r in results] == [str(tmp_path / f"{i}.wav") for i in range(6)]
+        assert all(r["processed_text"].startswith("문장") for r in results)
+        assert 1 < state["peak"] <= 3
+
+    def test_request_error(self, tmp_path, stub_collage_pipeline):
+        """실패한 요청의 예외가 호출자에게 전달되는지 테스트"""
+        import asyncio
+        from core.tts.server import TTSServer
+
+        def failing_collage():
+            raise ValueError("유사한 세그먼트를 찾을 수 없습니다")
+
+        pipeline, _ = stub_collage_pipeline(MockTTSEngine(), on_collage=failing_collage)
+
+        async def run():
+            async with TTSServer(pipeline) as server:
+                await server.submit("안녕하세요", [], tmp_path / "out.wav")
+
+        with pytest.raises(ValueError):
+            asyncio.run(run())